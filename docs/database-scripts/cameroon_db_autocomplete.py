@@ -0,0 +1,252 @@
+"""Precomputed top-k prefix completions for type-ahead.
+
+For every normalized prefix (up to MAX_PREFIX_LENGTH characters) of the
+French and local-language text of each language, the builder stores the
+best TOP_K distinct completions, ranked by difficulty, then category
+priority (the curated order of the categories table), then length. A
+keystroke is then one primary-key probe on completions.
+"""
+import argparse
+import sys
+
+from cameroon_db_utils import connect, ensure_column, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+TOP_K = 8
+MAX_PREFIX_LENGTH = 16
+DIFFICULTY_ORDER = {'beginner': 0, 'intermediate': 1, 'advanced': 2}
+SIDES = (('french', 'french_text', 'french_norm'), ('local', 'translation', 'translation_norm'))
+
+
+def create_completion_tables(cursor):
+    ensure_column(cursor, 'translations', 'french_norm', 'TEXT')
+    ensure_column(cursor, 'translations', 'translation_norm', 'TEXT')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS completions (
+        side TEXT CHECK(side IN ('french', 'local')) NOT NULL,
+        language_id VARCHAR(10) NOT NULL,
+        prefix TEXT NOT NULL,
+        rank INTEGER NOT NULL,
+        translation_id INTEGER NOT NULL,
+        PRIMARY KEY (side, language_id, prefix, rank),
+        FOREIGN KEY (translation_id) REFERENCES translations(translation_id)
+    ) WITHOUT ROWID
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_french_norm ON translations(language_id, french_norm)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_translation_norm ON translations(language_id, translation_norm)')
+
+
+def top_completions(items, k=TOP_K, max_length=MAX_PREFIX_LENGTH):
+    """{prefix: [translation_id, ...]} from (score, normalized, translation_id) items.
+
+    Items are visited best first, so the first k distinct texts that reach a
+    prefix are its top k.
+    """
+    buckets = {}
+    for _, normalized, translation_id in sorted(items):
+        for length in range(1, min(len(normalized), max_length) + 1):
+            ids, texts = buckets.setdefault(normalized[:length], ([], set()))
+            if len(ids) < k and normalized not in texts:
+                ids.append(translation_id)
+                texts.add(normalized)
+    return {prefix: ids for prefix, (ids, _) in buckets.items()}
+
+
+def category_priorities(cursor):
+    """{category_id: position in the curated order of the categories table}"""
+    return {category_id: position for position, (category_id,) in enumerate(
+        cursor.execute('SELECT category_id FROM categories ORDER BY rowid'))}
+
+
+def completion_score(text, translation_id, category_id, difficulty, category_priority):
+    return (DIFFICULTY_ORDER.get(difficulty, len(DIFFICULTY_ORDER)),
+            category_priority.get(category_id, len(category_priority)),
+            len(text), text, translation_id)
+
+
+def best_distinct(items, k=TOP_K):
+    """translation_ids of the k best (score, normalized, translation_id) items with distinct texts"""
+    ids, texts = [], set()
+    for _, normalized, translation_id in sorted(items):
+        if normalized not in texts:
+            ids.append(translation_id)
+            texts.add(normalized)
+            if len(ids) == k:
+                break
+    return ids
+
+
+def build_completions(cursor, k=TOP_K, max_length=MAX_PREFIX_LENGTH, language_ids=None):
+    create_completion_tables(cursor)
+
+    category_priority = category_priorities(cursor)
+    if language_ids is None:
+        language_ids = [row[0] for row in cursor.execute(
+            'SELECT DISTINCT language_id FROM translations ORDER BY language_id')]
+
+    for language_id in language_ids:
+        cursor.execute('''
+        SELECT translation_id, french_text, translation, category_id, difficulty_level
+        FROM translations WHERE language_id = ?
+        ''', (language_id,))
+        rows = cursor.fetchall()
+        normalized = [(translation_id, normalize_text(french), normalize_text(translation))
+                      for translation_id, french, translation, _, _ in rows]
+        cursor.executemany('''
+        UPDATE translations SET french_norm = ?, translation_norm = ? WHERE translation_id = ?
+        ''', [(french, translation, translation_id) for translation_id, french, translation in normalized])
+
+        cursor.execute('DELETE FROM completions WHERE language_id = ?', (language_id,))
+        for side_index, (side, _, _) in enumerate(SIDES):
+            items = []
+            for (translation_id, _, _, category_id, difficulty), norms in zip(rows, normalized):
+                text = norms[side_index + 1]
+                if not text:
+                    continue
+                score = completion_score(text, translation_id, category_id, difficulty, category_priority)
+                items.append((score, text, translation_id))
+            cursor.executemany('''
+            INSERT INTO completions (side, language_id, prefix, rank, translation_id)
+            VALUES (?, ?, ?, ?, ?)
+            ''', ((side, language_id, prefix, rank, translation_id)
+                  for prefix, ids in top_completions(items, k, max_length).items()
+                  for rank, translation_id in enumerate(ids)))
+
+
+def update_completions(cursor, translation_ids, k=TOP_K, max_length=MAX_PREFIX_LENGTH):
+    """Bring the normalized text and completions of inserted or updated rows up to date.
+
+    Only the prefixes of the rows' old and new texts are touched. The new
+    texts are merged into each prefix's stored top k; a prefix whose list
+    held one of the updated rows (its score may have dropped) is recomputed
+    from its range of the normalized-text index instead. Rows whose norms
+    are still NULL count as new. Returns the number of prefixes rewritten.
+    """
+    create_completion_tables(cursor)
+    category_priority = category_priorities(cursor)
+    translation_ids = sorted(set(translation_ids))
+    cursor.execute(f'''
+    SELECT translation_id, language_id, french_text, translation, french_norm, translation_norm,
+           category_id, difficulty_level
+    FROM translations WHERE translation_id IN ({','.join('?' * len(translation_ids))})
+    ''', translation_ids)
+    rows = cursor.fetchall()
+    cursor.executemany('''
+    UPDATE translations SET french_norm = ?, translation_norm = ? WHERE translation_id = ?
+    ''', [(normalize_text(french), normalize_text(translation), translation_id)
+          for translation_id, _, french, translation, *_ in rows])
+
+    # {(side, language_id, prefix): new candidates}, covering old and new texts
+    affected, updated = {}, set()
+    for translation_id, language_id, french, translation, *old, category_id, difficulty in rows:
+        if old[0] is not None:
+            updated.add(translation_id)
+        for side_index, (side, _, _) in enumerate(SIDES):
+            new = normalize_text((french, translation)[side_index])
+            for text in (old[side_index], new):
+                for length in range(1, min(len(text or ''), max_length) + 1):
+                    affected.setdefault((side, language_id, text[:length]), [])
+            if new:
+                score = completion_score(new, translation_id, category_id, difficulty, category_priority)
+                for length in range(1, min(len(new), max_length) + 1):
+                    affected[side, language_id, new[:length]].append((score, new, translation_id))
+
+    rewrites = []
+    for (side, language_id, prefix), candidates in affected.items():
+        norm_column = next(columns[2] for columns in SIDES if columns[0] == side)
+        stored = cursor.execute(f'''
+        SELECT t.translation_id, t.{norm_column}, t.category_id, t.difficulty_level
+        FROM completions c
+        JOIN translations t ON t.translation_id = c.translation_id
+        WHERE c.side = ? AND c.language_id = ? AND c.prefix = ?
+        ORDER BY c.rank
+        ''', (side, language_id, prefix)).fetchall()
+        current = [row[0] for row in stored]
+        if updated.intersection(current):
+            stored = cursor.execute(f'''
+            SELECT translation_id, {norm_column}, category_id, difficulty_level
+            FROM translations
+            WHERE language_id = ? AND {norm_column} >= ? AND {norm_column} < ?
+            ''', (language_id, prefix, prefix + '\uffff')).fetchall()
+            candidates = []
+        items = candidates + [
+            (completion_score(text, translation_id, category_id, difficulty, category_priority), text, translation_id)
+            for translation_id, text, category_id, difficulty in stored if text]
+        ids = best_distinct(items, k)
+        if ids != current:
+            rewrites.append((side, language_id, prefix, ids))
+
+    cursor.executemany('DELETE FROM completions WHERE side = ? AND language_id = ? AND prefix = ?',
+                       [(side, language_id, prefix) for side, language_id, prefix, _ in rewrites])
+    cursor.executemany('''
+    INSERT INTO completions (side, language_id, prefix, rank, translation_id)
+    VALUES (?, ?, ?, ?, ?)
+    ''', [(side, language_id, prefix, rank, translation_id)
+          for side, language_id, prefix, ids in rewrites for rank, translation_id in enumerate(ids)])
+    return len(rewrites)
+
+
+def complete(conn, text, language_id, side='french', limit=TOP_K):
+    """Ranked completions for what has been typed so far.
+
+    Prefixes longer than the precomputed ones fall back to a range scan of
+    the normalized-text index, which is already narrow at that length, and
+    rank its rows with the builder's completion_score().
+    """
+    prefix = normalize_text(text)
+    if not prefix:
+        return []
+    _, text_column, norm_column = next(columns for columns in SIDES if columns[0] == side)
+
+    cursor = conn.cursor()
+    if len(prefix) <= MAX_PREFIX_LENGTH:
+        cursor.execute(f'''
+        SELECT t.translation_id, t.{text_column}, t.french_text, t.translation, t.pronunciation
+        FROM completions c
+        JOIN translations t ON t.translation_id = c.translation_id
+        WHERE c.side = ? AND c.language_id = ? AND c.prefix = ?
+        ORDER BY c.rank
+        LIMIT ?
+        ''', (side, language_id, prefix, limit))
+        rows = cursor.fetchall()
+    else:
+        cursor.execute(f'''
+        SELECT translation_id, {text_column}, french_text, translation, pronunciation,
+               {norm_column}, category_id, difficulty_level
+        FROM translations
+        WHERE language_id = ? AND {norm_column} >= ? AND {norm_column} < ?
+        ''', (language_id, prefix, prefix + '\uffff'))
+        matches = {row[0]: row for row in cursor.fetchall()}
+        category_priority = category_priorities(cursor)
+        ids = best_distinct([
+            (completion_score(norm, translation_id, category_id, difficulty, category_priority), norm, translation_id)
+            for translation_id, *_, norm, category_id, difficulty in matches.values()], limit)
+        rows = [matches[translation_id][:5] for translation_id in ids]
+
+    return [{
+        'translation_id': translation_id,
+        'completion': completion,
+        'french_text': french_text,
+        'translation': translation,
+        'pronunciation': pronunciation,
+    } for translation_id, completion, french_text, translation, pronunciation in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Type-ahead completions from the prefix table')
+    parser.add_argument('language_id')
+    parser.add_argument('text')
+    parser.add_argument('--side', choices=[side for side, _, _ in SIDES], default='french')
+    parser.add_argument('--limit', type=int, default=TOP_K)
+    parser.add_argument('--database', default=DATABASE_FILE)
+    args = parser.parse_args(argv)
+
+    conn = connect(args.database)
+    for match in complete(conn, args.text, args.language_id, args.side, args.limit):
+        print(f"  {match['completion']}  ({match['french_text']} -> {match['translation']})")
+    conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
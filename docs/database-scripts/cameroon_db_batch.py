@@ -0,0 +1,128 @@
+"""Batch translation of whole files of French phrases.
+
+Phrases are streamed into a temporary table in chunks and each chunk is
+resolved against translations with one set-based query: an exact match on
+idx_translations_language_french, otherwise a match on the normalized
+text (idx_translations_french_norm). Results stream out as TSV or JSON
+Lines in input order, tagged exact, normalized or missing.
+"""
+import argparse
+import json
+import sys
+
+from cameroon_db_utils import connect, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+CHUNK_SIZE = 50000
+TSV_COLUMNS = ('line', 'phrase', 'match', 'translation', 'pronunciation', 'translation_id')
+
+
+def create_batch_table(cursor):
+    cursor.execute('''
+    CREATE TEMP TABLE IF NOT EXISTS batch_input (
+        line INTEGER PRIMARY KEY,
+        phrase TEXT NOT NULL,
+        phrase_norm TEXT
+    )
+    ''')
+
+
+def read_phrases(stream):
+    """(line number, phrase) for every non-blank line"""
+    for line_number, line in enumerate(stream, 1):
+        phrase = line.strip()
+        if phrase:
+            yield line_number, phrase
+
+
+def resolve_chunk(cursor, chunk, language_id):
+    """Load one chunk into batch_input and resolve it with a single query"""
+    cursor.execute('DELETE FROM batch_input')
+    cursor.executemany('INSERT INTO batch_input (line, phrase, phrase_norm) VALUES (?, ?, ?)', chunk)
+    cursor.execute('''
+    SELECT m.line, m.phrase,
+           CASE WHEN m.exact_id IS NOT NULL THEN 'exact'
+                WHEN m.match_id IS NOT NULL THEN 'normalized'
+                ELSE 'missing' END,
+           t.translation, t.pronunciation, t.translation_id
+    FROM (
+        SELECT e.line, e.phrase, e.exact_id,
+               COALESCE(e.exact_id,
+                        (SELECT MIN(translation_id) FROM translations
+                         WHERE language_id = :language AND french_norm = e.phrase_norm)) AS match_id
+        FROM (
+            SELECT b.line, b.phrase, b.phrase_norm,
+                   (SELECT MIN(translation_id) FROM translations
+                    WHERE language_id = :language AND french_text = b.phrase) AS exact_id
+            FROM batch_input b
+        ) e
+    ) m
+    LEFT JOIN translations t ON t.translation_id = m.match_id
+    ORDER BY m.line
+    ''', {'language': language_id})
+    return cursor.fetchall()
+
+
+def batch_translate(conn, phrases, language_id, chunk_size=CHUNK_SIZE):
+    """Yield (line, phrase, match, translation, pronunciation, translation_id) in input order"""
+    cursor = conn.cursor()
+    columns = [row[1] for row in cursor.execute('PRAGMA table_info(translations)')]
+    if 'french_norm' not in columns:
+        raise ValueError('translations.french_norm is missing; rebuild the database with create_cameroon_db.py')
+    create_batch_table(cursor)
+
+    chunk = []
+    for line_number, phrase in phrases:
+        chunk.append((line_number, phrase, normalize_text(phrase)))
+        if len(chunk) == chunk_size:
+            yield from resolve_chunk(cursor, chunk, language_id)
+            chunk = []
+    if chunk:
+        yield from resolve_chunk(cursor, chunk, language_id)
+
+
+def write_tsv(results, out):
+    out.write('\t'.join(TSV_COLUMNS) + '\n')
+    for row in results:
+        out.write('\t'.join('' if value is None else str(value).replace('\t', ' ') for value in row) + '\n')
+        yield row
+
+
+def write_jsonl(results, out):
+    for row in results:
+        out.write(json.dumps(dict(zip(TSV_COLUMNS, row)), ensure_ascii=False) + '\n')
+        yield row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Translate a file of French phrases in one pass')
+    parser.add_argument('language_id', help='target language, e.g. EWO')
+    parser.add_argument('input', nargs='?', default='-', help='one phrase per line ("-" for stdin)')
+    parser.add_argument('--format', choices=('tsv', 'jsonl'), default='tsv')
+    parser.add_argument('--output', default='-')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--database', default=DATABASE_FILE)
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    conn = connect(args.database)
+
+    writer = write_tsv if args.format == 'tsv' else write_jsonl
+    counts = {'exact': 0, 'normalized': 0, 'missing': 0}
+    results = batch_translate(conn, read_phrases(source), args.language_id, args.chunk_size)
+    for row in writer(results, out):
+        counts[row[2]] += 1
+
+    conn.close()
+    if source is not sys.stdin:
+        source.close()
+    if out is not sys.stdout:
+        out.close()
+    print(f"🔁 Batch translation: {counts['exact']} exact, {counts['normalized']} normalized, "
+          f"{counts['missing']} missing", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""Memory-mappable binary dictionary for instant-start lookups.
+
+The file is a single little-endian image with five sections:
+
+    header       magic, version, counts and the offset of every section
+    code tables  language, category and difficulty codes, 16 bytes each
+    entries      fixed-width records pointing into the string pool
+    indexes      French->local and local->French arrays of (key, entry),
+                 sorted by the UTF-8 bytes of '<language_id>\\0<normalized text>'
+    string pool  every distinct string once, UTF-8 encoded
+
+BinaryDictionary maps the file and binary-searches the sorted key arrays
+in place, so a lookup works as soon as the file is mapped and only the
+matching entries are ever decoded.
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+
+from cameroon_db_utils import connect, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+BINARY_FILE = 'cameroon_languages.dict'
+
+MAGIC = b'CMRDICT\0'
+VERSION = 2
+# magic, version, entries, languages, categories, difficulties,
+# then offsets of code tables, entries, french index, local index, string pool
+HEADER = struct.Struct('<8sIIHHH2xQQQQQ')
+CODE = struct.Struct('<16s')
+# translation_id, (offset, length) of french/translation/pronunciation, codes
+ENTRY = struct.Struct('<I6IBBBx')
+INDEX = struct.Struct('<III')  # key offset, key length, entry number
+NO_CODE = 0xFF
+
+
+class StringPool:
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = {}
+
+    def add(self, text):
+        """(offset, length) of text in the pool, storing each string once"""
+        if text is None:
+            return 0, 0xFFFFFFFF
+        encoded = text.encode('utf-8')
+        offset = self.offsets.get(encoded)
+        if offset is None:
+            offset = self.offsets[encoded] = len(self.data)
+            self.data += encoded
+        return offset, len(encoded)
+
+
+def lookup_key(language_id, text):
+    return f'{language_id}\0{normalize_text(text)}'.encode('utf-8')
+
+
+def export_binary_dictionary(conn, path=BINARY_FILE):
+    """Write the translations table as a sorted binary image; returns the entry count"""
+    cursor = conn.cursor()
+    cursor.execute('''
+    SELECT translation_id, french_text, translation, pronunciation,
+           language_id, category_id, difficulty_level
+    FROM translations
+    ORDER BY language_id, translation_id
+    ''')
+    rows = cursor.fetchall()
+
+    languages = sorted({row[4] for row in rows if row[4] is not None})
+    categories = sorted({row[5] for row in rows if row[5] is not None})
+    difficulties = ['beginner', 'intermediate', 'advanced']
+    code_of = [{code: i for i, code in enumerate(table)}
+               for table in (languages, categories, difficulties)]
+
+    pool = StringPool()
+    entries = bytearray()
+    french_keys, local_keys = [], []
+    for number, (translation_id, french, translation, pronunciation,
+                 language_id, category_id, difficulty) in enumerate(rows):
+        entries += ENTRY.pack(
+            translation_id,
+            *pool.add(french), *pool.add(translation), *pool.add(pronunciation),
+            code_of[0].get(language_id, NO_CODE),
+            code_of[1].get(category_id, NO_CODE),
+            code_of[2].get(difficulty, NO_CODE),
+        )
+        french_keys.append((lookup_key(language_id, french), number))
+        local_keys.append((lookup_key(language_id, translation), number))
+
+    indexes = []
+    for keys in (french_keys, local_keys):
+        keys.sort()
+        index = bytearray()
+        for key, number in keys:
+            index += INDEX.pack(*pool.add(key.decode('utf-8')), number)
+        indexes.append(index)
+
+    codes = b''.join(CODE.pack(code.encode('utf-8'))
+                     for code in languages + categories + difficulties)
+    codes_offset = HEADER.size
+    entries_offset = codes_offset + len(codes)
+    french_offset = entries_offset + len(entries)
+    local_offset = french_offset + len(indexes[0])
+    pool_offset = local_offset + len(indexes[1])
+
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(rows), len(languages), len(categories),
+                            len(difficulties), codes_offset, entries_offset,
+                            french_offset, local_offset, pool_offset))
+        for section in (codes, entries, indexes[0], indexes[1], pool.data):
+            f.write(section)
+    os.replace(temp_path, path)
+    return len(rows)
+
+
+class BinaryDictionary:
+    """Read-only view over a mapped dictionary file"""
+
+    def __init__(self, path=BINARY_FILE):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.entry_count, language_count, category_count,
+         difficulty_count, codes_offset, self._entries, self._french_index,
+         self._local_index, self._pool) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f'{path} is not a version {VERSION} dictionary file')
+
+        codes = [CODE.unpack_from(self._map, codes_offset + i * CODE.size)[0].rstrip(b'\0').decode('utf-8')
+                 for i in range(language_count + category_count + difficulty_count)]
+        self.languages = codes[:language_count]
+        self.categories = codes[language_count:language_count + category_count]
+        self.difficulties = codes[language_count + category_count:]
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _string(self, offset, length):
+        if length == 0xFFFFFFFF:
+            return None
+        start = self._pool + offset
+        return self._map[start:start + length].decode('utf-8')
+
+    def _key(self, index_offset, position):
+        key_offset, key_length, _ = INDEX.unpack_from(self._map, index_offset + position * INDEX.size)
+        start = self._pool + key_offset
+        return self._map[start:start + key_length]
+
+    def entry(self, number):
+        (translation_id, french_offset, french_length, translation_offset, translation_length,
+         pronunciation_offset, pronunciation_length, language, category, difficulty
+         ) = ENTRY.unpack_from(self._map, self._entries + number * ENTRY.size)
+        return {
+            'translation_id': translation_id,
+            'language_id': self.languages[language] if language != NO_CODE else None,
+            'french_text': self._string(french_offset, french_length),
+            'translation': self._string(translation_offset, translation_length),
+            'pronunciation': self._string(pronunciation_offset, pronunciation_length),
+            'category_id': self.categories[category] if category != NO_CODE else None,
+            'difficulty_level': self.difficulties[difficulty] if difficulty != NO_CODE else None,
+        }
+
+    def _search(self, index_offset, key):
+        """Entries whose key equals key: lower bound, then scan the equal run"""
+        low, high = 0, self.entry_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(index_offset, middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        matches = []
+        while low < self.entry_count and self._key(index_offset, low) == key:
+            number = INDEX.unpack_from(self._map, index_offset + low * INDEX.size)[2]
+            matches.append(self.entry(number))
+            low += 1
+        return matches
+
+    def lookup_french(self, language_id, french_text):
+        """Translations of a French phrase into language_id"""
+        return self._search(self._french_index, lookup_key(language_id, french_text))
+
+    def lookup_local(self, language_id, translation):
+        """French meanings of a word or phrase in language_id"""
+        return self._search(self._local_index, lookup_key(language_id, translation))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export or query the binary dictionary')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--output', default=BINARY_FILE)
+    parser.add_argument('--lookup', nargs=2, metavar=('LANGUAGE_ID', 'TEXT'),
+                        help='look TEXT up in both directions instead of exporting')
+    args = parser.parse_args(argv)
+
+    if args.lookup:
+        language_id, text = args.lookup
+        with BinaryDictionary(args.output) as dictionary:
+            for entry in dictionary.lookup_french(language_id, text) + dictionary.lookup_local(language_id, text):
+                print(f"  {entry['french_text']} -> {entry['translation']} ({entry['pronunciation']})")
+        return 0
+
+    conn = connect(args.database)
+    count = export_binary_dictionary(conn, args.output)
+    conn.close()
+    print(f"🗂️  Binary dictionary: {count} entries written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
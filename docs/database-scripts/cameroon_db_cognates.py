@@ -0,0 +1,243 @@
+"""Cross-language cognate and loanword clusters.
+
+Comparing every translation with every other is quadratic, so candidates
+are blocked first and only the survivors are scored:
+
+1. every distinct (language_id, normalized translation) is a form, and its
+   character bigrams (with ^/$ boundary marks) are its shingles;
+2. MinHash: NUM_PERM universal hashes of the shingles, minimum per form,
+   computed for whole chunks of forms at once with minimum.reduceat;
+3. LSH: the signature is cut into BANDS bands of ROWS values, and forms of
+   different languages that agree on a whole band become candidate pairs
+   (bands shared by more than MAX_BUCKET forms are too common to be
+   evidence and are skipped);
+4. each band's candidates are scored with Levenshtein distance, computed
+   for a whole batch of pairs per dynamic-programming step on padded
+   code-point arrays (forms are cut to MAX_FORM_LENGTH characters), and
+   only the pairs above the threshold are kept;
+5. pairs with similarity 1 - distance / longer length >= THRESHOLD whose
+   forms also share a French meaning are joined with union-find (without
+   the meaning test, short forms chain unrelated words together), and
+   clusters spanning two or more languages are written to
+   cognate_clusters, one row per translation.
+
+Requires NumPy.
+"""
+import argparse
+import sys
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('cameroon_db_cognates requires NumPy (pip install numpy)') from None
+
+from cameroon_db_utils import connect, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+NUM_PERM = 32
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+MAX_BUCKET = 64
+MAX_FORM_LENGTH = 24
+THRESHOLD = 0.75
+SEED = 42
+CHUNK_SIZE = 50000
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+def create_cognate_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS cognate_clusters (
+        cluster_id INTEGER NOT NULL,
+        translation_id INTEGER NOT NULL,
+        language_id VARCHAR(10) NOT NULL,
+        form TEXT NOT NULL,
+        PRIMARY KEY (cluster_id, translation_id),
+        FOREIGN KEY (translation_id) REFERENCES translations(translation_id)
+    ) WITHOUT ROWID
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_cognate_clusters_translation ON cognate_clusters(translation_id)')
+
+
+def shingles(form):
+    padded = f'^{form}$'
+    return {zlib.crc32(padded[i:i + 2].encode('utf-8')) for i in range(len(padded) - 1)}
+
+
+def minhash_signatures(forms, num_perm=NUM_PERM, seed=SEED, chunk_size=CHUNK_SIZE):
+    """(len(forms), num_perm) uint32 MinHash signatures of the forms' bigram sets"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+    b = rng.integers(0, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+    signatures = np.empty((len(forms), num_perm), dtype=np.uint32)
+    for start in range(0, len(forms), chunk_size):
+        sets = [shingles(form) for form in forms[start:start + chunk_size]]
+        lengths = np.array([len(s) for s in sets])
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        values = np.fromiter((h for s in sets for h in s), dtype=np.uint64, count=int(lengths.sum()))
+        hashed = (a * (values % MERSENNE_PRIME) + b) % MERSENNE_PRIME
+        signatures[start:start + len(sets)] = np.minimum.reduceat(hashed, offsets, axis=1).T
+    return signatures
+
+
+def band_pairs(signatures, band, rows=ROWS, max_bucket=MAX_BUCKET):
+    """(i, j) pairs, i < j, of forms whose signatures agree on one band"""
+    keys = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows]).view(
+        np.dtype((np.void, rows * signatures.itemsize))).ravel()
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+    sizes = np.diff(np.append(starts, len(keys)))
+    found = []
+    # Buckets of one size form a matrix, so each size is a single triu gather
+    for size in np.unique(sizes[(sizes > 1) & (sizes <= max_bucket)]):
+        members = order[starts[sizes == size][:, None] + np.arange(size)]
+        i, j = np.triu_indices(size, 1)
+        found.append(np.stack((members[:, i].ravel(), members[:, j].ravel()), axis=1))
+    if not found:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(found).astype(np.int64)
+    return np.sort(pairs, axis=1)
+
+
+def encode_forms(forms, length=MAX_FORM_LENGTH):
+    """Code points padded with 0 to length, and the (cut) length of each form"""
+    codes = np.zeros((len(forms), length), dtype=np.uint32)
+    lengths = np.empty(len(forms), dtype=np.int64)
+    for row, form in enumerate(forms):
+        form = form[:length]
+        codes[row, :len(form)] = [ord(c) for c in form]
+        lengths[row] = len(form)
+    return codes, lengths
+
+
+def levenshtein(a, a_lengths, b, b_lengths):
+    """Edit distance of every pair of rows of a and b, one DP row per step.
+
+    Within a row, current[j] = min(best[j - 1], current[j - 1] + 1) is a
+    running minimum of current[j] - j, so it is one minimum.accumulate.
+    """
+    count, length = a.shape
+    columns = np.arange(length + 1, dtype=np.int32)
+    distances = b_lengths.copy()
+    previous = np.tile(columns, (count, 1))
+    for i in range(1, length + 1):
+        best = np.minimum(previous[:, :-1] + (a[:, i - 1:i] != b), previous[:, 1:] + 1)
+        shifted = np.concatenate((np.full((count, 1), i, dtype=np.int32), best - columns[1:]), axis=1)
+        current = np.minimum.accumulate(shifted, axis=1) + columns
+        done = np.flatnonzero(a_lengths == i)
+        distances[done] = current[done, b_lengths[done]]
+        previous = current
+    return distances
+
+
+def score_pairs(pairs, codes, lengths, batch_size=CHUNK_SIZE):
+    """Similarity 1 - distance / longer length of each candidate pair.
+
+    Pairs are scored in order of length, so each batch only runs as many
+    DP steps as its longest form needs.
+    """
+    longer = np.maximum(lengths[pairs[:, 0]], lengths[pairs[:, 1]])
+    order = np.argsort(longer, kind='stable')
+    scores = np.empty(len(pairs), dtype=np.float32)
+    for start in range(0, len(pairs), batch_size):
+        batch = order[start:start + batch_size]
+        i, j = pairs[batch, 0], pairs[batch, 1]
+        width = max(int(longer[batch].max()), 1)
+        distances = levenshtein(codes[i, :width], lengths[i], codes[j, :width], lengths[j])
+        scores[batch] = 1 - distances / np.maximum(longer[batch], 1)
+    return scores
+
+
+def cluster(count, pairs):
+    """Component label of each of count items, joined along pairs (union-find)"""
+    parent = list(range(count))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j in pairs.tolist():
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    return [find(x) for x in range(count)]
+
+
+def build_cognate_clusters(cursor, threshold=THRESHOLD, same_meaning=True):
+    """Recompute cognate_clusters; returns (clusters, translations clustered)"""
+    create_cognate_table(cursor)
+    cursor.execute('''
+    SELECT translation_id, language_id, translation, french_text
+    FROM translations ORDER BY language_id, translation_id
+    ''')
+    members, form_index, forms, form_languages, meanings = [], {}, [], [], []
+    for translation_id, language_id, translation, french_text in cursor.fetchall():
+        form = normalize_text(translation)
+        if not form:
+            continue
+        index = form_index.get((language_id, form))
+        if index is None:
+            index = form_index[(language_id, form)] = len(forms)
+            forms.append(form)
+            form_languages.append(language_id)
+            meanings.append(set())
+        meanings[index].add(normalize_text(french_text))
+        members.append((index, translation_id))
+
+    cursor.execute('DELETE FROM cognate_clusters')
+    if not forms:
+        return 0, 0
+    language_codes = np.unique(np.array(form_languages), return_inverse=True)[1]
+    signatures = minhash_signatures(forms)
+    codes, lengths = encode_forms(forms)
+    # Candidates are scored band by band so only the linked pairs are kept
+    linked = []
+    for band in range(BANDS):
+        pairs = band_pairs(signatures, band)
+        pairs = pairs[language_codes[pairs[:, 0]] != language_codes[pairs[:, 1]]]
+        # Edit distance is at least the length difference
+        shorter = np.minimum(lengths[pairs[:, 0]], lengths[pairs[:, 1]])
+        pairs = pairs[shorter >= threshold * np.maximum(lengths[pairs[:, 0]], lengths[pairs[:, 1]])]
+        linked.append(pairs[score_pairs(pairs, codes, lengths) >= threshold])
+    pairs = np.unique(np.concatenate(linked), axis=0)
+    if same_meaning:
+        pairs = pairs[[not meanings[i].isdisjoint(meanings[j]) for i, j in pairs.tolist()]].reshape(-1, 2)
+    roots = cluster(len(forms), pairs)
+
+    languages_per_root = {}
+    for index, root in enumerate(roots):
+        languages_per_root.setdefault(root, set()).add(form_languages[index])
+    cluster_ids = {root: number for number, root in enumerate(
+        sorted(root for root, languages in languages_per_root.items() if len(languages) > 1), 1)}
+    rows = [(cluster_ids[roots[index]], translation_id, form_languages[index], forms[index])
+            for index, translation_id in members if roots[index] in cluster_ids]
+    cursor.executemany('''
+    INSERT INTO cognate_clusters (cluster_id, translation_id, language_id, form)
+    VALUES (?, ?, ?, ?)
+    ''', rows)
+    return len(cluster_ids), len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cluster similar translations across languages')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='minimum 1 - edit distance / length for two forms to be linked')
+    parser.add_argument('--any-meaning', action='store_true',
+                        help='link similar forms even when they share no French meaning (false friends too)')
+    args = parser.parse_args(argv)
+
+    conn = connect(args.database)
+    clusters, translations = build_cognate_clusters(conn.cursor(), args.threshold, not args.any_meaning)
+    conn.commit()
+    conn.close()
+    print(f"🔗 Cognate clusters: {clusters} clusters over {translations} translations")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
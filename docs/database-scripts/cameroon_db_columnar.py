@@ -0,0 +1,205 @@
+"""Columnar export of the database for analysis with NumPy.
+
+Every table in TABLES is written to <directory>/<table>.npz
+(np.savez_compressed), one or more arrays per column:
+
+    <column>.codes, <column>.dictionary   dictionary-encoded text: small
+                                          signed integer codes (-1 for NULL)
+                                          into an array of the distinct values
+    <column>.data, <column>.offsets       other text: the UTF-8 bytes of every
+                                          value and the n + 1 offsets into them
+    <column>                              integers, reals and timestamps
+                                          (int64, float64, datetime64[ms])
+    <column>.null                         NULL mask, when a column has NULLs
+    __schema__                            JSON: row count and kind of each column
+
+language_id, category_id and the difficulty levels share one dictionary
+in every table (the languages and categories tables in id order, the
+levels in teaching order), so codes can be compared and joined across
+tables. Other text columns are dictionary-encoded when they have few
+distinct values. No array needs pickle to load.
+
+    words = ColumnarTable('cameroon_columnar/translations.npz')
+    rated = words.codes('difficulty_level') >= 0
+    coverage = np.zeros((len(words.dictionary('language_id')), len(LEVELS)), dtype=np.int64)
+    np.add.at(coverage, (words.codes('language_id')[rated], words.codes('difficulty_level')[rated]), 1)
+
+Requires NumPy.
+"""
+import argparse
+import json
+import os
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('cameroon_db_columnar requires NumPy (pip install numpy)') from None
+
+from cameroon_db_utils import connect
+
+DATABASE_FILE = 'cameroon_languages.db'
+EXPORT_DIR = 'cameroon_columnar'
+TABLES = ('languages', 'categories', 'translations', 'lessons')
+LEVELS = ('beginner', 'intermediate', 'advanced')
+# Text columns with at most this share of distinct values are dictionary-encoded
+DICTIONARY_RATIO = 0.5
+CHUNK_SIZE = 100000
+
+
+def shared_dictionaries(conn):
+    """{column: values} of the dictionaries shared by every table"""
+    return {
+        'language_id': [row[0] for row in conn.execute('SELECT language_id FROM languages ORDER BY language_id')],
+        'category_id': [row[0] for row in conn.execute('SELECT category_id FROM categories ORDER BY category_id')],
+        'difficulty_level': list(LEVELS),
+        'level': list(LEVELS),
+    }
+
+
+def code_dtype(size):
+    """Smallest signed integer type for codes 0..size - 1 and -1"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if size <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def column_kind(name, declared, values, shared):
+    if name in shared:
+        return 'dictionary'
+    declared = (declared or '').upper()
+    if 'INT' in declared:
+        return 'integer'
+    if any(word in declared for word in ('REAL', 'FLOA', 'DOUB')):
+        return 'real'
+    if 'TIMESTAMP' in declared or name.endswith('_at'):
+        return 'timestamp'
+    distinct = len(set(values))
+    return 'dictionary' if distinct <= max(1, len(values) * DICTIONARY_RATIO) else 'text'
+
+
+def encode_column(name, kind, values, dictionary=None):
+    """{array name: array} for one column"""
+    null = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    arrays = {f'{name}.null': null} if null.any() else {}
+    if kind == 'dictionary':
+        # Values missing from a shared dictionary are appended, keeping its codes
+        present = {value for value in values if value is not None}
+        dictionary = list(dictionary or []) + sorted(present - set(dictionary or []))
+        index = {value: code for code, value in enumerate(dictionary)}
+        arrays[f'{name}.codes'] = np.fromiter((index.get(value, -1) for value in values),
+                                              dtype=code_dtype(len(dictionary)), count=len(values))
+        arrays[f'{name}.dictionary'] = np.array(dictionary, dtype=str)
+        arrays.pop(f'{name}.null', None)  # -1 already marks NULL
+    elif kind == 'text':
+        encoded = [value.encode('utf-8') if value is not None else b'' for value in values]
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(values)), out=offsets[1:])
+        arrays[f'{name}.data'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        arrays[f'{name}.offsets'] = offsets
+    elif kind == 'timestamp':
+        arrays[name] = np.array([value.replace(' ', 'T') if value else 'NaT' for value in values],
+                                dtype='datetime64[ms]')
+    elif kind == 'real':
+        arrays[name] = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    else:
+        arrays[name] = np.array([0 if value is None else value for value in values], dtype=np.int64)
+    return arrays
+
+
+def export_table(conn, table, path, shared, chunk_size=CHUNK_SIZE):
+    """Write one table's columns to path; returns its row count"""
+    declared = [(row[1], row[2]) for row in conn.execute(f'PRAGMA table_info({table})')]
+    names = [name for name, _ in declared]
+    columns = [[] for _ in names]
+    cursor = conn.execute(f"SELECT {', '.join(names)} FROM {table} ORDER BY rowid")
+    while True:
+        chunk = cursor.fetchmany(chunk_size)
+        if not chunk:
+            break
+        for column, values in zip(columns, zip(*chunk)):
+            column.extend(values)
+
+    arrays, schema = {}, {'table': table, 'rows': len(columns[0]), 'columns': {}}
+    for (name, declared_type), values in zip(declared, columns):
+        kind = column_kind(name, declared_type, values, shared)
+        schema['columns'][name] = kind
+        arrays.update(encode_column(name, kind, values, shared.get(name)))
+    arrays['__schema__'] = np.array(json.dumps(schema))
+
+    with open(f'{path}.tmp', 'wb') as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(f'{path}.tmp', path)
+    return schema['rows']
+
+
+def export_columnar(conn, directory=EXPORT_DIR, tables=TABLES):
+    """Write every table to directory/<table>.npz; returns {table: rows}"""
+    os.makedirs(directory, exist_ok=True)
+    shared = shared_dictionaries(conn)
+    return {table: export_table(conn, table, os.path.join(directory, f'{table}.npz'), shared)
+            for table in tables}
+
+
+class ColumnarTable:
+    """One exported table; each array is decompressed once, when first used"""
+
+    def __init__(self, path):
+        self.npz = np.load(path)
+        self.loaded = {}
+        schema = json.loads(str(self.array('__schema__')))
+        self.rows = schema['rows']
+        self.kinds = schema['columns']
+
+    def array(self, name):
+        if name not in self.loaded:
+            self.loaded[name] = self.npz[name]
+        return self.loaded[name]
+
+    def codes(self, column):
+        return self.array(f'{column}.codes')
+
+    def dictionary(self, column):
+        return self.array(f'{column}.dictionary')
+
+    def null(self, column):
+        """NULL mask of a column (all False when it has no NULLs)"""
+        if self.kinds[column] == 'dictionary':
+            return self.codes(column) < 0
+        if f'{column}.null' in self.npz:
+            return self.array(f'{column}.null')
+        return np.zeros(self.rows, dtype=bool)
+
+    def __getitem__(self, column):
+        """Decoded values: an array for codes and numbers, a list of str/None for text"""
+        kind = self.kinds[column]
+        if kind == 'dictionary':
+            # Code -1 (NULL) picks the '' appended at the end
+            return np.append(self.dictionary(column), '')[self.codes(column)]
+        if kind == 'text':
+            data = self.array(f'{column}.data').tobytes()
+            offsets = self.array(f'{column}.offsets').tolist()
+            null = self.null(column).tolist()
+            return [None if null[i] else data[offsets[i]:offsets[i + 1]].decode('utf-8')
+                    for i in range(self.rows)]
+        return self.array(column)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export tables as compressed NumPy columns')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--output', default=EXPORT_DIR, help='directory for the <table>.npz files')
+    parser.add_argument('--table', action='append', choices=TABLES, help='export only this table (repeatable)')
+    args = parser.parse_args(argv)
+
+    conn = connect(f'file:{args.database}?mode=ro', uri=True)
+    counts = export_columnar(conn, args.output, args.table or TABLES)
+    conn.close()
+    for table, rows in counts.items():
+        print(f"🧮 {table}: {rows} rows written to {os.path.join(args.output, table)}.npz")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,323 @@
+"""Community contributions applied to a live database.
+
+Contributions (new translations, corrected pronunciations, notes) are
+appended to contribution_queue, which is durable as soon as enqueue()
+returns. apply_pending() drains the queue in batched write transactions.
+The database is switched to WAL mode, so the query service keeps reading
+the last committed snapshot while a batch is written and never blocks.
+
+Each contribution is resolved against the rows that share its
+(language_id, french_text):
+
+- no such row: the translation is inserted;
+- a row with the same translation (compared normalized): a correction,
+  and the contribution's non-null fields overwrite that row's;
+- only rows with other translations: a conflict, settled by the policy:
+  'review' leaves it in the queue as a conflict, 'replace' overwrites
+  the oldest row's translation and pronunciation, 'variant' inserts it
+  next to the existing ones.
+
+An inserted row's translation_sources provenance is contribution:<id>,
+naming the queue entry it came from.
+
+The rows a batch inserts or updates get their derived data refreshed in
+the same transaction, so readers never see a translation without it:
+normalized text and phonetic key, the completions of their texts'
+prefixes and a quiz rank. Nothing is recomputed per language, so the
+write lock is held for about as long as the batch's own writes. Their
+quiz distractors are drawn when sampled until `rebuild-quiz` (or the next
+build) recomputes them out of band.
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+
+import cameroon_db_autocomplete
+import cameroon_db_merge
+import cameroon_db_phonetic
+import cameroon_db_quiz
+from cameroon_db_utils import connect, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+BATCH_SIZE = 500
+BUSY_TIMEOUT_S = 30.0
+POLICIES = ('review', 'replace', 'variant')
+DIFFICULTY_LEVELS = ('beginner', 'intermediate', 'advanced')
+CONTRIBUTION_FIELDS = ('french_text', 'language_id', 'translation', 'category_id',
+                       'pronunciation', 'usage_notes', 'difficulty_level')
+
+
+def open_database(path=DATABASE_FILE):
+    """Connection in WAL mode with explicit transactions.
+
+    isolation_level=None lets apply_batch() open its transaction with
+    BEGIN IMMEDIATE: the write lock is taken up front, so a second writer
+    waits on the busy timeout instead of failing on a lock upgrade.
+    """
+    conn = connect(path, timeout=BUSY_TIMEOUT_S, isolation_level=None)
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA foreign_keys = ON')
+    create_queue_table(conn.cursor())
+    cameroon_db_merge.create_provenance_table(conn.cursor())
+    return conn
+
+
+def create_queue_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS contribution_queue (
+        contribution_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        french_text TEXT NOT NULL,
+        language_id VARCHAR(10) NOT NULL,
+        translation TEXT NOT NULL,
+        category_id VARCHAR(10),
+        pronunciation TEXT,
+        usage_notes TEXT,
+        difficulty_level TEXT,
+        contributor TEXT,
+        submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        status TEXT CHECK(status IN ('pending', 'inserted', 'updated', 'unchanged', 'conflict', 'rejected'))
+            NOT NULL DEFAULT 'pending',
+        translation_id INTEGER,
+        detail TEXT,
+        applied_at TIMESTAMP
+    )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_contribution_queue_status ON contribution_queue(status, contribution_id)')
+
+
+def read_contributions(stream):
+    """Contribution dicts from JSON Lines, skipping blank lines"""
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def enqueue(conn, contributions, contributor=None):
+    """Append contributions to the queue in one transaction; returns how many"""
+    rows = [tuple(item.get(field) for field in CONTRIBUTION_FIELDS) + (item.get('contributor', contributor),)
+            for item in contributions]
+    with conn:
+        conn.execute('BEGIN IMMEDIATE')
+        conn.executemany(f'''
+        INSERT INTO contribution_queue ({', '.join(CONTRIBUTION_FIELDS)}, contributor)
+        VALUES ({', '.join('?' * (len(CONTRIBUTION_FIELDS) + 1))})
+        ''', rows)
+    return len(rows)
+
+
+def rejection(item, languages, categories):
+    """Why a contribution cannot be applied, or None"""
+    if not (item['french_text'] or '').strip() or not (item['translation'] or '').strip():
+        return 'french_text and translation are required'
+    if item['language_id'] not in languages:
+        return f"unknown language_id {item['language_id']!r}"
+    if item['category_id'] is not None and item['category_id'] not in categories:
+        return f"unknown category_id {item['category_id']!r}"
+    if item['difficulty_level'] is not None and item['difficulty_level'] not in DIFFICULTY_LEVELS:
+        return f"unknown difficulty_level {item['difficulty_level']!r}"
+    return None
+
+
+def insert_translation(cursor, item, contribution_id):
+    cursor.execute('''
+    INSERT INTO translations (french_text, language_id, translation, category_id, pronunciation, usage_notes, difficulty_level)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', tuple(item[field] for field in CONTRIBUTION_FIELDS))
+    translation_id = cursor.lastrowid
+    cursor.execute('''
+    INSERT INTO translation_sources (translation_id, source_file, source_position) VALUES (?, ?, 1)
+    ''', (translation_id, f'contribution:{contribution_id}'))
+    return translation_id
+
+
+def correct_translation(cursor, translation_id, item):
+    """Overwrite the row's fields with the contribution's non-null ones; True if anything changed"""
+    cursor.execute('''
+    UPDATE translations SET
+        pronunciation = COALESCE(:pronunciation, pronunciation),
+        usage_notes = COALESCE(:usage_notes, usage_notes),
+        category_id = COALESCE(:category_id, category_id),
+        difficulty_level = COALESCE(:difficulty_level, difficulty_level)
+    WHERE translation_id = :translation_id
+      AND (pronunciation IS NOT COALESCE(:pronunciation, pronunciation)
+           OR usage_notes IS NOT COALESCE(:usage_notes, usage_notes)
+           OR category_id IS NOT COALESCE(:category_id, category_id)
+           OR difficulty_level IS NOT COALESCE(:difficulty_level, difficulty_level))
+    ''', {**item, 'translation_id': translation_id})
+    return cursor.rowcount > 0
+
+
+def replace_translation(cursor, translation_id, item):
+    """New translation and pronunciation for an existing row, keeping unset metadata"""
+    cursor.execute('''
+    UPDATE translations SET
+        translation = :translation,
+        pronunciation = :pronunciation,
+        usage_notes = COALESCE(:usage_notes, usage_notes),
+        category_id = COALESCE(:category_id, category_id),
+        difficulty_level = COALESCE(:difficulty_level, difficulty_level)
+    WHERE translation_id = :translation_id
+    ''', {**item, 'translation_id': translation_id})
+
+
+def resolve(cursor, item, policy, contribution_id):
+    """Apply one contribution; returns (status, translation_id, detail)"""
+    existing = cursor.execute('''
+    SELECT translation_id, translation FROM translations
+    WHERE language_id = ? AND french_text = ?
+    ORDER BY translation_id
+    ''', (item['language_id'], item['french_text'])).fetchall()
+
+    wanted = normalize_text(item['translation'])
+    for translation_id, translation in existing:
+        if normalize_text(translation) == wanted:
+            changed = correct_translation(cursor, translation_id, item)
+            return ('updated' if changed else 'unchanged'), translation_id, None
+
+    if not existing or policy == 'variant':
+        return 'inserted', insert_translation(cursor, item, contribution_id), None
+    variants = ', '.join(translation for _, translation in existing)
+    if policy == 'replace':
+        translation_id = existing[0][0]
+        replace_translation(cursor, translation_id, item)
+        return 'updated', translation_id, f'replaced {existing[0][1]!r}'
+    return 'conflict', None, f'existing: {variants}'
+
+
+def refresh_translations(cursor, translation_ids):
+    """Refresh the derived data of inserted or updated rows only"""
+    translation_ids = sorted(translation_ids)
+    cameroon_db_autocomplete.update_completions(cursor, translation_ids)
+    cameroon_db_quiz.add_quiz_items(cursor, translation_ids)
+    cameroon_db_phonetic.build_phonetic_index(cursor, translation_ids=translation_ids)
+
+
+def refresh_derived_tables(cursor, language_ids):
+    language_ids = sorted(language_ids)
+    cameroon_db_autocomplete.build_completions(cursor, language_ids=language_ids)
+    cameroon_db_quiz.build_quiz_tables(cursor, language_ids=language_ids)
+    cameroon_db_phonetic.build_phonetic_index(cursor, language_ids=language_ids)
+
+
+def apply_batch(conn, policy='review', batch_size=BATCH_SIZE):
+    """Apply up to batch_size pending contributions in one write transaction.
+
+    Returns {status: count} for the batch (empty when the queue is drained).
+    """
+    if policy not in POLICIES:
+        raise ValueError(f'policy must be one of {POLICIES}')
+    cursor = conn.cursor()
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        cursor.execute(f'''
+        SELECT contribution_id, {', '.join(CONTRIBUTION_FIELDS)}
+        FROM contribution_queue WHERE status = 'pending'
+        ORDER BY contribution_id LIMIT ?
+        ''', (batch_size,))
+        pending = [(row[0], dict(zip(CONTRIBUTION_FIELDS, row[1:]))) for row in cursor.fetchall()]
+        languages = {row[0] for row in cursor.execute('SELECT language_id FROM languages')}
+        categories = {row[0] for row in cursor.execute('SELECT category_id FROM categories')}
+
+        counts, changed, outcomes = {}, set(), []
+        for contribution_id, item in pending:
+            reason = rejection(item, languages, categories)
+            if reason:
+                status, translation_id, detail = 'rejected', None, reason
+            else:
+                status, translation_id, detail = resolve(cursor, item, policy, contribution_id)
+            if status in ('inserted', 'updated'):
+                changed.add(translation_id)
+            counts[status] = counts.get(status, 0) + 1
+            outcomes.append((status, translation_id, detail, contribution_id))
+
+        cursor.executemany('''
+        UPDATE contribution_queue
+        SET status = ?, translation_id = ?, detail = ?, applied_at = CURRENT_TIMESTAMP
+        WHERE contribution_id = ?
+        ''', outcomes)
+        if changed:
+            refresh_translations(cursor, changed)
+            mark_modified(cursor)
+        cursor.execute('COMMIT')
+    except BaseException:
+        cursor.execute('ROLLBACK')
+        raise
+    return counts
+
+
+def mark_modified(cursor):
+    """Replace the build's input_fingerprint, so a reproducible build does not take this file for its own"""
+    applied_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    cursor.executemany('INSERT OR REPLACE INTO build_metadata (key, value) VALUES (?, ?)',
+                       [('input_fingerprint', f'contributions:{applied_at}'), ('contributions_applied_at', applied_at)])
+
+
+def apply_pending(conn, policy='review', batch_size=BATCH_SIZE):
+    """Drain the queue batch by batch; returns the summed status counts"""
+    totals = {}
+    while True:
+        counts = apply_batch(conn, policy, batch_size)
+        if not counts:
+            return totals
+        for status, count in counts.items():
+            totals[status] = totals.get(status, 0) + count
+
+
+def queue_status(conn):
+    return dict(conn.execute('SELECT status, COUNT(*) FROM contribution_queue GROUP BY status ORDER BY status'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Queue and apply community contributions')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    commands = parser.add_subparsers(dest='command', required=True)
+    submit = commands.add_parser('submit', help='append contributions from a JSON Lines file ("-" for stdin)')
+    submit.add_argument('input')
+    submit.add_argument('--contributor')
+    apply = commands.add_parser('apply', help='apply pending contributions in batches')
+    apply.add_argument('--policy', choices=POLICIES, default='review',
+                       help='what to do when (french_text, language_id) already has another translation')
+    apply.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    commands.add_parser('status', help='count queued contributions by status')
+    commands.add_parser('rebuild-quiz', help='recompute every language\'s quiz ranks and distractors')
+    args = parser.parse_args(argv)
+
+    conn = open_database(args.database)
+    if args.command == 'submit':
+        if args.input == '-':
+            count = enqueue(conn, read_contributions(sys.stdin), args.contributor)
+        else:
+            with open(args.input, encoding='utf-8') as f:
+                count = enqueue(conn, read_contributions(f), args.contributor)
+        print(f"📥 Queued {count} contribution(s)")
+    elif args.command == 'apply':
+        started = time.perf_counter()
+        totals = apply_pending(conn, args.policy, args.batch_size)
+        elapsed = time.perf_counter() - started
+        applied = sum(totals.values())
+        rate = f", {applied / elapsed:.0f}/s" if applied and elapsed else ''
+        print(f"✍️  Applied {applied} contribution(s) in {elapsed:.2f} s{rate}")
+        for status, count in sorted(totals.items()):
+            print(f"  {status}: {count}")
+    elif args.command == 'rebuild-quiz':
+        started = time.perf_counter()
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            cameroon_db_quiz.build_quiz_tables(cursor)
+            cursor.execute('COMMIT')
+        except BaseException:
+            cursor.execute('ROLLBACK')
+            raise
+        print(f"🎲 Quiz ranks and distractors rebuilt in {time.perf_counter() - started:.2f} s")
+    else:
+        for status, count in queue_status(conn).items():
+            print(f"  {status}: {count}")
+    conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""Faceted browsing of translations.
+
+A filter spec is a dict with optional 'language_id', 'category_id' and
+'difficulty_level' (a value or a list of values; '' matches a NULL
+category or difficulty) and 'prefix' (French text, matched normalized).
+browse() returns one page of matching translations and, for each facet,
+the number of matches per value with every other filter applied, so
+picking a language still shows what the other languages would give.
+
+All facet counts come from one cube of (language, category, difficulty)
+counts for the rows matching the prefix:
+
+- without a prefix the cube is translation_stats, kept current by the
+  stats triggers;
+- for prefixes of up to FACET_PREFIX_LENGTH characters it is read from
+  facet_prefix_counts, kept current by triggers on translations the same
+  way, so the short prefixes that match the most rows cost a lookup;
+- for longer prefixes it is one GROUP BY over a narrow range of
+  idx_translations_facets, which covers the facet columns.
+
+Each facet is then summed from the cube, so more facets or values add no
+queries. The cube also counts the matches exactly, which picks the plan
+for the page (keyset-paginated on (french_norm, translation_id)): an
+ordered index scan when matches are dense, a filter-first index and a
+sort when they are rare, and no query at all when there are none.
+"""
+import argparse
+import json
+import sys
+
+from cameroon_db_utils import connect, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+FACETS = ('language_id', 'category_id', 'difficulty_level')
+# Prefixes up to this many characters have precomputed cubes
+FACET_PREFIX_LENGTH = 2
+PAGE_SIZE = 50
+RESULT_COLUMNS = ('translation_id', 'language_id', 'french_text', 'translation', 'category_id',
+                  'difficulty_level', 'pronunciation')
+# Single-column indexes a selective filter can be served from
+FILTER_INDEXES = {'category_id': 'idx_translations_category', 'difficulty_level': 'idx_translations_difficulty'}
+
+
+def prefix_delta(row, sign):
+    """Trigger statements adding sign to the prefix cubes of translation row OLD or NEW"""
+    operator = '+' if sign > 0 else '-'
+    return ''.join(f'''
+        INSERT INTO facet_prefix_counts (prefix, language_id, category_id, difficulty_level, word_count)
+        SELECT substr({row}.french_norm, 1, {length}), {row}.language_id, IFNULL({row}.category_id, ''),
+               IFNULL({row}.difficulty_level, ''), {max(sign, 0)}
+        WHERE {row}.language_id IS NOT NULL AND length({row}.french_norm) >= {length}
+        ON CONFLICT (prefix, language_id, category_id, difficulty_level) DO UPDATE SET word_count = word_count {operator} 1;
+        DELETE FROM facet_prefix_counts
+        WHERE prefix = substr({row}.french_norm, 1, {length}) AND language_id = {row}.language_id
+          AND category_id = IFNULL({row}.category_id, '') AND difficulty_level = IFNULL({row}.difficulty_level, '')
+          AND word_count = 0;''' for length in range(1, FACET_PREFIX_LENGTH + 1))
+
+
+FACET_TRIGGERS = {
+    'trg_translations_facets_insert': f'''
+    AFTER INSERT ON translations BEGIN{prefix_delta('NEW', 1)}
+    END''',
+    'trg_translations_facets_delete': f'''
+    AFTER DELETE ON translations BEGIN{prefix_delta('OLD', -1)}
+    END''',
+    # Rebuilding french_norm rewrites every row of a language; unchanged rows cost nothing
+    'trg_translations_facets_update': f'''
+    AFTER UPDATE OF french_norm, language_id, category_id, difficulty_level ON translations
+    WHEN OLD.french_norm IS NOT NEW.french_norm OR OLD.language_id IS NOT NEW.language_id
+      OR OLD.category_id IS NOT NEW.category_id OR OLD.difficulty_level IS NOT NEW.difficulty_level
+    BEGIN{prefix_delta('OLD', -1)}{prefix_delta('NEW', 1)}
+    END''',
+}
+
+
+def build_facet_tables(cursor):
+    """Create the facet index and prefix cubes, recompute the cubes and add their triggers"""
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_translations_facets
+    ON translations(french_norm, language_id, category_id, difficulty_level)
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS facet_prefix_counts (
+        prefix TEXT NOT NULL,
+        language_id VARCHAR(10) NOT NULL,
+        category_id VARCHAR(10) NOT NULL,
+        difficulty_level TEXT NOT NULL,
+        word_count INTEGER NOT NULL,
+        PRIMARY KEY (prefix, language_id, category_id, difficulty_level)
+    ) WITHOUT ROWID
+    ''')
+    cursor.execute('DELETE FROM facet_prefix_counts')
+    for length in range(1, FACET_PREFIX_LENGTH + 1):
+        cursor.execute('''
+        INSERT INTO facet_prefix_counts (prefix, language_id, category_id, difficulty_level, word_count)
+        SELECT substr(french_norm, 1, ?), language_id, IFNULL(category_id, ''), IFNULL(difficulty_level, ''), COUNT(*)
+        FROM translations
+        WHERE language_id IS NOT NULL AND length(french_norm) >= ?
+        GROUP BY 1, 2, 3, 4
+        ''', (length, length))
+    for name, body in FACET_TRIGGERS.items():
+        cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {body}')
+
+
+def facet_values(spec, facet):
+    """The values a spec filters facet on, as a tuple, or None"""
+    values = spec.get(facet)
+    if values is None:
+        return None
+    return (values,) if isinstance(values, str) else tuple(values)
+
+
+def facet_cube(conn, prefix):
+    """[(language_id, category_id, difficulty_level, count)] of the rows matching prefix"""
+    if not prefix:
+        return conn.execute('''
+        SELECT language_id, category_id, difficulty_level, word_count FROM translation_stats
+        ''').fetchall()
+    if len(prefix) <= FACET_PREFIX_LENGTH:
+        return conn.execute('''
+        SELECT language_id, category_id, difficulty_level, word_count FROM facet_prefix_counts WHERE prefix = ?
+        ''', (prefix,)).fetchall()
+    return conn.execute('''
+    SELECT language_id, IFNULL(category_id, ''), IFNULL(difficulty_level, ''), COUNT(*)
+    FROM translations
+    WHERE french_norm >= ? AND french_norm < ?
+    GROUP BY 1, 2, 3
+    ''', (prefix, prefix + '\uffff')).fetchall()
+
+
+def facet_counts(cube, spec):
+    """({facet: {value: count}}, matches); each facet is counted with the other facets' filters applied"""
+    wanted = [facet_values(spec, facet) for facet in FACETS]
+    counts = {facet: {} for facet in FACETS}
+    matches = 0
+    for *key, count in cube:
+        misses = [index for index, values in enumerate(wanted) if values is not None and key[index] not in values]
+        # A row counts for a facet when it passes every filter but that facet's own
+        for index, facet in enumerate(FACETS):
+            if not misses or misses == [index]:
+                counts[facet][key[index]] = counts[facet].get(key[index], 0) + count
+        if not misses:
+            matches += count
+    return {facet: dict(sorted(values.items(), key=lambda item: (-item[1], item[0])))
+            for facet, values in counts.items()}, matches
+
+
+def choose_plan(conn, cube, spec, matches, page_size):
+    """The index to serve the page from: 'ordered' or a FILTER_INDEXES facet.
+
+    The cube gives exact counts, so the estimates are too: an ordered scan
+    reads about range_rows * page_size / matches index entries before the
+    page is full; a filter-first plan reads every row with the filtered
+    values and sorts the matches.
+    """
+    languages = facet_values(spec, 'language_id')
+    # One language scans idx_translations_french_norm, otherwise idx_translations_facets
+    single = languages is not None and len(languages) == 1
+    range_rows = sum(count for language_id, _, _, count in cube if not single or language_id in languages)
+    best, cost = 'ordered', range_rows * min(1.0, (page_size + 1) / matches)
+    totals = None
+    for facet in FILTER_INDEXES:
+        values = facet_values(spec, facet)
+        if values is None:
+            continue
+        if totals is None:
+            totals = facet_cube(conn, '')
+        column = FACETS.index(facet)
+        rows = sum(count for *key, count in totals if key[column] in values)
+        if rows + matches < cost:
+            best, cost = facet, rows + matches
+    return best
+
+
+def compile_filters(spec, prefix, plan='ordered'):
+    """WHERE clause and parameters for every filter of spec.
+
+    Terms whose index the plan does not use get a unary + so SQLite
+    cannot pick that index instead.
+    """
+    languages = facet_values(spec, 'language_id')
+    usable = {'language_id', 'french_norm'} if plan == 'ordered' else {plan}
+    if plan == 'ordered' and (languages is None or len(languages) != 1):
+        usable = {'french_norm'}
+    clauses, params = [], []
+    for facet in FACETS:
+        values = facet_values(spec, facet)
+        if values is None:
+            continue
+        column = facet if facet in usable else f'+{facet}'
+        present = [value for value in values if value != '']
+        terms = [f"{column} IN ({','.join('?' * len(present))})"] if present else []
+        if '' in values:
+            terms.append(f'{facet} IS NULL')
+        clauses.append(f"({' OR '.join(terms) or '0'})")
+        params.extend(present)
+    if prefix:
+        column = 'french_norm' if 'french_norm' in usable else '+french_norm'
+        clauses.append(f'{column} >= ? AND {column} < ?')
+        params.extend((prefix, prefix + '\uffff'))
+    return ' AND '.join(clauses) or '1', params
+
+
+def encode_cursor(row):
+    return f"{row['french_norm']}|{row['translation_id']}"
+
+
+def decode_cursor(token):
+    french_norm, _, translation_id = token.rpartition('|')
+    return french_norm, int(translation_id)
+
+
+def browse(conn, spec, cursor=None, page_size=PAGE_SIZE):
+    """One page of translations matching spec plus the facet counts.
+
+    Returns {'results', 'facets', 'total', 'cursor', 'plan'}; cursor is
+    None on the last page, otherwise pass it back for the next one.
+    """
+    prefix = normalize_text(spec.get('prefix') or '')
+    cube = facet_cube(conn, prefix)
+    facets, matches = facet_counts(cube, spec)
+    if not matches:
+        return {'results': [], 'facets': facets, 'total': 0, 'cursor': None, 'plan': None}
+
+    plan = choose_plan(conn, cube, spec, matches, page_size)
+    where, params = compile_filters(spec, prefix, plan)
+    if cursor:
+        where += ' AND (french_norm, translation_id) > (?, ?)'
+        params.extend(decode_cursor(cursor))
+    rows = conn.execute(f'''
+    SELECT {', '.join(RESULT_COLUMNS)}, french_norm FROM translations
+    WHERE {where}
+    ORDER BY french_norm, translation_id
+    LIMIT ?
+    ''', (*params, page_size + 1)).fetchall()
+    results = [dict(zip(RESULT_COLUMNS + ('french_norm',), row)) for row in rows[:page_size]]
+    return {
+        'results': [{column: row[column] for column in RESULT_COLUMNS} for row in results],
+        'facets': facets,
+        'total': matches,
+        'cursor': encode_cursor(results[-1]) if len(rows) > page_size else None,
+        'plan': plan,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Browse translations by facet')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    for facet in FACETS:
+        parser.add_argument(f"--{facet.replace('_', '-')}", dest=facet, action='append',
+                            help='keep rows with this value (repeat for several)')
+    parser.add_argument('--prefix', help='French text the phrases start with')
+    parser.add_argument('--cursor', help='cursor returned with the previous page')
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    args = parser.parse_args(argv)
+
+    spec = {facet: getattr(args, facet) for facet in FACETS if getattr(args, facet)}
+    if args.prefix:
+        spec['prefix'] = args.prefix
+    conn = connect(f'file:{args.database}?mode=ro', uri=True)
+    page = browse(conn, spec, args.cursor, args.page_size)
+    conn.close()
+    print(f"🔎 {page['total']} matches")
+    for facet, values in page['facets'].items():
+        print(f"  {facet}: " + ', '.join(f'{value or "(none)"} {count}' for value, count in values.items()))
+    for row in page['results']:
+        print(f"  [{row['language_id']}] {row['french_text']} -> {row['translation']}")
+    if page['cursor']:
+        print(json.dumps({'cursor': page['cursor']}), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,324 @@
+"""Lesson media resolution and per-language prefetch manifests.
+
+Each lesson's audio_url/video_url is resolved against a local media root.
+Size, SHA-256 and duration are recorded in the lesson_media table, and a
+manifest per language lists the media in curriculum order (order_index)
+so the client can prefetch the next lessons within a byte budget.
+"""
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import wave
+
+from cameroon_db_utils import connect
+
+DATABASE_FILE = 'cameroon_languages.db'
+MANIFEST_DIR = 'media_manifests'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+MEDIA_COLUMNS = (('audio', 'audio_url'), ('video', 'video_url'))
+
+# MPEG audio layer III tables (kbps / Hz), indexed by the frame header fields
+MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),   # MPEG-2.5
+}
+
+
+def create_media_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS lesson_media (
+        lesson_id INTEGER NOT NULL,
+        kind TEXT CHECK(kind IN ('audio', 'video')) NOT NULL,
+        url TEXT NOT NULL,
+        present INTEGER NOT NULL DEFAULT 0,
+        size_bytes INTEGER,
+        sha256 TEXT,
+        duration_ms INTEGER,
+        mtime_ns INTEGER,
+        PRIMARY KEY (lesson_id, kind),
+        FOREIGN KEY (lesson_id) REFERENCES lessons(lesson_id)
+    )
+    ''')
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def mp3_duration_ms(path):
+    """Duration from the first frame header (Xing/Info frame count or CBR bitrate)"""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        head = f.read(10)
+        offset = 0
+        if head[:3] == b'ID3' and len(head) == 10:
+            tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            offset = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+        f.seek(offset)
+        data = f.read(64 * 1024)
+
+    for i in range(len(data) - 4):
+        if data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
+            continue
+        version = (data[i + 1] >> 3) & 0x03
+        layer = (data[i + 1] >> 1) & 0x03
+        bitrate_index = data[i + 2] >> 4
+        rate_index = (data[i + 2] >> 2) & 0x03
+        if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+            continue
+
+        mpeg1 = version == 3
+        bitrate = MP3_BITRATES[1 if mpeg1 else 2][bitrate_index] * 1000
+        sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+        samples_per_frame = 1152 if mpeg1 else 576
+        mono = (data[i + 3] >> 6) == 3
+        side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+
+        xing = i + 4 + side_info
+        if data[xing:xing + 4] in (b'Xing', b'Info') and len(data) >= xing + 12:
+            flags = struct.unpack('>I', data[xing + 4:xing + 8])[0]
+            if flags & 0x01:
+                frames = struct.unpack('>I', data[xing + 8:xing + 12])[0]
+                return round(frames * samples_per_frame * 1000 / sample_rate)
+
+        audio_bytes = size - offset - i
+        return round(audio_bytes * 8 * 1000 / bitrate)
+    return None
+
+
+def mp4_duration_ms(path):
+    """Duration from the movie header (moov/mvhd) of an ISO base media file"""
+    with open(path, 'rb') as f:
+        end = os.fstat(f.fileno()).st_size
+        containers = {b'moov'}
+        position = 0
+        while position + 8 <= end:
+            f.seek(position)
+            box_size, box_type = struct.unpack('>I4s', f.read(8))
+            header = 8
+            if box_size == 1:
+                box_size = struct.unpack('>Q', f.read(8))[0]
+                header = 16
+            elif box_size == 0:
+                box_size = end - position
+            if box_size < header:
+                return None
+
+            if box_type in containers:
+                end = position + box_size
+                position += header
+                continue
+            if box_type == b'mvhd':
+                version = f.read(4)[0]
+                if version == 1:
+                    f.seek(16, os.SEEK_CUR)
+                    timescale, duration = struct.unpack('>IQ', f.read(12))
+                else:
+                    f.seek(8, os.SEEK_CUR)
+                    timescale, duration = struct.unpack('>II', f.read(8))
+                return round(duration * 1000 / timescale) if timescale else None
+            position += box_size
+    return None
+
+
+def wav_duration_ms(path):
+    with wave.open(path, 'rb') as w:
+        return round(w.getnframes() * 1000 / w.getframerate())
+
+
+DURATION_PROBES = {
+    '.mp3': mp3_duration_ms,
+    '.mp4': mp4_duration_ms,
+    '.m4a': mp4_duration_ms,
+    '.mov': mp4_duration_ms,
+    '.wav': wav_duration_ms,
+}
+
+
+def media_duration_ms(path):
+    probe = DURATION_PROBES.get(os.path.splitext(path)[1].lower())
+    if probe is None:
+        return None
+    try:
+        return probe(path)
+    except (OSError, EOFError, struct.error, wave.Error, IndexError):
+        return None
+
+
+def resolve_media_path(media_root, url):
+    """Map a media URL onto the media root, refusing paths that escape it"""
+    root = os.path.realpath(media_root)
+    path = os.path.realpath(os.path.join(root, url.lstrip('/')))
+    if os.path.commonpath([root, path]) != root:
+        return None
+    return path
+
+
+def resolve_lesson_media(conn, media_root):
+    """Record presence, size, hash and duration of every lesson media file.
+
+    Files whose size and mtime are unchanged since the previous run keep
+    their recorded hash and duration instead of being read again.
+    """
+    cursor = conn.cursor()
+    create_media_table(cursor)
+
+    previous = {
+        (row[0], row[1]): row[2:]
+        for row in cursor.execute('''
+        SELECT lesson_id, kind, url, size_bytes, mtime_ns, sha256, duration_ms
+        FROM lesson_media WHERE present = 1
+        ''')
+    }
+
+    records = []
+    for lesson_id, audio_url, video_url in cursor.execute(
+            'SELECT lesson_id, audio_url, video_url FROM lessons').fetchall():
+        urls = {'audio': audio_url, 'video': video_url}
+        for kind, _ in MEDIA_COLUMNS:
+            url = urls[kind]
+            if not url:
+                continue
+            path = resolve_media_path(media_root, url)
+            if path is None or not os.path.isfile(path):
+                records.append((lesson_id, kind, url, 0, None, None, None, None))
+                continue
+
+            stat = os.stat(path)
+            cached = previous.get((lesson_id, kind))
+            if cached and cached[:3] == (url, stat.st_size, stat.st_mtime_ns):
+                sha256, duration_ms = cached[3], cached[4]
+            else:
+                sha256, duration_ms = file_sha256(path), media_duration_ms(path)
+            records.append((lesson_id, kind, url, 1, stat.st_size,
+                            sha256, duration_ms, stat.st_mtime_ns))
+
+    cursor.execute('DELETE FROM lesson_media')
+    cursor.executemany('''
+    INSERT INTO lesson_media (lesson_id, kind, url, present, size_bytes, sha256, duration_ms, mtime_ns)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', records)
+    conn.commit()
+
+    present = sum(1 for r in records if r[3])
+    return {'resolved': present, 'missing': len(records) - present}
+
+
+def build_prefetch_manifests(conn):
+    """Return {language_id: manifest} with lessons in curriculum order"""
+    cursor = conn.cursor()
+    cursor.execute('''
+    SELECT l.language_id, l.lesson_id, l.order_index, l.level, l.title,
+           m.kind, m.url, m.present, m.size_bytes, m.sha256, m.duration_ms
+    FROM lessons l
+    JOIN lesson_media m ON m.lesson_id = l.lesson_id
+    ORDER BY l.language_id, l.order_index, l.lesson_id, m.kind
+    ''')
+
+    manifests = {}
+    for (language_id, lesson_id, order_index, level, title,
+         kind, url, present, size_bytes, sha256, duration_ms) in cursor:
+        manifest = manifests.setdefault(language_id, {
+            'language_id': language_id,
+            'total_bytes': 0,
+            'lessons': [],
+            'missing': [],
+        })
+        if not present:
+            manifest['missing'].append({'lesson_id': lesson_id, 'kind': kind, 'url': url})
+            continue
+
+        lessons = manifest['lessons']
+        if not lessons or lessons[-1]['lesson_id'] != lesson_id:
+            lessons.append({
+                'lesson_id': lesson_id,
+                'order_index': order_index,
+                'level': level,
+                'title': title,
+                'bytes': 0,
+                'cumulative_bytes': manifest['total_bytes'],
+                'media': [],
+            })
+        lesson = lessons[-1]
+        lesson['media'].append({
+            'kind': kind,
+            'url': url,
+            'size_bytes': size_bytes,
+            'sha256': sha256,
+            'duration_ms': duration_ms,
+        })
+        lesson['bytes'] += size_bytes
+        manifest['total_bytes'] += size_bytes
+        lesson['cumulative_bytes'] = manifest['total_bytes']
+    return manifests
+
+
+def write_prefetch_manifests(conn, output_dir=MANIFEST_DIR):
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for language_id, manifest in build_prefetch_manifests(conn).items():
+        path = os.path.join(output_dir, f'prefetch_{language_id.lower()}.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        paths.append(path)
+    return paths
+
+
+def plan_prefetch(manifest, after_order_index, max_lessons, byte_budget, cached_hashes=()):
+    """Media to download for the next lessons, stopping at the byte budget.
+
+    Mirrors what the client does with a manifest: walk lessons after the
+    current position in order, skip files whose hash is already cached and
+    stop before the budget would be exceeded.
+    """
+    cached = set(cached_hashes)
+    plan, spent, lessons = [], 0, 0
+    for lesson in manifest['lessons']:
+        if lesson['order_index'] <= after_order_index:
+            continue
+        if lessons == max_lessons:
+            break
+        lessons += 1
+        for media in lesson['media']:
+            if media['sha256'] in cached:
+                continue
+            if spent + media['size_bytes'] > byte_budget:
+                return plan
+            plan.append(media)
+            cached.add(media['sha256'])
+            spent += media['size_bytes']
+    return plan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Resolve lesson media and write prefetch manifests')
+    parser.add_argument('media_root', help='directory the lesson audio/video URLs are relative to')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--output-dir', default=MANIFEST_DIR)
+    args = parser.parse_args(argv)
+
+    conn = connect(args.database)
+    summary = resolve_lesson_media(conn, args.media_root)
+    paths = write_prefetch_manifests(conn, args.output_dir)
+    conn.close()
+
+    print(f"🎧 Lesson media: {summary['resolved']} resolved, {summary['missing']} missing")
+    print(f"📦 Prefetch manifests: {len(paths)} written to {args.output_dir}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
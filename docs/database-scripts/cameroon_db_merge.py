@@ -0,0 +1,250 @@
+"""Merge of the translation sources by natural key, with provenance.
+
+A build's translations come from one or more sources, in precedence
+order: the curated dataset (data/translations.json) and, optionally,
+spec files, markdown documents with SQL blocks such as
+
+    INSERT INTO translations (french_text, language_id, translation, category_id, pronunciation, difficulty_level) VALUES
+    ('Bonjour', 'EWO', 'Mbolo', 'GRT', 'mm-BOH-loh', 'beginner'),
+    ...;
+
+Each source is read as a stream of (row, position) records and sorted by
+natural key, (language_id, normalized French text), with an external
+sort: runs of run_size records are sorted in memory and, once a source
+is larger than one run, spilled to temporary files. heapq.merge then
+k-way merges the sorted streams, so the sort itself holds one run plus
+one record per run and source, and each added source costs O(n log k).
+That is the only bounded part: read_dataset() loads its whole JSON file
+and merged_translations() returns lists of every row, so a build still
+holds all of its translations in memory.
+
+A key found in several sources takes all its rows from the first of them
+in precedence order, so one source's variants of a phrase stay together;
+the other sources' rows for that key are counted as overridden. Every
+merged row keeps its provenance, the source file name and the position
+in it (the line in a spec file, the row number in a dataset), which the
+builder stores in translation_sources. The builder numbers the merged
+rows in source_order(), precedence then position, so a single dataset's
+rows keep the translation_ids of its row order (the app and the sync
+feed refer to rows by id).
+
+Blocks naming other columns (the normalized schema of
+'cameroon_languages_db (2).md', say) do not hold translations rows and
+are skipped.
+"""
+import argparse
+import collections
+import heapq
+import itertools
+import json
+import os
+import re
+import sys
+import tempfile
+
+from cameroon_db_utils import connect, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DATASET = os.path.join(DATA_DIR, 'translations.json')
+# Records sorted in memory per run before a source is spilled to disk
+RUN_SIZE = 100000
+# Columns of a translations row, in data file order
+COLUMNS = ('french_text', 'language_id', 'translation', 'category_id', 'pronunciation', 'usage_notes',
+           'difficulty_level')
+REQUIRED = ('french_text', 'language_id', 'translation')
+BLOCK_HEADER = re.compile(r'^\s*INSERT INTO translations\s*\(([^)]*)\)\s*VALUES\s*$', re.IGNORECASE)
+TUPLE = re.compile(r'^\s*\((.*)\)\s*[,;]?\s*$')
+VALUE = re.compile(r"'((?:[^']|'')*)'|(NULL)|(-?\d+(?:\.\d+)?)", re.IGNORECASE)
+
+
+def create_provenance_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS translation_sources (
+        translation_id INTEGER PRIMARY KEY,
+        source_file TEXT NOT NULL,
+        source_position INTEGER NOT NULL,
+        FOREIGN KEY (translation_id) REFERENCES translations(translation_id)
+    )
+    ''')
+
+
+def parse_values(text):
+    """Python values of one SQL VALUES tuple's contents"""
+    values, end = [], 0
+    for match in VALUE.finditer(text):
+        if text[end:match.start()].strip(' ,'):
+            raise ValueError(f'unexpected {text[end:match.start()].strip()!r}')
+        string, null, number = match.groups()
+        if string is not None:
+            values.append(string.replace("''", "'"))
+        elif null:
+            values.append(None)
+        else:
+            values.append(float(number) if '.' in number else int(number))
+        end = match.end()
+    if text[end:].strip(' ,'):
+        raise ValueError(f'unexpected {text[end:].strip()!r}')
+    return values
+
+
+def read_spec(path):
+    """(row, line) of every translations row in the SQL blocks of a spec file"""
+    columns = None
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            header = BLOCK_HEADER.match(line)
+            if header:
+                columns = [column.strip() for column in header.group(1).split(',')]
+                if not set(REQUIRED) <= set(columns):
+                    columns = None
+                continue
+            if columns is None:
+                continue
+            stripped = line.strip()
+            if not stripped or stripped.startswith('--'):
+                continue
+            match = TUPLE.match(line)
+            if not match:
+                columns = None
+                continue
+            try:
+                values = parse_values(match.group(1))
+            except ValueError as error:
+                raise ValueError(f'{os.path.basename(path)}:{line_number}: {error}') from None
+            if len(values) != len(columns):
+                raise ValueError(f'{os.path.basename(path)}:{line_number}: '
+                                 f'{len(values)} values for {len(columns)} columns')
+            fields = dict(zip(columns, values))
+            yield tuple(fields.get(column) for column in COLUMNS), line_number
+            if stripped.endswith(';'):
+                columns = None
+
+
+def read_dataset(path):
+    """(row, row number) of a data/<table>.json file"""
+    with open(path, encoding='utf-8') as f:
+        rows = json.load(f)['rows']
+    for number, row in enumerate(rows, 1):
+        yield tuple(row), number
+
+
+def read_source(path):
+    return read_dataset(path) if path.endswith('.json') else read_spec(path)
+
+
+def natural_key(row):
+    return row[1] or '', normalize_text(row[0]) or ''
+
+
+def spill(run):
+    """Write a sorted run to a temporary file; returns the open file"""
+    f = tempfile.TemporaryFile('w+', encoding='utf-8')
+    for record in run:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    f.seek(0)
+    return f
+
+
+def read_run(f):
+    with f:
+        for line in f:
+            key, position, row = json.loads(line)
+            yield tuple(key), position, tuple(row)
+
+
+def sorted_records(records, run_size=RUN_SIZE):
+    """(natural key, position, row) of (row, position) records, sorted, in bounded memory"""
+    runs = []
+    while True:
+        run = [(natural_key(row), position, row) for row, position in itertools.islice(records, run_size)]
+        run.sort()
+        if len(run) < run_size and not runs:
+            yield from run
+            return
+        if run:
+            runs.append(spill(run))
+        if len(run) < run_size:
+            break
+    yield from heapq.merge(*(read_run(f) for f in runs))
+
+
+def ranked(records, rank):
+    for key, position, row in records:
+        yield key, rank, position, row
+
+
+def merge_sources(sources, run_size=RUN_SIZE, report=None):
+    """(row, source file name, position) merged from sources, in precedence order.
+
+    report, a Counter, gets (source file name, 'merged' or 'overridden')
+    counts as the merge proceeds.
+    """
+    report = report if report is not None else collections.Counter()
+    names = [os.path.basename(path) for path in sources]
+    streams = [ranked(sorted_records(read_source(path), run_size), rank) for rank, path in enumerate(sources)]
+    for _, records in itertools.groupby(heapq.merge(*streams), key=lambda record: record[0]):
+        winner = None
+        for _, rank, position, row in records:
+            winner = rank if winner is None else winner
+            if rank == winner:
+                report[names[rank], 'merged'] += 1
+                yield row, names[rank], position
+            else:
+                report[names[rank], 'overridden'] += 1
+
+
+def source_order(records, sources):
+    """(row, source file name, position) records sorted by source precedence, then position"""
+    ranks = {}
+    for rank, path in enumerate(sources):
+        ranks.setdefault(os.path.basename(path), rank)
+    return sorted(records, key=lambda record: (ranks[record[1]], record[2]))
+
+
+def merged_translations(cursor, sources=(DATASET,), run_size=RUN_SIZE, report=None, languages=None, categories=None):
+    """(accepted, rejected) lists of (row, source, position); rejected rows name an unknown language or category.
+
+    languages and categories are the ids rows may name, by default the
+    ones in the database.
+    """
+    if languages is None:
+        languages = {row[0] for row in cursor.execute('SELECT language_id FROM languages')}
+    if categories is None:
+        categories = {row[0] for row in cursor.execute('SELECT category_id FROM categories')}
+    accepted, rejected = [], []
+    for row, source, position in merge_sources(sources, run_size, report):
+        known = (row[1] is None or row[1] in languages) and (row[3] is None or row[3] in categories)
+        (accepted if known else rejected).append((row, source, position))
+    return accepted, rejected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Merge translation sources and report where each row comes from')
+    parser.add_argument('sources', nargs='*', metavar='SOURCE',
+                        help=f'spec files or datasets, highest precedence first (default: {DATASET})')
+    parser.add_argument('--database', default=DATABASE_FILE, help='database whose languages and categories rows must name')
+    parser.add_argument('--run-size', type=int, default=RUN_SIZE, help='records sorted in memory per run')
+    parser.add_argument('--output', help='write the merged rows as a data/translations.json style dataset')
+    args = parser.parse_args(argv)
+
+    report = collections.Counter()
+    conn = connect(f'file:{args.database}?mode=ro', uri=True)
+    accepted, rejected = merged_translations(conn.cursor(), args.sources or [DATASET], args.run_size, report)
+    conn.close()
+    for (source, status), count in sorted(report.items()):
+        print(f"🔀 {source}: {count} {status}")
+    for row, source, position in rejected:
+        print(f"⚠️  {source}:{position}: unknown language or category in {row[:4]}")
+    if args.output:
+        with open(f'{args.output}.tmp', 'w', encoding='utf-8') as f:
+            f.write('{\n  "columns": ' + json.dumps(COLUMNS) + ',\n  "rows": [\n')
+            f.write(',\n'.join('    ' + json.dumps(row, ensure_ascii=False) for row, _, _ in accepted))
+            f.write('\n  ]\n}\n')
+        os.replace(f'{args.output}.tmp', args.output)
+        print(f"📝 {len(accepted)} rows written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
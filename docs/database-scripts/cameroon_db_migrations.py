@@ -0,0 +1,279 @@
+"""Versioned in-place schema migrations.
+
+The schema version is PRAGMA user_version (the slot sqflite uses for the
+app's own database) and schema_migrations records when each migration
+was applied. The builder stamps new databases with the latest version,
+so only databases shipped before a migration existed run it.
+
+A migration is split so that no step holds the write lock for long:
+
+- schema changes (CREATE TABLE, ALTER TABLE ... ADD COLUMN, triggers) run
+  in one short transaction; adding a column only rewrites the schema, not
+  the table;
+- backfills fill new columns batch_size rows at a time in id order. The
+  values are computed by a plain read (the Python helpers are registered
+  as SQL functions) and the write transaction only stores them, so it
+  holds the lock for ~20 ms whatever the computation costs; a short pause
+  after each commit lets writers such as apply_pending() in. Only rows
+  still NULL are filled, so an interrupted migration picks up where it
+  stopped;
+- indexes on the new columns are built after their backfill;
+- derived tables computed per language (completions, quiz ranks and
+  distractors) are built one language per transaction, skipping the
+  languages that already have them;
+- the version is bumped together with its schema_migrations row.
+
+Every step is idempotent, so databases built by a builder that already
+had a feature (at user_version 0) pass through its migration quickly.
+"""
+import argparse
+import sys
+import time
+
+import cameroon_db_autocomplete
+import cameroon_db_facets
+import cameroon_db_merge
+import cameroon_db_phonetic
+import cameroon_db_quiz
+import cameroon_db_stats
+import cameroon_db_sync
+from cameroon_db_utils import connect, ensure_column, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+BATCH_SIZE = 5000
+BUSY_TIMEOUT_S = 30.0
+BATCH_PAUSE_S = 0.005
+MIN_ROWID = -(1 << 63)
+
+
+def open_database(path=DATABASE_FILE):
+    """Connection with explicit transactions and the backfill SQL functions"""
+    conn = connect(path, timeout=BUSY_TIMEOUT_S, isolation_level=None)
+    conn.create_function('normalize_text', 1, normalize_text, deterministic=True)
+    conn.create_function('phonetic_key', 1, cameroon_db_phonetic.phonetic_key, deterministic=True)
+    create_migrations_table(conn.cursor())
+    return conn
+
+
+def create_migrations_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMP NOT NULL
+    )
+    ''')
+
+
+def schema_version(conn):
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def in_transaction(conn, step):
+    """Run step(cursor) in one BEGIN IMMEDIATE ... COMMIT"""
+    cursor = conn.cursor()
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        result = step(cursor)
+        cursor.execute('COMMIT')
+    except BaseException:
+        cursor.execute('ROLLBACK')
+        raise
+    return result
+
+
+def backfill(conn, table, id_column, assignments, batch_size=BATCH_SIZE, pause=BATCH_PAUSE_S):
+    """Set columns to SQL expressions batch by batch; returns rows updated.
+
+    assignments is {column: expression}; rows whose first column is
+    already set are skipped. Each batch is computed by a plain read, so
+    the write transaction only applies the values; the pause after each
+    commit lets writers waiting on the busy timeout take their turn.
+    """
+    marker = next(iter(assignments))
+    updated, last = 0, MIN_ROWID
+    while True:
+        rows = conn.execute(f'''
+        SELECT {', '.join(assignments.values())}, {id_column} FROM {table}
+        WHERE {id_column} > ? AND {marker} IS NULL
+        ORDER BY {id_column} LIMIT ?
+        ''', (last, batch_size)).fetchall()
+        if not rows:
+            return updated
+        in_transaction(conn, lambda cursor: cursor.executemany(f'''
+        UPDATE {table} SET {', '.join(f'{column} = ?' for column in assignments)}
+        WHERE {id_column} = ? AND {marker} IS NULL
+        ''', rows))
+        updated += len(rows)
+        last = rows[-1][-1]
+        time.sleep(pause)
+
+
+def migrate_normalized_text(conn, batch_size):
+    in_transaction(conn, lambda cursor: (
+        ensure_column(cursor, 'translations', 'french_norm', 'TEXT'),
+        ensure_column(cursor, 'translations', 'translation_norm', 'TEXT')))
+    rows = backfill(conn, 'translations', 'translation_id', {
+        'french_norm': 'normalize_text(french_text)',
+        'translation_norm': 'normalize_text(translation)',
+    }, batch_size)
+    in_transaction(conn, lambda cursor: (
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_french_norm ON translations(language_id, french_norm)'),
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_translation_norm ON translations(language_id, translation_norm)')))
+    return rows
+
+
+def migrate_phonetic_key(conn, batch_size):
+    in_transaction(conn, lambda cursor: ensure_column(cursor, 'translations', 'phonetic_key', 'TEXT'))
+    rows = backfill(conn, 'translations', 'translation_id', {
+        'phonetic_key': "phonetic_key(COALESCE(NULLIF(pronunciation, ''), translation))",
+    }, batch_size)
+    in_transaction(conn, lambda cursor: cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_translations_phonetic ON translations(phonetic_key)'))
+    return rows
+
+
+def migrate_sync_tracking(conn, batch_size):
+    def add_tracking(cursor):
+        cameroon_db_sync.create_tombstone_table(cursor)
+        for entity in cameroon_db_sync.SYNC_ENTITIES:
+            ensure_column(cursor, entity, 'updated_at', 'TEXT')
+            # Triggers first, so rows written during the backfill are stamped too
+            for name, body in cameroon_db_sync.sync_triggers(entity).items():
+                cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {body}')
+
+    in_transaction(conn, add_tracking)
+    rows = 0
+    for entity, (id_column, _) in cameroon_db_sync.SYNC_ENTITIES.items():
+        rows += backfill(conn, entity, id_column, {
+            'updated_at': "strftime('%Y-%m-%d %H:%M:%f', IFNULL(created_date, 'now'))",
+        }, batch_size)
+        in_transaction(conn, lambda cursor: cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS idx_{entity}_updated ON {entity}(updated_at, {id_column})'))
+    return rows
+
+
+def migrate_summary_stats(conn, batch_size):
+    # One GROUP BY per table; the triggers keep the counts current afterwards
+    in_transaction(conn, cameroon_db_stats.build_stats)
+    return 0
+
+
+def migrate_facets(conn, batch_size):
+    in_transaction(conn, cameroon_db_facets.build_facet_tables)
+    return 0
+
+
+def migrate_translation_sources(conn, batch_size):
+    # Rows loaded before provenance was recorded have none
+    in_transaction(conn, cameroon_db_merge.create_provenance_table)
+    return 0
+
+
+def migrate_builder_tables(conn, batch_size):
+    # build_metadata, build_checkpoints and the composite indexes; every statement is IF NOT EXISTS
+    import create_cameroon_db
+
+    in_transaction(conn, create_cameroon_db.create_tables)
+    return 0
+
+
+def per_language(conn, query, build):
+    """Run build(cursor, language_id) in its own transaction for each language query returns"""
+    rows = 0
+    for language_id, count in conn.execute(query).fetchall():
+        in_transaction(conn, lambda cursor: build(cursor, language_id))
+        rows += count
+        time.sleep(BATCH_PAUSE_S)
+    return rows
+
+
+def migrate_completions(conn, batch_size):
+    in_transaction(conn, cameroon_db_autocomplete.create_completion_tables)
+    return per_language(conn, '''
+    SELECT language_id, COUNT(*) FROM translations t
+    WHERE language_id IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM completions c WHERE c.language_id = t.language_id)
+    GROUP BY language_id ORDER BY language_id
+    ''', lambda cursor, language_id: cameroon_db_autocomplete.build_completions(cursor, language_ids=[language_id]))
+
+
+def migrate_quiz_tables(conn, batch_size):
+    in_transaction(conn, cameroon_db_quiz.create_quiz_tables)
+    return per_language(conn, '''
+    SELECT language_id, COUNT(*) FROM translations
+    WHERE language_id IN (SELECT language_id FROM translations WHERE random_rank IS NULL)
+    GROUP BY language_id ORDER BY language_id
+    ''', lambda cursor, language_id: cameroon_db_quiz.build_quiz_tables(cursor, language_ids=[language_id]))
+
+
+# (version, name, migrate(conn, batch_size) -> rows backfilled), in order
+MIGRATIONS = (
+    (1, 'normalized_text', migrate_normalized_text),
+    (2, 'phonetic_key', migrate_phonetic_key),
+    (3, 'sync_tracking', migrate_sync_tracking),
+    (4, 'summary_stats', migrate_summary_stats),
+    (5, 'facets', migrate_facets),
+    (6, 'translation_sources', migrate_translation_sources),
+    (7, 'builder_tables', migrate_builder_tables),
+    (8, 'completions', migrate_completions),
+    (9, 'quiz_tables', migrate_quiz_tables),
+)
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def pending_migrations(conn, target=LATEST_VERSION):
+    current = schema_version(conn)
+    return [migration for migration in MIGRATIONS if current < migration[0] <= target]
+
+
+def migrate(conn, target=LATEST_VERSION, batch_size=BATCH_SIZE):
+    """Apply the pending migrations up to target; returns [(version, name, rows, seconds)]"""
+    applied = []
+    for version, name, step in pending_migrations(conn, target):
+        started = time.perf_counter()
+        rows = step(conn, batch_size)
+        in_transaction(conn, lambda cursor: (
+            cursor.execute('''
+            INSERT OR REPLACE INTO schema_migrations (version, name, applied_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ''', (version, name)),
+            cursor.execute(f'PRAGMA user_version = {version}')))
+        applied.append((version, name, rows, time.perf_counter() - started))
+    return applied
+
+
+def stamp_schema_version(cursor, applied_at):
+    """Mark a freshly built database as having every migration applied"""
+    create_migrations_table(cursor)
+    cursor.executemany('INSERT OR REPLACE INTO schema_migrations (version, name, applied_at) VALUES (?, ?, ?)',
+                       [(version, name, applied_at) for version, name, _ in MIGRATIONS])
+    cursor.execute(f'PRAGMA user_version = {LATEST_VERSION}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Upgrade the database schema in place')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--target', type=int, default=LATEST_VERSION, help='schema version to migrate to')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help='rows backfilled per write transaction')
+    parser.add_argument('--status', action='store_true', help='only show the current version and pending migrations')
+    args = parser.parse_args(argv)
+
+    conn = open_database(args.database)
+    if args.status:
+        print(f"📐 Schema version: {schema_version(conn)} (latest {LATEST_VERSION})")
+        for version, name, _ in pending_migrations(conn, args.target):
+            print(f"  pending: {version} {name}")
+        conn.close()
+        return 0
+
+    for version, name, rows, seconds in migrate(conn, args.target, args.batch_size):
+        print(f"🧱 Migration {version} {name}: {rows} rows backfilled in {seconds:.2f} s")
+    print(f"📐 Schema version: {schema_version(conn)}")
+    conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
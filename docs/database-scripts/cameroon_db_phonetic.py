@@ -0,0 +1,159 @@
+"""Phonetic "sounds like" index derived from the pronunciation column.
+
+Respellings such as 'mm-BOH-loh' are reduced to a key of consonant and
+vowel classes ('NBOLO'): stress, case, syllable breaks, doubled letters
+and the h of 'ah'/'oh' are dropped and similar consonants are collapsed.
+The key is stored in translations.phonetic_key, so a learner who only
+heard a word finds it with an index probe.
+"""
+import argparse
+import difflib
+import sys
+
+from cameroon_db_utils import connect, ensure_column, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+
+# Spellings are matched longest first, so digraphs win over single letters
+SOUND_CLASSES = {
+    # vowels
+    'aa': 'A', 'ah': 'A', 'a': 'A',
+    'eh': 'E', 'ay': 'E', 'ey': 'E', 'ai': 'E', 'e': 'E',
+    'ee': 'I', 'ih': 'I', 'i': 'I',
+    'oh': 'O', 'aw': 'O', 'o': 'O',
+    'oo': 'U', 'ou': 'U', 'uh': 'U', 'u': 'U',
+    # labials
+    'gb': 'B', 'kp': 'B', 'b': 'B', 'p': 'B',
+    'ph': 'F', 'f': 'F', 'v': 'F',
+    # coronals and velars
+    'd': 'D', 't': 'D', 'th': 'D',
+    'g': 'G', 'k': 'G', 'c': 'G', 'q': 'G',
+    'ts': 'S', 'dz': 'S', 's': 'S', 'z': 'S', 'x': 'S',
+    'sh': 'J', 'ch': 'J', 'zh': 'J', 'dj': 'J', 'j': 'J',
+    # nasals, liquids and glides
+    'ng': 'N', 'ny': 'N', 'm': 'N', 'n': 'N',
+    'l': 'L', 'r': 'L',
+    'w': 'W', 'y': 'Y',
+    'h': '',
+}
+LONGEST_SPELLING = max(len(spelling) for spelling in SOUND_CLASSES)
+
+
+def phonetic_key(text):
+    """Collapse a respelling (or a plain spelling) to its sound-class key"""
+    normalized = normalize_text(text)
+    if not normalized:
+        return None
+
+    codes = []
+    for syllable in normalized.split():
+        i = 0
+        while i < len(syllable):
+            for size in range(LONGEST_SPELLING, 0, -1):
+                code = SOUND_CLASSES.get(syllable[i:i + size])
+                if code is not None:
+                    i += size
+                    break
+            else:
+                code = ''
+                i += 1
+            if code and (not codes or codes[-1] != code):
+                codes.append(code)
+    return ''.join(codes) or None
+
+
+def stressed_syllable(pronunciation):
+    """Index of the upper-case (stressed) syllable, or None"""
+    if not pronunciation:
+        return None
+    for index, syllable in enumerate(pronunciation.replace(' ', '-').split('-')):
+        if syllable.isupper():
+            return index
+    return None
+
+
+def build_phonetic_index(cursor, language_ids=None, translation_ids=None):
+    ensure_column(cursor, 'translations', 'phonetic_key', 'TEXT')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_phonetic ON translations(phonetic_key)')
+
+    query = 'SELECT translation_id, pronunciation, translation FROM translations'
+    params = ()
+    if language_ids is not None:
+        query += f" WHERE language_id IN ({','.join('?' * len(language_ids))})"
+        params = tuple(language_ids)
+    elif translation_ids is not None:
+        query += f" WHERE translation_id IN ({','.join('?' * len(translation_ids))})"
+        params = tuple(translation_ids)
+    rows = cursor.execute(query, params).fetchall()
+
+    cursor.executemany('UPDATE translations SET phonetic_key = ? WHERE translation_id = ?', [
+        (phonetic_key(pronunciation or translation), translation_id)
+        for translation_id, pronunciation, translation in rows
+    ])
+
+
+def sounds_like(conn, heard, language_id=None, limit=10):
+    """Rank entries whose pronunciation sounds like what the learner heard.
+
+    Exact key matches come from a single probe of idx_translations_phonetic;
+    if there are fewer than limit, the range sharing the first sound pair is
+    scanned as well. Candidates are ordered by key similarity, with a bonus
+    when the stressed syllable matches.
+    """
+    key = phonetic_key(heard)
+    if not key:
+        return []
+
+    language_filter, params = '', []
+    if language_id is not None:
+        language_filter, params = ' AND language_id = ?', [language_id]
+
+    cursor = conn.cursor()
+    select = '''
+    SELECT translation_id, language_id, french_text, translation, pronunciation, phonetic_key
+    FROM translations
+    '''
+    candidates = cursor.execute(select + ' WHERE phonetic_key = ?' + language_filter,
+                                [key] + params).fetchall()
+    if len(candidates) < limit:
+        prefix = key[:2]
+        candidates += cursor.execute(
+            select + ' WHERE phonetic_key >= ? AND phonetic_key < ? AND phonetic_key <> ?' + language_filter,
+            [prefix, prefix + '\uffff', key] + params).fetchall()
+
+    heard_stress = stressed_syllable(heard)
+    ranked = []
+    for translation_id, language, french_text, translation, pronunciation, candidate_key in candidates:
+        score = difflib.SequenceMatcher(None, key, candidate_key).ratio()
+        if heard_stress is not None and heard_stress == stressed_syllable(pronunciation):
+            score += 0.05
+        ranked.append({
+            'translation_id': translation_id,
+            'language_id': language,
+            'french_text': french_text,
+            'translation': translation,
+            'pronunciation': pronunciation,
+            'score': round(score, 3),
+        })
+    ranked.sort(key=lambda r: (-r['score'], r['translation_id']))
+    return ranked[:limit]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Find entries that sound like a heard word')
+    parser.add_argument('heard', help="what was heard, e.g. 'mboh-loh'")
+    parser.add_argument('--language', help='restrict to one language_id')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--database', default=DATABASE_FILE)
+    args = parser.parse_args(argv)
+
+    conn = connect(args.database)
+    for match in sounds_like(conn, args.heard, args.language, args.limit):
+        print(f"  {match['score']:.3f}  [{match['language_id']}] {match['translation']} "
+              f"({match['pronunciation']}) = {match['french_text']}")
+    conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Per-stage profiling of create_database().
+
+BuildProfiler.stage() wraps one build stage and records wall and CPU
+time, rows changed, rows per second, database and WAL file sizes after
+the stage and, when memory tracking is on, the peak Python allocation
+during the stage. The report is written as JSON and as a Prometheus
+text-format file for the node exporter textfile collector.
+"""
+import contextlib
+import json
+import os
+import time
+import tracemalloc
+
+METRIC_PREFIX = 'cameroon_db_build'
+
+# (metric suffix, stage field, help text)
+STAGE_METRICS = [
+    ('stage_seconds', 'wall_seconds', 'Wall-clock time of the build stage'),
+    ('stage_cpu_seconds', 'cpu_seconds', 'Process CPU time of the build stage'),
+    ('stage_rows', 'rows', 'Rows inserted, updated or deleted by the build stage'),
+    ('stage_rows_per_second', 'rows_per_second', 'Row throughput of the build stage'),
+    ('stage_database_bytes', 'database_bytes', 'Database file size after the build stage'),
+    ('stage_wal_bytes', 'wal_bytes', 'WAL file size after the build stage'),
+    ('stage_peak_memory_bytes', 'peak_memory_bytes', 'Peak traced Python memory during the build stage'),
+]
+
+
+def file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class BuildProfiler:
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.conn = None
+        self.database_path = None
+        self.stages = []
+        self.started = time.perf_counter()
+
+    def attach(self, conn, database_path):
+        self.conn = conn
+        self.database_path = database_path
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        changes = self.conn.total_changes if self.conn else 0
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall_seconds = time.perf_counter() - wall
+            rows = (self.conn.total_changes if self.conn else 0) - changes
+            database_path = self.database_path if self.database_path != ':memory:' else None
+            self.stages.append({
+                'stage': name,
+                'wall_seconds': round(wall_seconds, 6),
+                'cpu_seconds': round(time.process_time() - cpu, 6),
+                'rows': rows,
+                'rows_per_second': round(rows / wall_seconds, 1) if wall_seconds > 0 else 0.0,
+                'database_bytes': file_size(database_path) if database_path else 0,
+                'wal_bytes': file_size(f'{database_path}-wal') if database_path else 0,
+                'peak_memory_bytes': tracemalloc.get_traced_memory()[1] if self.track_memory else None,
+            })
+
+    def report(self):
+        return {
+            'database': self.database_path,
+            'total_seconds': round(time.perf_counter() - self.started, 6),
+            'total_rows': sum(stage['rows'] for stage in self.stages),
+            'stages': self.stages,
+        }
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def prometheus_text(self):
+        lines = []
+        for suffix, field, help_text in STAGE_METRICS:
+            samples = [(stage['stage'], stage[field]) for stage in self.stages if stage[field] is not None]
+            if not samples:
+                continue
+            name = f'{METRIC_PREFIX}_{suffix}'
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            lines.extend(f'{name}{{stage="{stage}"}} {value}' for stage, value in samples)
+        report = self.report()
+        lines.append(f'# HELP {METRIC_PREFIX}_seconds Wall-clock time of the whole build')
+        lines.append(f'# TYPE {METRIC_PREFIX}_seconds gauge')
+        lines.append(f"{METRIC_PREFIX}_seconds {report['total_seconds']}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        # Write then rename so a scraping collector never reads a partial file
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(temp_path, path)
+
+    def print_summary(self):
+        print("\n⏱️  Build stages:")
+        for stage in self.stages:
+            print(f"  {stage['stage']:<24} {stage['wall_seconds'] * 1000:9.1f} ms "
+                  f"{stage['rows']:>9} rows {stage['rows_per_second']:>12.0f} rows/s")
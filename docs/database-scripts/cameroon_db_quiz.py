@@ -0,0 +1,213 @@
+"""Precomputed quiz distractors and constant-time random item sampling.
+
+Each translation gets a fixed set of wrong answers drawn from the same
+language, category and difficulty, and every translation carries a dense
+per-language random_rank so that picking a random item is one probe on
+idx_translations_random instead of an ORDER BY RANDOM() scan.
+
+Rows added or changed since the last build (contributions) are appended
+to their language's ranks by add_quiz_items(); their wrong answers are
+drawn when they are sampled until build_quiz_tables() runs again.
+"""
+import random
+
+from cameroon_db_utils import ensure_column, normalize_text
+
+DISTRACTOR_COUNT = 3
+QUIZ_SEED = 237
+# Candidates per pool read when distractors are drawn at sampling time
+POOL_SAMPLE = 32
+
+
+def create_quiz_tables(cursor):
+    ensure_column(cursor, 'translations', 'random_rank', 'INTEGER')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS quiz_distractors (
+        translation_id INTEGER NOT NULL,
+        rank INTEGER NOT NULL,
+        distractor_id INTEGER NOT NULL,
+        PRIMARY KEY (translation_id, rank),
+        FOREIGN KEY (translation_id) REFERENCES translations(translation_id),
+        FOREIGN KEY (distractor_id) REFERENCES translations(translation_id)
+    ) WITHOUT ROWID
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_random ON translations(language_id, random_rank)')
+
+
+def is_near_synonym(item, other):
+    """Same meaning or same answer once case, accents and punctuation are ignored"""
+    return item['french'] == other['french'] or item['answer'] == other['answer']
+
+
+def pick_distractors(item, pools, rng, count):
+    """Walk shuffled pools, narrowest first, until count distinct wrong answers are found"""
+    chosen, answers = [], {item['answer']}
+    for pool in pools:
+        if len(pool) < 2:
+            continue
+        start = rng.randrange(len(pool))
+        for i in range(len(pool)):
+            other = pool[(start + i) % len(pool)]
+            if other['answer'] in answers or is_near_synonym(item, other):
+                continue
+            chosen.append(other['id'])
+            answers.add(other['answer'])
+            if len(chosen) == count:
+                return chosen
+    return chosen
+
+
+def build_quiz_tables(cursor, distractor_count=DISTRACTOR_COUNT, seed=QUIZ_SEED, language_ids=None):
+    """Assign random ranks and distractor sets, per language and deterministic for a seed"""
+    create_quiz_tables(cursor)
+
+    if language_ids is None:
+        language_ids = [row[0] for row in cursor.execute(
+            'SELECT DISTINCT language_id FROM translations ORDER BY language_id')]
+
+    for language_id in language_ids:
+        rng = random.Random(f'{seed}:{language_id}')
+        cursor.execute('''
+        SELECT translation_id, french_text, translation, category_id, difficulty_level
+        FROM translations WHERE language_id = ? ORDER BY translation_id
+        ''', (language_id,))
+        items = [{
+            'id': translation_id,
+            'french': normalize_text(french_text),
+            'answer': normalize_text(translation),
+            'category': category_id,
+            'difficulty': difficulty_level,
+        } for translation_id, french_text, translation, category_id, difficulty_level in cursor.fetchall()]
+
+        ranks = list(range(len(items)))
+        rng.shuffle(ranks)
+        cursor.executemany('UPDATE translations SET random_rank = ? WHERE translation_id = ?',
+                           [(rank, item['id']) for rank, item in zip(ranks, items)])
+
+        # Candidate pools from narrowest to widest, each shuffled once
+        by_group, by_category = {}, {}
+        for item in items:
+            by_group.setdefault((item['category'], item['difficulty']), []).append(item)
+            by_category.setdefault(item['category'], []).append(item)
+        for pool in [*by_group.values(), *by_category.values()]:
+            rng.shuffle(pool)
+        whole_language = items[:]
+        rng.shuffle(whole_language)
+
+        cursor.execute('''
+        DELETE FROM quiz_distractors WHERE translation_id IN (
+            SELECT translation_id FROM translations WHERE language_id = ?
+        )
+        ''', (language_id,))
+        rows = []
+        for item in items:
+            pools = (by_group[(item['category'], item['difficulty'])],
+                     by_category[item['category']],
+                     whole_language)
+            for rank, distractor_id in enumerate(pick_distractors(item, pools, rng, distractor_count)):
+                rows.append((item['id'], rank, distractor_id))
+        cursor.executemany('''
+        INSERT INTO quiz_distractors (translation_id, rank, distractor_id)
+        VALUES (?, ?, ?)
+        ''', rows)
+
+
+def add_quiz_items(cursor, translation_ids):
+    """Rank inserted rows after their language's others and drop changed rows' distractors.
+
+    Ranks stay dense, so sampling stays uniform; the distractors are drawn
+    by draw_distractors() until the next build_quiz_tables().
+    """
+    create_quiz_tables(cursor)
+    translation_ids = sorted(set(translation_ids))
+    placeholders = ','.join('?' * len(translation_ids))
+    cursor.execute(f'DELETE FROM quiz_distractors WHERE translation_id IN ({placeholders})', translation_ids)
+    unranked = cursor.execute(f'''
+    SELECT translation_id, language_id FROM translations
+    WHERE translation_id IN ({placeholders}) AND random_rank IS NULL
+    ORDER BY translation_id
+    ''', translation_ids).fetchall()
+    next_rank = {}
+    for language_id in sorted({language_id for _, language_id in unranked}):
+        top = cursor.execute('SELECT MAX(random_rank) FROM translations WHERE language_id = ?',
+                             (language_id,)).fetchone()[0]
+        next_rank[language_id] = 0 if top is None else top + 1
+    ranks = []
+    for translation_id, language_id in unranked:
+        ranks.append((next_rank[language_id], translation_id))
+        next_rank[language_id] += 1
+    cursor.executemany('UPDATE translations SET random_rank = ? WHERE translation_id = ?', ranks)
+
+
+def draw_distractors(cursor, translation_id, rng=random, count=DISTRACTOR_COUNT):
+    """Wrong answers for a row without precomputed ones, from a sample of the same pools"""
+    language_id, french_text, translation, category_id, difficulty_level = cursor.execute('''
+    SELECT language_id, french_text, translation, category_id, difficulty_level
+    FROM translations WHERE translation_id = ?
+    ''', (translation_id,)).fetchone()
+    item = {'id': translation_id, 'french': normalize_text(french_text), 'answer': normalize_text(translation)}
+    pools, answers = [], {}
+    for condition, params in (('category_id IS ? AND difficulty_level IS ?', (category_id, difficulty_level)),
+                              ('category_id IS ?', (category_id,)),
+                              ('1', ())):
+        pool = []
+        for other_id, other_french, other_translation in cursor.execute(f'''
+        SELECT translation_id, french_text, translation FROM translations
+        WHERE language_id = ? AND {condition} AND translation_id <> ?
+        ORDER BY random_rank LIMIT ?
+        ''', (language_id, *params, translation_id, POOL_SAMPLE)).fetchall():
+            answers[other_id] = other_translation
+            pool.append({'id': other_id, 'french': normalize_text(other_french),
+                         'answer': normalize_text(other_translation)})
+        pools.append(pool)
+    return [answers[other_id] for other_id in pick_distractors(item, pools, rng, count)]
+
+
+def sample_quiz_item(conn, language_id, rng=random):
+    """Random translation with its distractors, using two index probes.
+
+    Ranks left unused by deleted rows are skipped: the first rank at or
+    after the drawn one is taken, wrapping around to the lowest. Returns
+    None when the language has no translations.
+    """
+    cursor = conn.cursor()
+    cursor.execute('SELECT MAX(random_rank) FROM translations WHERE language_id = ?', (language_id,))
+    top = cursor.fetchone()[0]
+    if top is None:
+        return None
+
+    row = None
+    for rank in (rng.randint(0, top), 0):
+        cursor.execute('''
+        SELECT translation_id, french_text, translation, pronunciation
+        FROM translations WHERE language_id = ? AND random_rank >= ?
+        ORDER BY random_rank LIMIT 1
+        ''', (language_id, rank))
+        row = cursor.fetchone()
+        if row is not None:
+            break
+    else:
+        return None
+    translation_id, french_text, answer, pronunciation = row
+
+    cursor.execute('''
+    SELECT d.translation
+    FROM quiz_distractors q
+    JOIN translations d ON d.translation_id = q.distractor_id
+    WHERE q.translation_id = ?
+    ORDER BY q.rank
+    ''', (translation_id,))
+    distractors = [row[0] for row in cursor.fetchall()]
+    if not distractors:
+        # Added since the last build_quiz_tables()
+        distractors = draw_distractors(cursor, translation_id, rng)
+    choices = [answer] + distractors
+    rng.shuffle(choices)
+
+    return {
+        'translation_id': translation_id,
+        'question': french_text,
+        'answer': answer,
+        'pronunciation': pronunciation,
+        'choices': choices,
+    }
@@ -0,0 +1,146 @@
+"""Hot reload of the published database for long-running readers.
+
+create_cameroon_db.py publishes a build by renaming a verified file over
+the old one. An open connection keeps reading the old, unlinked file, so
+a reader would otherwise need a restart to see new data.
+
+ReloadingDatabase serves each request from one read-only connection and
+checks, before a request starts, whether the path now names another file
+(one stat(): device and inode). If it does, and the new file's
+build_metadata says the build is complete, the new file is opened and
+swapped in, and the old connection is closed. No request is in flight
+at that point, so none sees two versions or waits on a restart.
+
+Commits made in place (contributions, migrations) are already visible to
+the open connection; PRAGMA data_version tells them apart, so generation
+counts both kinds of change for callers that cache query results.
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+from cameroon_db_utils import connect
+
+DATABASE_FILE = 'cameroon_languages.db'
+POLL_INTERVAL_S = 1.0
+
+
+def file_identity(path):
+    """(device, inode) of the file at path, or None when there is none"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def read_metadata(conn):
+    try:
+        return dict(conn.execute('SELECT key, value FROM build_metadata'))
+    except conn.DatabaseError:
+        return {}
+
+
+class ReloadingDatabase:
+    """Read-only access to path that follows atomic republishes between requests.
+
+    Not thread-safe, like the sqlite3 connection it wraps: use one per
+    thread or worker.
+    """
+
+    def __init__(self, path=DATABASE_FILE, on_reload=None):
+        self.path = path
+        self.on_reload = on_reload
+        self.conn = None
+        self.identity = None
+        self.metadata = {}
+        self.data_version = None
+        self.generation = 0
+        self.active = 0
+        if not self.reload():
+            raise FileNotFoundError(f'no complete database at {path}')
+
+    @property
+    def version(self):
+        """(built_at, input_fingerprint) of the build being served"""
+        return self.metadata.get('built_at'), self.metadata.get('input_fingerprint')
+
+    def reload(self):
+        """Swap in the file now at path if it is a new, complete build; True if swapped"""
+        identity = file_identity(self.path)
+        if identity is None or identity == self.identity:
+            return False
+        conn = connect(f'file:{self.path}?mode=ro', uri=True)
+        metadata = read_metadata(conn)
+        if metadata.get('build_state') == 'in_progress':
+            conn.close()
+            return False
+        old, self.conn = self.conn, conn
+        self.identity, self.metadata = identity, metadata
+        self.data_version = conn.execute('PRAGMA data_version').fetchone()[0]
+        self.generation += 1
+        if old is not None:
+            old.close()
+        if self.on_reload:
+            self.on_reload(self)
+        return True
+
+    def refresh(self):
+        """Pick up a republished file or in-place commits; True if anything changed"""
+        if self.reload():
+            return True
+        data_version = self.conn.execute('PRAGMA data_version').fetchone()[0]
+        if data_version == self.data_version:
+            return False
+        self.data_version = data_version
+        self.metadata = read_metadata(self.conn)
+        self.generation += 1
+        return True
+
+    @contextlib.contextmanager
+    def request(self):
+        """The connection to serve one request with; reloads only between requests"""
+        if self.active == 0:
+            self.refresh()
+        self.active += 1
+        try:
+            yield self.conn
+        finally:
+            self.active -= 1
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Follow republished versions of the database')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL_S, help='seconds between checks')
+    args = parser.parse_args(argv)
+
+    def report(db):
+        with db.request() as conn:
+            count = conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+        built_at, fingerprint = db.version
+        print(f"🔄 Serving build {(fingerprint or '?')[:12]} from {built_at}: {count} translations")
+
+    db = ReloadingDatabase(args.database)
+    report(db)
+    db.on_reload = report
+    try:
+        while True:
+            time.sleep(args.interval)
+            with db.request():
+                pass
+    except KeyboardInterrupt:
+        pass
+    db.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Offline similarity search over the French side of translations.
+
+Every French phrase becomes a fixed-width vector by feature hashing: the
+content words of its normalized text and the character 3- and 4-grams of
+each are hashed (CRC-32, signed) into DIM buckets and the row is
+L2-normalized. Function words are left out unless a phrase has nothing
+else, so "je voudrais de l'aide" is matched on "aide" and shares the
+n-grams of "aid" with "Pouvez-vous m'aider?".
+
+A French gloss usually exists in several languages, so each distinct
+normalized text is vectorized once. The index is four files:
+
+    <prefix>.vectors.npy   float32 matrix, one row per distinct French text
+    <prefix>.ids.npy       translation_id of every translation, by language
+    <prefix>.rows.npy      vector row of each of those translations
+    <prefix>.json          dimensions and the range of each language in ids
+
+A query memory-maps the matrix, scores every distinct text with one
+matrix-vector product, gathers the scores of the requested language's
+translations and selects the top k with argpartition.
+
+Requires NumPy.
+"""
+import argparse
+import functools
+import json
+import os
+import sys
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('cameroon_db_similarity requires NumPy (pip install numpy)') from None
+
+from cameroon_db_utils import connect, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+INDEX_PREFIX = 'cameroon_similarity'
+DIM = 256
+NGRAM_SIZES = (3, 4)
+TOP_K = 10
+CHUNK_SIZE = 100000
+FUNCTION_WORDS = frozenset("""
+    a ai as au aux avec avez c ce d de des du elle elles en es est et il ils j je l la le les leur leurs
+    m ma me mes mon n ne nos notre nous on ou pas peux pour pouvez qu que qui s sa se ses son sont suis
+    sur t ta te tes ton tu un une veux voudrais vos votre vous y
+""".split())
+
+
+def features(text):
+    """Content words of the normalized text and the character n-grams of each"""
+    words = (normalize_text(text) or '').split()
+    words = [word for word in words if word not in FUNCTION_WORDS] or words
+    for word in words:
+        yield f'w:{word}'
+        padded = f' {word} '
+        for n in NGRAM_SIZES:
+            for i in range(len(padded) - n + 1):
+                yield padded[i:i + n]
+
+
+@functools.lru_cache(maxsize=1 << 18)
+def hash_feature(feature, dim):
+    """(column, sign) of a feature; CRC-32 keeps it stable across processes"""
+    h = zlib.crc32(feature.encode('utf-8'))
+    return h % dim, 1.0 if h & 0x80000000 else -1.0
+
+
+def vectorize(texts, dim=DIM):
+    """L2-normalized hashed feature vectors, one float32 row per text"""
+    rows, columns, signs = [], [], []
+    for row, text in enumerate(texts):
+        for feature in features(text):
+            column, sign = hash_feature(feature, dim)
+            rows.append(row)
+            columns.append(column)
+            signs.append(sign)
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    np.add.at(matrix, (np.array(rows, dtype=np.intp), np.array(columns, dtype=np.intp)),
+              np.array(signs, dtype=np.float32))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def build_similarity_index(conn, prefix=INDEX_PREFIX, dim=DIM, chunk_size=CHUNK_SIZE):
+    """Vectorize the distinct French texts into the index files; returns (translations, vectors)"""
+    cursor = conn.cursor()
+    cursor.execute('''
+    SELECT translation_id, language_id, french_text
+    FROM translations
+    ORDER BY language_id, translation_id
+    ''')
+    ids, rows, texts, row_of, languages = [], [], [], {}, {}
+    for translation_id, language_id, french_text in cursor:
+        key = normalize_text(french_text)
+        row = row_of.get(key)
+        if row is None:
+            row = row_of[key] = len(texts)
+            texts.append(french_text)
+        languages.setdefault(language_id, [len(ids), len(ids)])[1] = len(ids) + 1
+        ids.append(translation_id)
+        rows.append(row)
+
+    vectors_path = f'{prefix}.vectors.npy'
+    vectors = np.lib.format.open_memmap(f'{vectors_path}.tmp', mode='w+', dtype=np.float32, shape=(len(texts), dim))
+    for start in range(0, len(texts), chunk_size):
+        vectors[start:start + chunk_size] = vectorize(texts[start:start + chunk_size], dim)
+    vectors.flush()
+    del vectors
+    os.replace(f'{vectors_path}.tmp', vectors_path)
+    for name, values, dtype in (('ids', ids, np.int64), ('rows', rows, np.int32)):
+        with open(f'{prefix}.{name}.npy.tmp', 'wb') as f:
+            np.save(f, np.array(values, dtype=dtype))
+        os.replace(f'{prefix}.{name}.npy.tmp', f'{prefix}.{name}.npy')
+    with open(f'{prefix}.json.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'translations': len(ids), 'vectors': len(texts), 'dim': dim,
+                   'ngram_sizes': list(NGRAM_SIZES), 'languages': languages}, f, indent=2)
+    os.replace(f'{prefix}.json.tmp', f'{prefix}.json')
+    return len(ids), len(texts)
+
+
+class SimilarityIndex:
+    """Memory-mapped view over the index files"""
+
+    def __init__(self, prefix=INDEX_PREFIX):
+        with open(f'{prefix}.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        self.dim = meta['dim']
+        self.languages = {language_id: tuple(bounds) for language_id, bounds in meta['languages'].items()}
+        self.vectors = np.load(f'{prefix}.vectors.npy', mmap_mode='r')
+        self.ids = np.load(f'{prefix}.ids.npy', mmap_mode='r')
+        self.rows = np.load(f'{prefix}.rows.npy', mmap_mode='r')
+
+    def search(self, query, language_id=None, k=TOP_K):
+        """[(translation_id, score)] of the k closest French texts, best first"""
+        start, end = self.languages.get(language_id, (0, 0)) if language_id else (0, len(self.ids))
+        if end <= start:
+            return []
+        text_scores = self.vectors @ vectorize([query], self.dim)[0]
+        scores = text_scores[self.rows[start:end]]
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(int(self.ids[start + i]), float(scores[i])) for i in top]
+
+
+def similar_phrases(conn, index, query, language_id=None, k=TOP_K):
+    """search() results joined with their translation rows"""
+    matches = index.search(query, language_id, k)
+    if not matches:
+        return []
+    rows = {row[0]: row for row in conn.execute(f'''
+    SELECT translation_id, language_id, french_text, translation, pronunciation
+    FROM translations WHERE translation_id IN ({','.join('?' * len(matches))})
+    ''', [translation_id for translation_id, _ in matches])}
+    return [{
+        'translation_id': translation_id,
+        'score': round(score, 4),
+        'language_id': rows[translation_id][1],
+        'french_text': rows[translation_id][2],
+        'translation': rows[translation_id][3],
+        'pronunciation': rows[translation_id][4],
+    } for translation_id, score in matches if translation_id in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build or query the n-gram similarity index')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--index', default=INDEX_PREFIX, help='path prefix of the index files')
+    parser.add_argument('--dim', type=int, default=DIM)
+    parser.add_argument('--query', help='French phrase to look up instead of building')
+    parser.add_argument('--language', help='restrict the search to one language_id')
+    parser.add_argument('-k', type=int, default=TOP_K)
+    args = parser.parse_args(argv)
+
+    conn = connect(args.database)
+    if args.query:
+        for match in similar_phrases(conn, SimilarityIndex(args.index), args.query, args.language, args.k):
+            print(f"  {match['score']:.3f}  [{match['language_id']}] {match['french_text']} -> "
+                  f"{match['translation']} ({match['pronunciation']})")
+    else:
+        translations, vectors = build_similarity_index(conn, args.index, args.dim)
+        print(f"🧭 Similarity index: {translations} translations, {vectors} distinct French texts "
+              f"written to {args.index}.vectors.npy")
+    conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
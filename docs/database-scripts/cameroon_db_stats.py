@@ -0,0 +1,203 @@
+"""Summary tables for the statistics the app and dashboards display.
+
+language_stats     words and lessons per language (every language, 0 included)
+translation_stats  words per language x category x difficulty
+lesson_stats       lessons per language x level
+
+The builder fills them once after loading. From then on, triggers on
+languages, translations and lessons adjust the counts row by row, so
+contributions and other edits keep them current. A stats read is a
+primary-key lookup instead of a scan and GROUP BY.
+
+A NULL category_id or difficulty_level is counted under ''.
+"""
+import argparse
+import sys
+
+from cameroon_db_utils import connect
+
+DATABASE_FILE = 'cameroon_languages.db'
+
+# Full recomputation, also used to check the trigger-maintained counts
+STATS_QUERIES = {
+    'language_stats': '''
+    SELECT l.language_id,
+           (SELECT COUNT(*) FROM translations t WHERE t.language_id = l.language_id),
+           (SELECT COUNT(*) FROM lessons s WHERE s.language_id = l.language_id)
+    FROM languages l
+    ''',
+    'translation_stats': '''
+    SELECT language_id, IFNULL(category_id, ''), IFNULL(difficulty_level, ''), COUNT(*)
+    FROM translations
+    WHERE language_id IS NOT NULL
+    GROUP BY 1, 2, 3
+    ''',
+    'lesson_stats': '''
+    SELECT language_id, level, COUNT(*)
+    FROM lessons
+    GROUP BY 1, 2
+    ''',
+}
+
+
+def translation_delta(row, sign):
+    """Trigger statements adding sign to the counts of translation row OLD or NEW"""
+    operator = '+' if sign > 0 else '-'
+    return f'''
+        UPDATE language_stats SET word_count = word_count {operator} 1 WHERE language_id = {row}.language_id;
+        INSERT INTO translation_stats (language_id, category_id, difficulty_level, word_count)
+        SELECT {row}.language_id, IFNULL({row}.category_id, ''), IFNULL({row}.difficulty_level, ''), {max(sign, 0)}
+        WHERE {row}.language_id IS NOT NULL
+        ON CONFLICT (language_id, category_id, difficulty_level) DO UPDATE SET word_count = word_count {operator} 1;
+        DELETE FROM translation_stats
+        WHERE language_id = {row}.language_id AND category_id = IFNULL({row}.category_id, '')
+          AND difficulty_level = IFNULL({row}.difficulty_level, '') AND word_count = 0;'''
+
+
+def lesson_delta(row, sign):
+    """Trigger statements adding sign to the counts of lesson row OLD or NEW"""
+    operator = '+' if sign > 0 else '-'
+    return f'''
+        UPDATE language_stats SET lesson_count = lesson_count {operator} 1 WHERE language_id = {row}.language_id;
+        INSERT INTO lesson_stats (language_id, level, lesson_count)
+        VALUES ({row}.language_id, {row}.level, {max(sign, 0)})
+        ON CONFLICT (language_id, level) DO UPDATE SET lesson_count = lesson_count {operator} 1;
+        DELETE FROM lesson_stats
+        WHERE language_id = {row}.language_id AND level = {row}.level AND lesson_count = 0;'''
+
+
+STATS_TRIGGERS = {
+    'trg_languages_stats_insert': '''
+    AFTER INSERT ON languages BEGIN
+        INSERT OR IGNORE INTO language_stats (language_id, word_count, lesson_count)
+        VALUES (NEW.language_id, 0, 0);
+    END''',
+    'trg_languages_stats_delete': '''
+    AFTER DELETE ON languages BEGIN
+        DELETE FROM language_stats WHERE language_id = OLD.language_id;
+    END''',
+    'trg_translations_stats_insert': f'''
+    AFTER INSERT ON translations BEGIN{translation_delta('NEW', 1)}
+    END''',
+    'trg_translations_stats_delete': f'''
+    AFTER DELETE ON translations BEGIN{translation_delta('OLD', -1)}
+    END''',
+    'trg_translations_stats_update': f'''
+    AFTER UPDATE OF language_id, category_id, difficulty_level ON translations BEGIN{translation_delta('OLD', -1)}{translation_delta('NEW', 1)}
+    END''',
+    'trg_lessons_stats_insert': f'''
+    AFTER INSERT ON lessons BEGIN{lesson_delta('NEW', 1)}
+    END''',
+    'trg_lessons_stats_delete': f'''
+    AFTER DELETE ON lessons BEGIN{lesson_delta('OLD', -1)}
+    END''',
+    'trg_lessons_stats_update': f'''
+    AFTER UPDATE OF language_id, level ON lessons BEGIN{lesson_delta('OLD', -1)}{lesson_delta('NEW', 1)}
+    END''',
+}
+
+
+def create_stats_tables(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS language_stats (
+        language_id VARCHAR(10) PRIMARY KEY,
+        word_count INTEGER NOT NULL DEFAULT 0,
+        lesson_count INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS translation_stats (
+        language_id VARCHAR(10) NOT NULL,
+        category_id VARCHAR(10) NOT NULL,
+        difficulty_level TEXT NOT NULL,
+        word_count INTEGER NOT NULL,
+        PRIMARY KEY (language_id, category_id, difficulty_level)
+    ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS lesson_stats (
+        language_id VARCHAR(10) NOT NULL,
+        level TEXT NOT NULL,
+        lesson_count INTEGER NOT NULL,
+        PRIMARY KEY (language_id, level)
+    ) WITHOUT ROWID
+    ''')
+    for name, body in STATS_TRIGGERS.items():
+        cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {body}')
+
+
+def build_stats(cursor):
+    """Create the stats tables and triggers and recompute every count"""
+    create_stats_tables(cursor)
+    for table, query in STATS_QUERIES.items():
+        cursor.execute(f'DELETE FROM {table}')
+        cursor.execute(f'INSERT INTO {table} {query}')
+
+
+def stats_drift(cursor):
+    """{table: rows that differ from a full recomputation}; empty when the counts are current"""
+    drift = {}
+    for table, query in STATS_QUERIES.items():
+        rows = cursor.execute(f'''
+        SELECT 'missing', * FROM ({query} EXCEPT SELECT * FROM {table})
+        UNION ALL
+        SELECT 'stale', * FROM (SELECT * FROM {table} EXCEPT {query})
+        ''').fetchall()
+        if rows:
+            drift[table] = rows
+    return drift
+
+
+def word_counts(conn):
+    """[(language_name, word_count)] by descending count"""
+    return conn.execute('''
+    SELECT l.language_name, s.word_count
+    FROM language_stats s
+    JOIN languages l ON l.language_id = s.language_id
+    ORDER BY s.word_count DESC, l.language_name
+    ''').fetchall()
+
+
+def language_breakdown(conn, language_id):
+    """{(category_id, difficulty_level): word_count} for one language"""
+    return {(category_id, difficulty): count for category_id, difficulty, count in conn.execute('''
+    SELECT category_id, difficulty_level, word_count
+    FROM translation_stats WHERE language_id = ?
+    ''', (language_id,))}
+
+
+def lessons_per_level(conn, language_id=None):
+    """{level: lesson_count}, for one language or summed over all"""
+    if language_id is not None:
+        return dict(conn.execute('SELECT level, lesson_count FROM lesson_stats WHERE language_id = ?',
+                                 (language_id,)))
+    return dict(conn.execute('SELECT level, SUM(lesson_count) FROM lesson_stats GROUP BY level'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Show or rebuild the summary statistics tables')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--rebuild', action='store_true', help='recompute every count from the base tables')
+    parser.add_argument('--check', action='store_true', help='exit nonzero if a count differs from a recomputation')
+    args = parser.parse_args(argv)
+
+    conn = connect(args.database)
+    if args.rebuild:
+        build_stats(conn.cursor())
+        conn.commit()
+    if args.check:
+        drift = stats_drift(conn.cursor())
+        conn.close()
+        for table, rows in drift.items():
+            print(f"❌ {table}: {len(rows)} row(s) out of date")
+        return 1 if drift else 0
+
+    for language_name, count in word_counts(conn):
+        print(f"  {language_name}: {count} words")
+    print(f"  Lessons per level: {lessons_per_level(conn)}")
+    conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""Compact in-process dictionary store.
+
+A service holding the dictionary as a list of dicts pays several hundred
+bytes per entry: a dict and a str object for every field. DictionaryStore
+keeps the translations table in a few flat arrays instead:
+
+    pool, pool_offsets     every distinct string once, UTF-8 encoded, each
+                           followed by a separator, and the n + 1 offsets
+                           of the strings in pool
+    translation_id         int32, ascending; row numbers follow it
+    <text column>          int32 string ids into the pool (-1 for NULL)
+    <coded column>         int8 codes into codes[column] (-1 for NULL)
+    french_index,          int32 row numbers sorted by (language_id,
+    local_index            french_norm) and (language_id, translation_norm)
+
+Every column comes out of SQLite in one scan, as one group_concat string
+per column, and is split and interned with dict operations, so no Python
+object per row outlives the load; the index orders are read the same way
+from idx_translations_french_norm and idx_translations_translation_norm.
+
+Lookups find the language's block of an index from language_bounds and
+binary-search it, normalizing the few pool strings they compare (the
+normalized columns are not kept). SQLite sorts text by its UTF-8 bytes,
+which is the order Python compares str in.
+
+Interning a million rows still takes a few seconds, so save() writes the
+arrays to an uncompressed .npz that load() reads back in tens of
+milliseconds. open_store() keeps such a snapshot next to the database
+and uses it while its data_version still matches: the build's
+input_fingerprint plus what in-place commits change (the row count, the
+latest updated_at and the latest tombstone).
+
+Requires NumPy.
+"""
+import argparse
+import bisect
+import itertools
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('cameroon_db_store requires NumPy (pip install numpy)') from None
+
+from cameroon_db_utils import connect, normalize_text
+
+DATABASE_FILE = 'cameroon_languages.db'
+SNAPSHOT_SUFFIX = '.store.npz'
+TEXT_COLUMNS = ('french_text', 'translation', 'pronunciation')
+CODED_COLUMNS = ('language_id', 'category_id', 'difficulty_level')
+ENTRY_COLUMNS = ('translation_id', 'language_id', 'french_text', 'translation', 'pronunciation',
+                 'category_id', 'difficulty_level')
+LEVELS = ('beginner', 'intermediate', 'advanced')
+# Control characters never found in dictionary text
+SEPARATOR = '\x1f'
+NULL = '\x1e'
+
+
+def concatenated(conn, expressions, order='translation_id'):
+    """[values of each expression over translations in order], from one scan"""
+    aggregates = ', '.join(f"group_concat(IFNULL({expression}, char({ord(NULL)})), char({ord(SEPARATOR)}))"
+                           for expression in expressions)
+    row = conn.execute(f'''
+    SELECT COUNT(*), {aggregates} FROM (SELECT {', '.join(expressions)} FROM translations ORDER BY {order})
+    ''').fetchone()
+    count, texts = row[0], row[1:]
+    columns = [text.split(SEPARATOR) if text is not None else [] for text in texts]
+    for expression, values in zip(expressions, columns):
+        if len(values) != count:
+            raise ValueError(f'translations.{expression} contains the separator {SEPARATOR!r}')
+    return columns
+
+
+def integers(conn, order):
+    """translation_id of every translation, in order"""
+    text = conn.execute(f'''
+    SELECT group_concat(translation_id) FROM (SELECT translation_id FROM translations ORDER BY {order})
+    ''').fetchone()[0]
+    return np.fromstring(text or '', dtype=np.int64, sep=',')
+
+
+def data_version(conn):
+    """Changes with every build and every in-place write to translations"""
+    fingerprint = conn.execute("SELECT value FROM build_metadata WHERE key = 'input_fingerprint'").fetchone()
+    count, updated_at = conn.execute('SELECT COUNT(*), MAX(updated_at) FROM translations').fetchone()
+    deleted_at = conn.execute(
+        "SELECT MAX(deleted_at) FROM sync_tombstones WHERE entity = 'translations'").fetchone()[0]
+    return f"{fingerprint[0] if fingerprint else ''}|{count}|{updated_at}|{deleted_at}"
+
+
+def encode_codes(values, dictionary):
+    """int8 codes of values in dictionary, -1 for NULL"""
+    index = dict(zip(dictionary, itertools.count()))
+    index[NULL] = -1
+    return np.fromiter(map(index.__getitem__, values), dtype=np.int8, count=len(values))
+
+
+class DictionaryStore:
+    """Read-only column store of the translations table"""
+
+    def __init__(self, arrays, codes, metadata=None):
+        self.arrays = arrays
+        self.codes = codes
+        self.metadata = metadata or {}
+        self.pool = arrays['pool'].tobytes()
+        self.pool_offsets = arrays['pool_offsets']
+        self.translation_id = arrays['translation_id']
+        self.french_index = arrays['french_index']
+        self.local_index = arrays['local_index']
+        # Both indexes sort by language code first, so they share the blocks
+        counts = np.bincount(arrays['language_id'].astype(np.int64) + 1, minlength=len(codes['language_id']) + 1)
+        self.language_bounds = np.concatenate(([0], np.cumsum(counts))).tolist()
+
+    @classmethod
+    def from_database(cls, conn):
+        codes = {
+            'language_id': [row[0] for row in conn.execute(
+                'SELECT DISTINCT language_id FROM translations WHERE language_id IS NOT NULL ORDER BY 1')],
+            'category_id': [row[0] for row in conn.execute(
+                'SELECT DISTINCT category_id FROM translations WHERE category_id IS NOT NULL ORDER BY 1')],
+            'difficulty_level': list(LEVELS),
+        }
+        arrays = {}
+        columns = concatenated(conn, CODED_COLUMNS + TEXT_COLUMNS)
+        for column in CODED_COLUMNS:
+            arrays[column] = encode_codes(columns.pop(0), codes[column])
+
+        # One pool for every text column; NULL takes id 0 and is shifted to -1
+        texts = columns
+        interned = dict(zip(dict.fromkeys(itertools.chain([NULL], *texts)), itertools.count(-1)))
+        for column, values in zip(TEXT_COLUMNS, texts):
+            arrays[column] = np.fromiter(map(interned.__getitem__, values), dtype=np.int32, count=len(values))
+        del texts
+        strings = list(interned)[1:]
+        del interned
+        pool = np.frombuffer(''.join(string + SEPARATOR for string in strings).encode('utf-8'), dtype=np.uint8)
+        del strings
+        ends = np.flatnonzero(pool == ord(SEPARATOR))
+        arrays['pool'] = pool
+        arrays['pool_offsets'] = np.concatenate(([0], ends + 1)).astype(np.int64)
+
+        ids = integers(conn, 'translation_id')
+        arrays['translation_id'] = ids.astype(np.int32)
+        for name, column in (('french_index', 'french_norm'), ('local_index', 'translation_norm')):
+            order = integers(conn, f'language_id, {column}, translation_id')
+            arrays[name] = np.searchsorted(ids, order).astype(np.int32)
+
+        metadata = dict(conn.execute('SELECT key, value FROM build_metadata'))
+        metadata['data_version'] = data_version(conn)
+        return cls(arrays, codes, metadata)
+
+    def save(self, path):
+        extra = {f'codes.{column}': np.array(values, dtype=str) for column, values in self.codes.items()}
+        keys = sorted(self.metadata)
+        extra['metadata.keys'] = np.array(keys, dtype=str)
+        extra['metadata.values'] = np.array([self.metadata[key] or '' for key in keys], dtype=str)
+        with open(f'{path}.tmp', 'wb') as f:
+            np.savez(f, **self.arrays, **extra)
+        os.replace(f'{path}.tmp', path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+        codes = {name.split('.', 1)[1]: arrays.pop(name).tolist() for name in list(arrays)
+                 if name.startswith('codes.')}
+        metadata = dict(zip(arrays.pop('metadata.keys').tolist(), arrays.pop('metadata.values').tolist()))
+        return cls(arrays, codes, metadata)
+
+    def __len__(self):
+        return len(self.translation_id)
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in self.arrays.values())
+
+    def string(self, string_id):
+        if string_id < 0:
+            return None
+        return self.pool[self.pool_offsets[string_id]:self.pool_offsets[string_id + 1] - 1].decode('utf-8')
+
+    def decode(self, column, row):
+        code = self.arrays[column][row]
+        if column in self.codes:
+            return self.codes[column][code] if code >= 0 else None
+        return self.string(code)
+
+    def entry(self, row):
+        return {'translation_id': int(self.translation_id[row]),
+                **{column: self.decode(column, row) for column in ENTRY_COLUMNS[1:]}}
+
+    def get(self, translation_id):
+        """The entry with this translation_id, or None"""
+        row = int(np.searchsorted(self.translation_id, translation_id))
+        if row < len(self) and self.translation_id[row] == translation_id:
+            return self.entry(row)
+        return None
+
+    def _search(self, index, column, language_id, text):
+        """Entries of language_id whose column matches text once both are normalized"""
+        try:
+            code = self.codes['language_id'].index(language_id)
+        except ValueError:
+            return []
+        low, high = self.language_bounds[code + 1], self.language_bounds[code + 2]
+        ids = self.arrays[column]
+        key = normalize_text(text)
+        compare = lambda row: normalize_text(self.string(ids[row])) or ''
+        start = bisect.bisect_left(index, key, low, high, key=compare)
+        end = bisect.bisect_right(index, key, start, high, key=compare)
+        return [self.entry(row) for row in index[start:end]]
+
+    def lookup_french(self, language_id, french_text):
+        """Translations of a French phrase into language_id"""
+        return self._search(self.french_index, 'french_text', language_id, french_text)
+
+    def lookup_local(self, language_id, translation):
+        """French meanings of a word or phrase in language_id"""
+        return self._search(self.local_index, 'translation', language_id, translation)
+
+    def rows(self, language_id=None, category_id=None, difficulty_level=None):
+        """Row numbers matching every given code value, as an array"""
+        mask = np.ones(len(self), dtype=bool)
+        for column, value in (('language_id', language_id), ('category_id', category_id),
+                              ('difficulty_level', difficulty_level)):
+            if value is not None:
+                code = self.codes[column].index(value) if value in self.codes[column] else -2
+                mask &= self.arrays[column] == code
+        return np.flatnonzero(mask)
+
+
+def open_store(database=DATABASE_FILE, snapshot=None):
+    """DictionaryStore of database, from its snapshot while that is current"""
+    snapshot = snapshot or database + SNAPSHOT_SUFFIX
+    conn = connect(f'file:{database}?mode=ro', uri=True)
+    if os.path.exists(snapshot):
+        store = DictionaryStore.load(snapshot)
+        if store.metadata.get('data_version') == data_version(conn):
+            conn.close()
+            return store
+    store = DictionaryStore.from_database(conn)
+    conn.close()
+    store.save(snapshot)
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load the dictionary into compact arrays')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--snapshot', help=f'snapshot file (default: <database>{SNAPSHOT_SUFFIX})')
+    parser.add_argument('--lookup', nargs=2, metavar=('LANGUAGE_ID', 'TEXT'),
+                        help='look TEXT up in both directions')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    store = open_store(args.database, args.snapshot)
+    print(f"🧊 Store: {len(store)} entries in {store.nbytes / 2**20:.1f} MB, "
+          f"loaded in {time.perf_counter() - started:.2f} s")
+    if args.lookup:
+        language_id, text = args.lookup
+        for entry in store.lookup_french(language_id, text) + store.lookup_local(language_id, text):
+            print(f"  {entry['french_text']} -> {entry['translation']} ({entry['pronunciation']})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
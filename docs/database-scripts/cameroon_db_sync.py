@@ -0,0 +1,193 @@
+"""Incremental "changes since" feed for the app's sync manager.
+
+translations and lessons get an updated_at column (UTC, millisecond
+precision) maintained by triggers: set on insert, bumped when a content
+column changes. Deleted rows leave a tombstone in sync_tombstones. Only
+content columns count as changes, so rebuilding derived columns (quiz
+ranks, normalized text, phonetic keys) does not resend whole languages.
+
+A sync cursor is the (updated_at, id) of the last change a client has
+seen. changes_since() returns the next page in that order with a keyset
+range scan on the (updated_at, id) indexes, so a sync costs what has
+changed since the cursor, not the size of the tables. Writes are
+serialized by SQLite and stamped inside their transaction, so a change
+committed after a page was read always sorts after that page's cursor
+(assuming the server clock does not step backwards).
+
+That only holds within one build. A rebuild stamps every row afresh (a
+reproducible one with a fixed time) and leaves no tombstones for the
+rows it dropped, so cursors carry the build's sync_epoch (from
+build_metadata; in-place writers keep it). A cursor from another build
+restarts the feed from the beginning with reset set, and the client
+drops what it synced before applying it.
+"""
+import argparse
+import heapq
+import json
+import sys
+
+from cameroon_db_utils import connect, ensure_column
+
+DATABASE_FILE = 'cameroon_languages.db'
+PAGE_SIZE = 500
+NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+START_CURSOR = ('', 0)
+
+# entity: (id column, columns sent to clients)
+SYNC_ENTITIES = {
+    'translations': ('translation_id', ('french_text', 'language_id', 'translation', 'category_id',
+                                        'pronunciation', 'usage_notes', 'difficulty_level')),
+    'lessons': ('lesson_id', ('language_id', 'title', 'content', 'level', 'order_index',
+                              'audio_url', 'video_url')),
+}
+
+
+def sync_triggers(entity):
+    id_column, columns = SYNC_ENTITIES[entity]
+    return {
+        f'trg_{entity}_sync_insert': f'''
+        AFTER INSERT ON {entity} BEGIN
+            UPDATE {entity} SET updated_at = {NOW}
+            WHERE {id_column} = NEW.{id_column} AND NEW.updated_at IS NULL;
+            DELETE FROM sync_tombstones WHERE entity = '{entity}' AND entity_id = NEW.{id_column};
+        END''',
+        f'trg_{entity}_sync_update': f'''
+        AFTER UPDATE OF {', '.join(columns)} ON {entity} BEGIN
+            UPDATE {entity} SET updated_at = {NOW} WHERE {id_column} = NEW.{id_column};
+        END''',
+        f'trg_{entity}_sync_delete': f'''
+        AFTER DELETE ON {entity} BEGIN
+            INSERT OR REPLACE INTO sync_tombstones (entity, entity_id, deleted_at)
+            VALUES ('{entity}', OLD.{id_column}, {NOW});
+        END''',
+    }
+
+
+def create_tombstone_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS sync_tombstones (
+        entity TEXT NOT NULL,
+        entity_id INTEGER NOT NULL,
+        deleted_at TEXT NOT NULL,
+        PRIMARY KEY (entity, entity_id)
+    ) WITHOUT ROWID
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_sync_tombstones_deleted ON sync_tombstones(entity, deleted_at, entity_id)')
+
+
+def build_sync_tracking(cursor):
+    """Add updated_at, tombstones, indexes and triggers; backfill updated_at from created_date"""
+    create_tombstone_table(cursor)
+    for entity, (id_column, _) in SYNC_ENTITIES.items():
+        ensure_column(cursor, entity, 'updated_at', 'TEXT')
+        cursor.execute(f'''
+        UPDATE {entity} SET updated_at = strftime('%Y-%m-%d %H:%M:%f', IFNULL(created_date, 'now'))
+        WHERE updated_at IS NULL
+        ''')
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{entity}_updated ON {entity}(updated_at, {id_column})')
+        for name, body in sync_triggers(entity).items():
+            cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {body}')
+
+
+def sync_epoch(conn):
+    """The build's sync_epoch, '' for a database built without one"""
+    row = conn.execute("SELECT value FROM build_metadata WHERE key = 'sync_epoch'").fetchone()
+    return row[0] if row else ''
+
+
+def encode_cursor(cursor, epoch=''):
+    return f'{epoch}|{cursor[0]}|{cursor[1]}'
+
+
+def decode_cursor(token):
+    """(epoch, (updated_at, id)) from a token; a token of no known format has epoch None"""
+    parts = token.split('|')
+    if len(parts) != 3 or not parts[2].isdigit():
+        return None, START_CURSOR
+    return parts[0], (parts[1], int(parts[2]))
+
+
+def changes_since(conn, entity, cursor=None, page_size=PAGE_SIZE):
+    """The next page of changes after cursor, oldest first.
+
+    Returns {'changes': [...], 'cursor': token, 'has_more': bool, 'reset':
+    bool}; each change is {'op': 'upsert' | 'delete', 'id', 'updated_at'}
+    plus 'row' for upserts. Pass the returned cursor to fetch the following
+    page. reset means cursor came from another build: the page starts from
+    the beginning, and everything synced before must be dropped.
+    """
+    id_column, columns = SYNC_ENTITIES[entity]
+    epoch, reset = sync_epoch(conn), False
+    if not cursor:
+        after = START_CURSOR
+    elif isinstance(cursor, str):
+        cursor_epoch, after = decode_cursor(cursor)
+        if cursor_epoch != epoch:
+            after, reset = START_CURSOR, True
+    else:
+        after = tuple(cursor)
+
+    # Each source is a bounded range scan on its index; the merge of two
+    # sorted runs of page_size + 1 holds the first page_size + 1 changes
+    upserts = conn.execute(f'''
+    SELECT updated_at, {id_column}, {', '.join(columns)} FROM {entity}
+    WHERE (updated_at, {id_column}) > (?, ?)
+    ORDER BY updated_at, {id_column} LIMIT ?
+    ''', (*after, page_size + 1)).fetchall()
+    deletes = conn.execute('''
+    SELECT deleted_at, entity_id FROM sync_tombstones
+    WHERE entity = ? AND (deleted_at, entity_id) > (?, ?)
+    ORDER BY deleted_at, entity_id LIMIT ?
+    ''', (entity, *after, page_size + 1)).fetchall()
+
+    merged = list(heapq.merge(upserts, deletes, key=lambda row: (row[0], row[1])))
+    page = merged[:page_size]
+    changes = []
+    for row in page:
+        change = {'op': 'upsert' if len(row) > 2 else 'delete', 'id': row[1], 'updated_at': row[0]}
+        if len(row) > 2:
+            change['row'] = dict(zip(columns, row[2:]))
+        changes.append(change)
+    next_cursor = (page[-1][0], page[-1][1]) if page else after
+    return {'changes': changes, 'cursor': encode_cursor(next_cursor, epoch), 'has_more': len(merged) > page_size,
+            'reset': reset}
+
+
+def iter_changes(conn, entity, cursor=None, page_size=PAGE_SIZE):
+    """Stream every change after cursor as (change, cursor after it) page by page.
+
+    A cursor from another build first yields {'op': 'reset'}, then every
+    change from the beginning.
+    """
+    epoch = sync_epoch(conn)
+    while True:
+        page = changes_since(conn, entity, cursor, page_size)
+        if page['reset']:
+            yield {'op': 'reset'}, encode_cursor(START_CURSOR, epoch)
+        for change in page['changes']:
+            yield change, encode_cursor((change['updated_at'], change['id']), epoch)
+        if not page['has_more']:
+            return
+        cursor = page['cursor']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Print the changes after a sync cursor as JSON Lines')
+    parser.add_argument('entity', choices=sorted(SYNC_ENTITIES))
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--cursor', help='cursor returned by the previous sync (default: from the beginning)')
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    args = parser.parse_args(argv)
+
+    conn = connect(f'file:{args.database}?mode=ro', uri=True)
+    page = changes_since(conn, args.entity, args.cursor, args.page_size)
+    conn.close()
+    for change in page['changes']:
+        print(json.dumps(change, ensure_ascii=False))
+    print(json.dumps({'cursor': page['cursor'], 'has_more': page['has_more'], 'reset': page['reset']}),
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""Opt-in SQLite query tracing for the Python access layer.
+
+Connections opened through cameroon_db_utils.connect() are traced when
+CAMEROON_DB_TRACE is set (or trace=True is passed):
+
+- set_trace_callback sees every statement SQLite runs, including those
+  fired by triggers and executescript(), and counts them per normalized
+  statement;
+- a progress handler counts virtual-machine steps while a statement runs,
+  which makes unindexed scans stand out even when they are fast; steps
+  are counted per cursor, for the one whose call SQLite is running;
+- cursor calls are timed from execute() until the result is exhausted
+  (or fetchone() has returned its row), into per-statement latency
+  histograms (p50/p95/p99);
+- statements slower than the threshold are logged with their
+  EXPLAIN QUERY PLAN (when it has one: INSERT ... VALUES does not), and
+  a report is dumped when the process exits.
+
+Environment: CAMEROON_DB_TRACE=1, CAMEROON_DB_TRACE_SLOW_MS (default 50),
+CAMEROON_DB_TRACE_REPORT (JSON report path; otherwise the summary is
+logged, or written to stderr when logging is not configured).
+"""
+import atexit
+import bisect
+import itertools
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+logger = logging.getLogger('cameroon_db.trace')
+
+SLOW_QUERY_MS = 50.0
+PROGRESS_INSTRUCTIONS = 1000
+# Upper bounds (ms) of the latency histogram buckets; the last one is open
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf'))
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+PLACEHOLDER_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+NAMED_PARAMETER = re.compile(r'[:@$][A-Za-z_]\w*')
+COMMENT = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+
+
+def normalize_statement(sql):
+    """Collapse literals, parameter lists and whitespace so equal shapes aggregate"""
+    sql = COMMENT.sub(' ', sql)
+    sql = STRING_LITERAL.sub('?', sql)
+    sql = NUMBER_LITERAL.sub('?', sql)
+    sql = NAMED_PARAMETER.sub('?', sql)
+    sql = PLACEHOLDER_LIST.sub('(?, ...)', sql)
+    return ' '.join(sql.split())
+
+
+class StatementStats:
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.vm_steps = 0
+        self.buckets = [0] * len(LATENCY_BUCKETS_MS)
+
+    def add(self, elapsed_ms, steps):
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.vm_steps += steps
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of calls"""
+        target, seen = fraction * self.calls, 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return self.max_ms if bound == float('inf') else min(bound, self.max_ms)
+        return self.max_ms
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'total_ms': round(self.total_ms, 3),
+            'mean_ms': round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            'p50_ms': round(self.percentile(0.50), 3),
+            'p95_ms': round(self.percentile(0.95), 3),
+            'p99_ms': round(self.percentile(0.99), 3),
+            'max_ms': round(self.max_ms, 3),
+            'vm_steps': self.vm_steps * PROGRESS_INSTRUCTIONS,
+        }
+
+
+class QueryTracer:
+    def __init__(self, slow_ms=SLOW_QUERY_MS, report_path=None):
+        self.slow_ms = slow_ms
+        self.report_path = report_path
+        self.timed = {}
+        self.seen = {}
+        # The pending statement of the cursor call running in this thread, if any
+        self.local = threading.local()
+        self.explaining = False
+
+    def attach(self, conn):
+        conn.set_trace_callback(self.on_statement)
+        conn.set_progress_handler(self.on_progress, PROGRESS_INSTRUCTIONS)
+
+    def on_statement(self, sql):
+        if not self.explaining:
+            key = normalize_statement(sql)
+            self.seen[key] = self.seen.get(key, 0) + 1
+
+    def on_progress(self):
+        pending = getattr(self.local, 'pending', None)
+        if pending is not None:
+            pending[3] += 1
+        return 0
+
+    def record(self, conn, sql, parameters, elapsed_ms, steps):
+        key = normalize_statement(sql)
+        self.timed.setdefault(key, StatementStats()).add(elapsed_ms, steps)
+        if elapsed_ms >= self.slow_ms:
+            plan = self.query_plan(conn, sql, parameters)
+            logger.warning('slow query (%.1f ms, %d VM steps): %s%s',
+                           elapsed_ms, steps * PROGRESS_INSTRUCTIONS, key, f'\n{plan}' if plan else '')
+
+    def query_plan(self, conn, sql, parameters):
+        """EXPLAIN QUERY PLAN lines of sql, '' when it has no plan rows"""
+        if not sql.lstrip().upper().startswith(('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')):
+            return '  (no query plan)'
+        self.explaining = True
+        try:
+            rows = sqlite3.Connection.execute(conn, f'EXPLAIN QUERY PLAN {sql}', parameters).fetchall()
+            return '\n'.join(f'  {row[3]}' for row in rows)
+        except sqlite3.Error as e:
+            return f'  (no query plan: {e})'
+        finally:
+            self.explaining = False
+
+    def report(self):
+        statements = sorted(self.timed.items(), key=lambda item: -item[1].total_ms)
+        return {
+            'slow_query_ms': self.slow_ms,
+            'statements': [{'statement': key, **stats.as_dict()} for key, stats in statements],
+            'executed_statements': dict(sorted(self.seen.items(), key=lambda item: -item[1])),
+        }
+
+    def dump(self):
+        report = self.report()
+        if self.report_path:
+            with open(self.report_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            return
+        lines = ['%6d calls  p50 %.2f  p95 %.2f  p99 %.2f ms  %s' % (
+            entry['calls'], entry['p50_ms'], entry['p95_ms'], entry['p99_ms'], entry['statement'])
+            for entry in report['statements'][:20]]
+        if logger.hasHandlers() and logger.isEnabledFor(logging.INFO):
+            for line in lines:
+                logger.info('%s', line)
+        else:
+            # Nobody configured logging, so INFO records would be dropped
+            print('\n'.join(['SQLite query trace (slowest statements by total time):', *lines]), file=sys.stderr)
+
+
+class TracedCursor(sqlite3.Cursor):
+    """Times each statement from execute() until its rows are exhausted.
+
+    fetchone() returning a row also ends the timing, so the common
+    conn.execute(...).fetchone() is recorded; later fetches of the same
+    result are not timed.
+    """
+
+    pending = None
+
+    def _begin(self, sql, parameters):
+        self._finish()
+        # sql, parameters, elapsed ms, progress steps
+        self.pending = [sql, parameters, 0.0, 0]
+
+    def _timed(self, method, *args):
+        local = self.connection.tracer.local
+        outer = getattr(local, 'pending', None)
+        local.pending = self.pending
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            local.pending = outer
+            if self.pending:
+                self.pending[2] += (time.perf_counter() - started) * 1000
+
+    def _finish(self):
+        if self.pending:
+            sql, parameters, elapsed_ms, steps = self.pending
+            self.pending = None
+            self.connection.tracer.record(self.connection, sql, parameters, elapsed_ms, steps)
+
+    def execute(self, sql, parameters=()):
+        self._begin(sql, parameters)
+        result = self._timed(super().execute, sql, parameters)
+        if self.description is None:
+            self._finish()
+        return result
+
+    def executemany(self, sql, seq_of_parameters):
+        # The first parameter set stands in for all of them in the query plan
+        parameters = iter(seq_of_parameters)
+        first = next(parameters, None)
+        self._begin(sql, () if first is None else first)
+        if first is not None:
+            parameters = itertools.chain([first], parameters)
+        result = self._timed(super().executemany, sql, parameters)
+        self._finish()
+        return result
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        self._finish()
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._timed(super().fetchmany, size or self.arraysize)
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            return self._timed(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+
+    def close(self):
+        self._finish()
+        super().close()
+
+
+class TracedConnection(sqlite3.Connection):
+    tracer = None
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+_tracer = None
+
+
+def shared_tracer():
+    """Process-wide tracer configured from the environment, dumped at exit"""
+    global _tracer
+    if _tracer is None:
+        _tracer = QueryTracer(
+            slow_ms=float(os.environ.get('CAMEROON_DB_TRACE_SLOW_MS', SLOW_QUERY_MS)),
+            report_path=os.environ.get('CAMEROON_DB_TRACE_REPORT'),
+        )
+        atexit.register(_tracer.dump)
+    return _tracer
+
+
+def traced_connect(database, tracer=None, **kwargs):
+    conn = sqlite3.connect(database, factory=TracedConnection, **kwargs)
+    conn.tracer = tracer or shared_tracer()
+    conn.tracer.attach(conn)
+    return conn
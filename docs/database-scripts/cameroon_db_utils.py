@@ -0,0 +1,36 @@
+"""Helpers shared by the database builder, its stages and the query tools."""
+import os
+import sqlite3
+import unicodedata
+
+# ASCII punctuation, whitespace and control characters all become separators
+ASCII_SEPARATORS = str.maketrans({chr(c): ' ' for c in range(128) if not chr(c).isalnum()})
+
+
+def normalize_text(text):
+    """Case- and accent-insensitive form of a phrase used for matching"""
+    if text is None:
+        return None
+    if text.isascii():
+        return ' '.join(text.lower().translate(ASCII_SEPARATORS).split())
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return ' '.join(''.join(c if c.isalnum() else ' ' for c in stripped).split())
+
+
+def ensure_column(cursor, table, column, definition):
+    """Add a derived column to an existing table if it is not there yet"""
+    columns = [row[1] for row in cursor.execute(f'PRAGMA table_info({table})')]
+    if column not in columns:
+        cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+
+
+def connect(database, trace=None, **kwargs):
+    """Open a database connection, traced when CAMEROON_DB_TRACE is set"""
+    if trace is None:
+        trace = os.environ.get('CAMEROON_DB_TRACE', '') not in ('', '0')
+    if trace:
+        import cameroon_db_trace
+
+        return cameroon_db_trace.traced_connect(database, **kwargs)
+    return sqlite3.connect(database, **kwargs)
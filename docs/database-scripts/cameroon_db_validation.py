@@ -0,0 +1,175 @@
+"""Set-based validation of a built cameroon_languages.db.
+
+Every check is one SQL aggregate over the database, so the whole suite
+runs in a handful of indexed scans instead of a Python loop per row.
+"""
+import argparse
+import json
+import sys
+import time
+
+from cameroon_db_utils import connect
+
+DATABASE_FILE = 'cameroon_languages.db'
+SAMPLE_LIMIT = 5
+
+# (name, severity, description, query returning one row per violation)
+VALIDATION_CHECKS = [
+    ('duplicate_translations', 'error',
+     'Exact duplicate rows in translations',
+     '''
+     SELECT language_id, french_text, translation, COUNT(*) AS occurrences
+     FROM translations
+     GROUP BY language_id, french_text, translation, category_id,
+              pronunciation, usage_notes, difficulty_level
+     HAVING COUNT(*) > 1
+     '''),
+    ('conflicting_translations', 'warning',
+     'Several different translations for the same (french_text, language_id)',
+     '''
+     SELECT language_id, french_text, COUNT(DISTINCT translation) AS variants,
+            GROUP_CONCAT(DISTINCT translation) AS translations
+     FROM translations
+     GROUP BY language_id, french_text
+     HAVING COUNT(DISTINCT translation) > 1
+     '''),
+    ('missing_beginner_pronunciation', 'error',
+     'Beginner translations without a pronunciation',
+     '''
+     SELECT translation_id, language_id, french_text, translation
+     FROM translations
+     WHERE difficulty_level = 'beginner'
+       AND (pronunciation IS NULL OR TRIM(pronunciation) = '')
+     '''),
+    ('unknown_category', 'error',
+     'Translations referencing a category_id absent from categories',
+     '''
+     SELECT t.category_id, COUNT(*) AS occurrences
+     FROM translations t
+     LEFT JOIN categories c ON c.category_id = t.category_id
+     WHERE t.category_id IS NOT NULL AND c.category_id IS NULL
+     GROUP BY t.category_id
+     '''),
+    ('unknown_language', 'error',
+     'Translations or lessons referencing a language_id absent from languages',
+     '''
+     SELECT 'translations' AS source, t.language_id, COUNT(*) AS occurrences
+     FROM translations t
+     LEFT JOIN languages l ON l.language_id = t.language_id
+     WHERE l.language_id IS NULL
+     GROUP BY t.language_id
+     UNION ALL
+     SELECT 'lessons', s.language_id, COUNT(*)
+     FROM lessons s
+     LEFT JOIN languages l ON l.language_id = s.language_id
+     WHERE l.language_id IS NULL
+     GROUP BY s.language_id
+     '''),
+    ('duplicate_lesson_order', 'error',
+     'Lessons sharing the same order_index within a language',
+     '''
+     SELECT language_id, order_index, COUNT(*) AS occurrences
+     FROM lessons
+     GROUP BY language_id, order_index
+     HAVING COUNT(*) > 1
+     '''),
+    ('lesson_order_gaps', 'error',
+     'Lesson order_index per language does not run contiguously from 1',
+     '''
+     SELECT language_id, MIN(order_index) AS first_index,
+            MAX(order_index) AS last_index,
+            COUNT(DISTINCT order_index) AS distinct_indexes
+     FROM lessons
+     GROUP BY language_id
+     HAVING MIN(order_index) <> 1
+         OR MAX(order_index) <> COUNT(DISTINCT order_index)
+     '''),
+]
+
+
+def run_check(cursor, query, sample_limit=SAMPLE_LIMIT):
+    """Return (violation_count, sample_rows) for one check in a single pass"""
+    cursor.execute(f'''
+    SELECT *, COUNT(*) OVER () AS _violations FROM ({query}) LIMIT ?
+    ''', (sample_limit,))
+    columns = [d[0] for d in cursor.description][:-1]
+    rows = cursor.fetchall()
+    violations = rows[0][-1] if rows else 0
+    samples = [dict(zip(columns, row[:-1])) for row in rows]
+    return violations, samples
+
+
+def validate_database(conn, checks=VALIDATION_CHECKS, sample_limit=SAMPLE_LIMIT):
+    """Run every check and return a structured report"""
+    cursor = conn.cursor()
+    started = time.perf_counter()
+    results = []
+
+    for name, severity, description, query in checks:
+        check_started = time.perf_counter()
+        violations, samples = run_check(cursor, query, sample_limit)
+        results.append({
+            'name': name,
+            'severity': severity,
+            'description': description,
+            'violations': violations,
+            'samples': samples,
+            'elapsed_ms': round((time.perf_counter() - check_started) * 1000, 3),
+        })
+
+    errors = sum(1 for r in results if r['severity'] == 'error' and r['violations'])
+    warnings = sum(1 for r in results if r['severity'] == 'warning' and r['violations'])
+    return {
+        'passed': errors == 0,
+        'errors': errors,
+        'warnings': warnings,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 3),
+        'checks': results,
+    }
+
+
+def exit_status(report, strict=False):
+    """Nonzero when a check failed; warnings only count in strict mode"""
+    if report['errors'] or (strict and report['warnings']):
+        return 1
+    return 0
+
+
+def print_summary(report):
+    for check in report['checks']:
+        if not check['violations']:
+            status = '✅'
+        elif check['severity'] == 'error':
+            status = '❌'
+        else:
+            status = '⚠️ '
+        print(f"  {status} {check['name']}: {check['violations']} violation(s)")
+    print(f"\n🔎 Validation: {report['errors']} error(s), "
+          f"{report['warnings']} warning(s) in {report['elapsed_ms']} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Validate a built Cameroon languages database')
+    parser.add_argument('database', nargs='?', default=DATABASE_FILE)
+    parser.add_argument('--report', help='write the JSON report to this file ("-" for stdout)')
+    parser.add_argument('--strict', action='store_true', help='fail on warnings too')
+    args = parser.parse_args(argv)
+
+    conn = connect(f'file:{args.database}?mode=ro', uri=True)
+    report = validate_database(conn)
+    report['database'] = args.database
+    conn.close()
+
+    if args.report == '-':
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_summary(report)
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+    return exit_status(report, args.strict)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""Watch mode: apply edits of the data files to an existing database.
+
+Watcher polls data/<table>.json (one stat() per file) and, when a file
+changes, compares its rows with the ones last applied, partition by
+partition: translations and lessons by language_id, languages and
+categories row by row. Only the partitions that differ are written, all
+in one BEGIN IMMEDIATE transaction, so readers see the edit whole or not
+at all:
+
+- languages and categories rows are upserted in place, keeping their
+  rowid (completions rank categories by it); removed ones are deleted
+  after the rows that use them;
+- each changed translations or lessons partition is diffed against the
+  database: rows still in the file keep their id, the others are deleted
+  along with the rows referencing them (found from the foreign keys), and
+  the new ones are inserted;
+- the derived tables of the affected languages (normalized text and
+  completions, quiz ranks, phonetic keys) are rebuilt whole with
+  cameroon_db_contributions.refresh_derived_tables(), since deleted rows
+  can leave any of them; stats, facets and sync timestamps follow from
+  their triggers. A categories change refreshes every language's
+  completions.
+
+Translations are read through cameroon_db_merge, from the same sources
+(spec files included) and with the same precedence as the build; rows
+naming an unknown language or category are skipped and reported, and
+rows inserted here get their translation_sources provenance (kept rows
+keep the position they were first loaded from).
+
+Translations are checked against the languages and categories files as
+they are being applied, so one save can add a language and its rows; a
+change to either file reads the translations again. A file that does not
+parse, or an edit that breaks a constraint (a language still in use
+removed, say), rolls back every file of that poll and is reported; they
+are all read again at the next save. The database's input_fingerprint is
+replaced by a watch: marker, so a later reproducible build does not
+mistake it for its own.
+Optional tables built from translations (cognate_clusters) lose the
+deleted rows' entries until they are rebuilt.
+"""
+import argparse
+import collections
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+
+import cameroon_db_autocomplete
+import cameroon_db_contributions
+import cameroon_db_merge
+import cameroon_db_sync
+from cameroon_db_migrations import in_transaction
+from cameroon_db_utils import connect
+
+DATABASE_FILE = 'cameroon_languages.db'
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+POLL_INTERVAL_S = 0.1
+BUSY_TIMEOUT_S = 30.0
+# table: (id column, columns in data file order, partition column), in the order they are applied
+SOURCES = {
+    'languages': ('language_id', ('language_id', 'language_name', 'language_family', 'region',
+                                  'speakers_count', 'description', 'iso_code'), 'language_id'),
+    'categories': ('category_id', ('category_id', 'category_name', 'description'), 'category_id'),
+    'translations': ('translation_id', cameroon_db_sync.SYNC_ENTITIES['translations'][1], 'language_id'),
+    'lessons': ('lesson_id', cameroon_db_sync.SYNC_ENTITIES['lessons'][1], 'language_id'),
+}
+REFERENCE_TABLES = ('languages', 'categories')
+
+
+def open_database(path=DATABASE_FILE):
+    conn = connect(path, timeout=BUSY_TIMEOUT_S, isolation_level=None)
+    conn.execute('PRAGMA foreign_keys = ON')
+    cameroon_db_merge.create_provenance_table(conn.cursor())
+    return conn
+
+
+def file_state(path):
+    """(mtime, size) of path, or None when there is no file"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_rows(path):
+    with open(path, encoding='utf-8') as f:
+        return [tuple(row) for row in json.load(f)['rows']]
+
+
+def partitions(table, rows):
+    """{partition key: Counter of rows}"""
+    _, columns, key_column = SOURCES[table]
+    position = columns.index(key_column)
+    result = {}
+    for row in rows:
+        result.setdefault(row[position], collections.Counter())[row] += 1
+    return result
+
+
+def database_partitions(conn, table):
+    _, columns, _ = SOURCES[table]
+    return partitions(table, conn.execute(f"SELECT {', '.join(columns)} FROM {table}").fetchall())
+
+
+def changed_keys(old, new):
+    """Partition keys whose rows differ, NULL last"""
+    return sorted((key for key in old.keys() | new.keys() if old.get(key) != new.get(key)),
+                  key=lambda key: (key is None, key or ''))
+
+
+def referencing_columns(cursor, table):
+    """[(table, column)] of every foreign key pointing at table"""
+    tables = [row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    return [(other, foreign_key[3]) for other in tables
+            for foreign_key in cursor.execute(f'PRAGMA foreign_key_list({other})').fetchall()
+            if foreign_key[2] == table]
+
+
+def upsert_rows(cursor, table, rows):
+    id_column, columns, _ = SOURCES[table]
+    cursor.executemany(f'''
+    INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})
+    ON CONFLICT ({id_column}) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in columns[1:])}
+    ''', rows)
+
+
+def sync_partition(cursor, table, key, rows, origins=None):
+    """Make the partition's rows equal rows (a Counter); returns (inserted, deleted).
+
+    origins maps a translations row to its [(source, position)], recorded
+    in translation_sources for the rows inserted.
+    """
+    id_column, columns, key_column = SOURCES[table]
+    existing = {}
+    for row_id, *row in cursor.execute(f'''
+    SELECT {id_column}, {', '.join(columns)} FROM {table} WHERE {key_column} IS ? ORDER BY {id_column}
+    ''', (key,)).fetchall():
+        existing.setdefault(tuple(row), []).append(row_id)
+    inserted = []
+    for row in rows.elements():
+        ids = existing.get(row)
+        if ids:
+            ids.pop(0)
+        else:
+            inserted.append(row)
+    deleted = [(row_id,) for ids in existing.values() for row_id in ids]
+
+    if deleted:
+        for other, column in referencing_columns(cursor, table):
+            cursor.executemany(f'DELETE FROM {other} WHERE {column} = ?', deleted)
+        cursor.executemany(f'DELETE FROM {table} WHERE {id_column} = ?', deleted)
+    provenance = []
+    for row in inserted:
+        cursor.execute(f'''
+        INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})
+        ''', row)
+        if origins:
+            provenance.append((cursor.lastrowid, *origins[row].pop(0)))
+    cursor.executemany('''
+    INSERT INTO translation_sources (translation_id, source_file, source_position) VALUES (?, ?, ?)
+    ''', provenance)
+    return len(inserted), len(deleted)
+
+
+def apply_changes(cursor, changes, origins=None):
+    """Write changed partitions and rebuild what depends on them.
+
+    changes is {table: (old partitions, new partitions, changed keys)};
+    returns [(table, key, rows inserted, rows deleted)].
+    """
+    summary, languages = [], set()
+    for table in REFERENCE_TABLES:
+        if table in changes:
+            old, new, keys = changes[table]
+            for key in keys:
+                if sum(new.get(key, {}).values()) > 1:
+                    raise ValueError(f'{table}: duplicate {SOURCES[table][0]} {key!r}')
+            upsert_rows(cursor, table, [row for key in keys for row in new.get(key, {})])
+    for table in ('translations', 'lessons'):
+        if table in changes:
+            _, new, keys = changes[table]
+            for key in keys:
+                rows = new.get(key, collections.Counter())
+                summary.append((table, key, *sync_partition(cursor, table, key, rows,
+                                                            origins if table == 'translations' else None)))
+            if table == 'translations':
+                languages.update(key for key in keys if key is not None)
+    for table in reversed(REFERENCE_TABLES):
+        if table in changes:
+            old, new, keys = changes[table]
+            cursor.executemany(f'DELETE FROM {table} WHERE {SOURCES[table][0]} = ?',
+                               [(key,) for key in keys if key not in new])
+            summary.extend((table, key, int(key in new), int(key in old)) for key in keys)
+
+    cameroon_db_contributions.refresh_derived_tables(cursor, languages)
+    if 'categories' in changes:
+        # Completions rank by category, so every other language's are affected too
+        others = [row[0] for row in cursor.execute(
+            'SELECT DISTINCT language_id FROM translations WHERE language_id IS NOT NULL ORDER BY 1')
+            if row[0] not in languages]
+        cameroon_db_autocomplete.build_completions(cursor, language_ids=others)
+
+    watched_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    cursor.executemany('INSERT OR REPLACE INTO build_metadata (key, value) VALUES (?, ?)',
+                       [('input_fingerprint', f'watch:{watched_at}'), ('watched_at', watched_at)])
+    return summary
+
+
+class Watcher:
+    """Applies changed data files to conn; poll() once per interval"""
+
+    def __init__(self, conn, data_dir=DATA_DIR, sources=None):
+        self.conn = conn
+        self.paths = {table: [os.path.join(data_dir, f'{table}.json')] for table in SOURCES}
+        if sources:
+            self.paths['translations'] = list(sources)
+        # File states of the last applied poll, and of the last failed one
+        self.states = dict.fromkeys(SOURCES)
+        self.failed = None
+        self.origins = None
+        self.rejected = []
+        # What the database holds, so the first poll also catches up on earlier edits
+        self.applied = {table: database_partitions(conn, table) for table in SOURCES}
+
+    def poll(self):
+        """Apply the files changed since the last poll; returns the summary of apply_changes().
+
+        A poll that fails applies nothing and records nothing, so every
+        file it read is read again once any file is saved.
+        """
+        states = {table: tuple(file_state(path) for path in paths) for table, paths in self.paths.items()}
+        if states == self.failed:
+            return []
+        changed = {table for table in SOURCES if states[table] != self.states[table] and None not in states[table]}
+        # Translations are checked against the reference tables, so they are read again when those change
+        if changed & set(REFERENCE_TABLES) and None not in states['translations']:
+            changed.add('translations')
+        tables = [table for table in SOURCES if table in changed]
+        try:
+            loaded, changes = {}, {}
+            for table in tables:
+                loaded[table] = partitions(table, self.load(table, self.paths[table], loaded))
+                keys = changed_keys(self.applied[table], loaded[table])
+                if keys:
+                    changes[table] = (self.applied[table], loaded[table], keys)
+            summary = []
+            if changes:
+                summary = in_transaction(self.conn, lambda cursor: apply_changes(cursor, changes, self.origins))
+        except Exception:
+            self.failed = states
+            raise
+        self.failed = None
+        for table in tables:
+            self.states[table] = states[table]
+            self.applied[table] = loaded[table]
+        return summary
+
+    def load(self, table, paths, loaded):
+        """Rows of table's files; translations are checked against the reference tables in loaded or applied"""
+        if table != 'translations':
+            return load_rows(paths[0])
+        languages, categories = (set(loaded.get(name, self.applied[name])) for name in REFERENCE_TABLES)
+        accepted, self.rejected = cameroon_db_merge.merged_translations(
+            self.conn.cursor(), paths, languages=languages, categories=categories)
+        self.origins = {}
+        for row, source, position in accepted:
+            self.origins.setdefault(row, []).append((source, position))
+        return [row for row, _, _ in accepted]
+
+
+def watch(database=DATABASE_FILE, data_dir=DATA_DIR, interval=POLL_INTERVAL_S, sources=None):
+    """Apply edits of the data files (and spec sources) to database until interrupted"""
+    conn = open_database(database)
+    watcher = Watcher(conn, data_dir, sources)
+    print(f"👀 Watching {data_dir} for {database} (Ctrl-C to stop)")
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                summary = watcher.poll()
+            except (ValueError, sqlite3.Error) as error:
+                print(f"⚠️  Not applied: {error}")
+            else:
+                for row, source, position in watcher.rejected:
+                    print(f"⚠️  Skipped {source}:{position}: unknown language or category in {row[:4]}")
+                watcher.rejected = []
+                if summary:
+                    elapsed = time.perf_counter() - started
+                    changed = ', '.join(f'{table} {key} +{inserted} -{deleted}'
+                                        for table, key, inserted, deleted in summary)
+                    print(f"🔁 Applied in {elapsed * 1000:.0f} ms: {changed}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Apply edits of the data files to the database as they are saved')
+    parser.add_argument('--database', default=DATABASE_FILE)
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL_S, help='seconds between checks')
+    parser.add_argument('--source', action='append', metavar='PATH',
+                        help='translation source, highest precedence first (repeatable; default: the dataset)')
+    args = parser.parse_args(argv)
+
+    watch(args.database, args.data_dir, args.interval, args.source)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,29 +1,379 @@
+import argparse
+import contextlib
+import glob
+import hashlib
+import json
+import os
 import sqlite3
-import re
-from datetime import datetime
+import sys
+from datetime import datetime, timezone
+
+from cameroon_db_utils import connect
+
+DATABASE_FILE = 'cameroon_languages.db'
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, 'data')
+# created_date of every row in a reproducible build, unless SOURCE_DATE_EPOCH is set
+REPRODUCIBLE_TIMESTAMP = '2025-01-01 00:00:00'
+# Source rows committed per transaction (and per checkpoint)
+CHUNK_SIZE = 10000
+# Builds are written next to the target and renamed over it when verified
+BUILD_SUFFIX = '.building'
+# How long publishing waits for the old file's readers and writers to let go
+PUBLISH_TIMEOUT_S = 30.0
+
+def create_database(reproducible=False, force=False, profiler=None, resume=False, chunk_size=CHUNK_SIZE,
+                    database=DATABASE_FILE, in_memory=False, sources=None):
+    """Build the database at database; returns False when a cached reproducible build was reused
+
+    Source rows are committed every chunk_size rows together with a
+    checkpoint, so with resume=True an interrupted build of the same
+    inputs continues after its last committed chunk. With in_memory=True
+    every stage runs against a private in-memory database that is written
+    out in one Connection.backup() call at the end (no resume). A
+    reproducible build is written with VACUUM INTO either way, so both
+    produce the same file for the same fingerprint.
+
+    The build goes to database + BUILD_SUFFIX; only once it is complete,
+    verified and fsynced is it renamed over database, so readers of the
+    old file never see a half-written one.
+
+    sources lists the translation sources in precedence order (default:
+    data/translations.json alone); see cameroon_db_merge.
+    """
+    import cameroon_db_profile
+
+    fingerprint = input_fingerprint(reproducible, sources)
+    if reproducible and not force and stored_fingerprint(database) == fingerprint:
+        print(f"♻️  Inputs unchanged, reusing cached database: {database}")
+        return False
+    build_path = database + BUILD_SUFFIX
+    if not in_memory and resume and build_in_progress(build_path, fingerprint):
+        print(f"⏯️  Resuming interrupted build: {build_path}")
+    else:
+        if os.path.exists(build_path):
+            os.remove(build_path)
+        resume = False
 
-def create_database():
     # Connect to SQLite database (creates if doesn't exist)
-    conn = sqlite3.connect('cameroon_languages.db')
+    conn = connect(':memory:' if in_memory else build_path)
+    profiler = profiler or cameroon_db_profile.BuildProfiler()
+    profiler.attach(conn, ':memory:' if in_memory else build_path)
+    populate_database(conn, fingerprint, reproducible, resume, chunk_size, profiler.stage, sources)
+    if reproducible:
+        # The same bytes whether the build ran in memory or on disk
+        with profiler.stage('vacuum'):
+            vacuum_database(conn, build_path if in_memory else build_path + '.tmp')
+    elif in_memory:
+        with profiler.stage('persist'):
+            persist_database(conn, build_path)
+    conn.close()
+    if reproducible and not in_memory:
+        os.replace(build_path + '.tmp', build_path)
+    profiler.attach(None, database)
+    with profiler.stage('publish'):
+        publish_database(build_path, database)
+    print("✅ Cameroon Languages Database created successfully!")
+    print(f"📊 Database file: {database}")
+    return True
+
+def build_in_memory(reproducible=False, chunk_size=CHUNK_SIZE, profiler=None, sources=None):
+    """Build into a private in-memory database and return its open connection"""
+    import cameroon_db_profile
+
+    conn = connect(':memory:')
+    profiler = profiler or cameroon_db_profile.BuildProfiler()
+    profiler.attach(conn, ':memory:')
+    populate_database(conn, input_fingerprint(reproducible, sources), reproducible, False, chunk_size,
+                      profiler.stage, sources)
+    return conn
+
+def populate_database(conn, fingerprint, reproducible=False, resume=False, chunk_size=CHUNK_SIZE, stage=None,
+                      sources=None):
+    """Run every build stage against an open connection, timing each with stage(name)"""
+    # Stage modules are only needed when a build actually runs
+    import cameroon_db_autocomplete
+    import cameroon_db_facets
+    import cameroon_db_migrations
+    import cameroon_db_phonetic
+    import cameroon_db_quiz
+    import cameroon_db_stats
+    import cameroon_db_sync
+
     cursor = conn.cursor()
+    stage = stage or (lambda name: contextlib.nullcontext())
     
     # Enable foreign keys
     cursor.execute("PRAGMA foreign_keys = ON")
     
     # Create tables
-    create_tables(cursor)
+    with stage('create_tables'):
+        create_tables(cursor)
+        if not resume:
+            cursor.execute('DELETE FROM build_checkpoints')
+            record_build_metadata(cursor, input_fingerprint=fingerprint,
+                                  reproducible=int(reproducible), build_state='in_progress')
+        conn.commit()
     
-    # Insert data
-    insert_languages(cursor)
-    insert_categories(cursor)
-    insert_translations(cursor)
-    insert_lessons(cursor)
+    # Insert data, committed chunk by chunk
+    with stage('insert_languages'):
+        insert_languages(cursor, chunk_size=chunk_size)
+    with stage('insert_categories'):
+        insert_categories(cursor, chunk_size=chunk_size)
+    with stage('insert_translations'):
+        insert_translations(cursor, canonical=reproducible, chunk_size=chunk_size, sources=sources)
+    with stage('insert_lessons'):
+        insert_lessons(cursor, canonical=reproducible, chunk_size=chunk_size)
     
-    # Commit changes and close connection
-    conn.commit()
+    # Derived tables
+    with stage('build_completions'):
+        run_checkpointed(cursor, 'build_completions', fingerprint, cameroon_db_autocomplete.build_completions)
+    with stage('build_facets'):
+        run_checkpointed(cursor, 'build_facets', fingerprint, cameroon_db_facets.build_facet_tables)
+    with stage('build_quiz_tables'):
+        run_checkpointed(cursor, 'build_quiz_tables', fingerprint, cameroon_db_quiz.build_quiz_tables)
+    with stage('build_phonetic_index'):
+        run_checkpointed(cursor, 'build_phonetic_index', fingerprint, cameroon_db_phonetic.build_phonetic_index)
+    with stage('build_stats'):
+        run_checkpointed(cursor, 'build_stats', fingerprint, cameroon_db_stats.build_stats)
+    with stage('build_sync_tracking'):
+        run_checkpointed(cursor, 'build_sync_tracking', fingerprint, cameroon_db_sync.build_sync_tracking)
+    
+    # Fixed timestamps, build fingerprint and schema version
+    with stage('record_metadata'):
+        timestamp = build_timestamp() if reproducible else datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        if reproducible:
+            for table in ('translations', 'lessons'):
+                cursor.execute(f"UPDATE {table} SET created_date = ?, updated_at = strftime('%Y-%m-%d %H:%M:%f', ?)",
+                               (timestamp, timestamp))
+        cameroon_db_migrations.stamp_schema_version(cursor, timestamp)
+        # Sync cursors of an earlier build do not apply to this one's timestamps (see cameroon_db_sync)
+        sync_epoch = hashlib.sha256(f'{fingerprint}|{timestamp}'.encode('utf-8')).hexdigest()[:16]
+        record_build_metadata(cursor, built_at=timestamp, build_state='complete', sync_epoch=sync_epoch)
+        # Checkpoints only serve an unfinished build; their rows depend on the chunk size
+        cursor.execute('DELETE FROM build_checkpoints')
+    
+    # Commit changes
+    with stage('commit'):
+        conn.commit()
+
+def persist_database(conn, path):
+    """Write a whole database to path with one backup step"""
+    target = sqlite3.connect(path)
+    try:
+        conn.backup(target)
+    finally:
+        target.close()
+
+def vacuum_database(conn, path):
+    """Write a compacted copy of a database to path with VACUUM INTO.
+
+    Unlike an in-place VACUUM, the copy's header (change counter, schema
+    cookie) and page layout depend only on the content, not on how many
+    transactions built it.
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    conn.execute('VACUUM INTO ?', (path,))
+
+@contextlib.contextmanager
+def released_wal(path):
+    """Checkpoint path's WAL and hold its write lock while it is replaced, then drop its -wal and -shm.
+
+    SQLite applies a -wal file it finds next to a database to that
+    database, so frames the old file's writers left (contributions run in
+    WAL mode) would be read into the new build. The WAL is checkpointed
+    into the old file and must be empty; connections still open on the
+    old file keep their own, now unlinked, -wal and -shm.
+    """
+    wal_files = [path + '-wal', path + '-shm']
+    if not any(os.path.exists(name) for name in wal_files):
+        yield
+        return
+    conn = sqlite3.connect(path, timeout=PUBLISH_TIMEOUT_S, isolation_level=None)
+    try:
+        busy, frames, _ = conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchone()
+        # No new frames until the rename: writers wait on the lock
+        conn.execute('BEGIN IMMEDIATE')
+        if busy or frames > 0 or os.path.getsize(path + '-wal') > 0:
+            raise RuntimeError(f'{path} has a WAL that could not be checkpointed (a reader or writer is busy); '
+                               'left unchanged')
+        yield
+        for name in wal_files:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(name)
+    finally:
+        conn.close()
+
+def publish_database(build_path, path):
+    """Verify a finished build, flush it to disk and atomically rename it over path"""
+    conn = sqlite3.connect(build_path)
+    try:
+        check = conn.execute('PRAGMA quick_check').fetchall()
+        state = conn.execute("SELECT value FROM build_metadata WHERE key = 'build_state'").fetchone()
+    finally:
+        conn.close()
+    if check != [('ok',)] or state != ('complete',):
+        raise RuntimeError(f'{build_path} failed verification ({check[0][0]}, build_state {state}); {path} left unchanged')
+    fd = os.open(build_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    with released_wal(path):
+        os.replace(build_path, path)
+    # Persist the rename itself; directories cannot be opened on Windows
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def snapshot_database(conn):
+    """Serialized image of a database to clone with clone_database()"""
+    return conn.serialize()
+
+def clone_database(template):
+    """Private in-memory copy of template: a snapshot_database() image, a connection or a path
+
+    Deserializing an image is a memory copy, so a test suite can build one
+    template and hand every test its own copy without re-running inserts.
+    """
+    clone = sqlite3.connect(':memory:')
+    if isinstance(template, (bytes, bytearray, memoryview)):
+        clone.deserialize(template)
+        return clone
+    source = template if isinstance(template, sqlite3.Connection) else sqlite3.connect(template)
+    try:
+        source.backup(clone)
+    finally:
+        if source is not template:
+            source.close()
+    return clone
+
+def build_timestamp():
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    return REPRODUCIBLE_TIMESTAMP
+
+def build_input_files():
+    """Every source the database content depends on: builder, stages and their data"""
+    return sorted([os.path.join(SCRIPT_DIR, 'create_cameroon_db.py')]
+                  + glob.glob(os.path.join(SCRIPT_DIR, 'cameroon_db_*.py'))
+                  + glob.glob(os.path.join(DATA_DIR, '*.json')))
+
+def schema_sql():
+    conn = sqlite3.connect(':memory:')
+    create_tables(conn.cursor())
+    rows = conn.execute("SELECT sql FROM sqlite_master WHERE sql IS NOT NULL ORDER BY type, name").fetchall()
     conn.close()
-    print("✅ Cameroon Languages Database created successfully!")
-    print("📊 Database file: cameroon_languages.db")
+    return ';\n'.join(row[0] for row in rows)
+
+def input_fingerprint(reproducible=False, sources=None):
+    """SHA-256 over the build inputs, the schema and the settings that shape the file"""
+    digest = hashlib.sha256()
+    digest.update(f'sqlite {sqlite3.sqlite_version}; reproducible={reproducible}\n'.encode('utf-8'))
+    if sources:
+        # Translation sources in precedence order, which decides their conflicts
+        digest.update(f'sources={[os.path.basename(path) for path in sources]}\n'.encode('utf-8'))
+    for path in build_input_files() + list(sources or []):
+        digest.update(os.path.basename(path).encode('utf-8') + b'\0')
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    digest.update(schema_sql().encode('utf-8'))
+    return digest.hexdigest()
+
+def read_build_metadata(path):
+    """build_metadata of an existing database as a dict (empty if there is none)"""
+    if not os.path.exists(path):
+        return {}
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        return dict(conn.execute('SELECT key, value FROM build_metadata'))
+    except sqlite3.Error:
+        return {}
+    finally:
+        conn.close()
+
+def stored_fingerprint(path):
+    """Fingerprint recorded in an existing, finished database, or None"""
+    metadata = read_build_metadata(path)
+    if metadata.get('build_state') == 'in_progress':
+        return None
+    return metadata.get('input_fingerprint')
+
+def build_in_progress(path, fingerprint):
+    """True when path holds an interrupted build of the same inputs"""
+    metadata = read_build_metadata(path)
+    return metadata.get('build_state') == 'in_progress' and metadata.get('input_fingerprint') == fingerprint
+
+def record_build_metadata(cursor, **values):
+    cursor.executemany('INSERT OR REPLACE INTO build_metadata (key, value) VALUES (?, ?)',
+                       [(key, str(value)) for key, value in values.items()])
+
+def rows_hash(rows):
+    """SHA-256 over the rows of a source, in load order"""
+    return hashlib.sha256(json.dumps(rows, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def read_checkpoint(cursor, source, content_hash):
+    """(offset, completed) to continue source from"""
+    cursor.execute('SELECT row_offset, content_hash, completed FROM build_checkpoints WHERE source = ?', (source,))
+    row = cursor.fetchone()
+    if row is None:
+        return 0, False
+    if row[1] != content_hash:
+        raise RuntimeError(f'checkpoint of {source} was written for other content; rebuild without --resume')
+    return row[0], bool(row[2])
+
+def write_checkpoint(cursor, source, offset, content_hash, completed):
+    cursor.execute('''
+    INSERT OR REPLACE INTO build_checkpoints (source, row_offset, content_hash, completed)
+    VALUES (?, ?, ?, ?)
+    ''', (source, offset, content_hash, int(completed)))
+
+def insert_chunked(cursor, source, rows, sql, chunk_size=CHUNK_SIZE):
+    """Insert rows chunk by chunk, committing each chunk with its checkpoint.
+
+    Rows before the checkpointed offset are already in the database; a
+    chunk that never committed was rolled back by SQLite and is inserted
+    again. Returns the number of rows inserted by this call.
+    """
+    content_hash = rows_hash(rows)
+    offset, completed = read_checkpoint(cursor, source, content_hash)
+    if completed:
+        return 0
+    start = offset
+    while True:
+        chunk = rows[offset:offset + chunk_size]
+        cursor.executemany(sql, chunk)
+        offset += len(chunk)
+        write_checkpoint(cursor, source, offset, content_hash, offset == len(rows))
+        cursor.connection.commit()
+        if offset == len(rows):
+            return offset - start
+
+def run_checkpointed(cursor, name, fingerprint, build):
+    """Run a derived-table stage once per build, committed with its checkpoint"""
+    source = f'stage:{name}'
+    _, completed = read_checkpoint(cursor, source, fingerprint)
+    if completed:
+        return
+    build(cursor)
+    write_checkpoint(cursor, source, 0, fingerprint, True)
+    cursor.connection.commit()
+
+def load_dataset(name):
+    """Rows of data/<name>.json as tuples, read only when a build needs them"""
+    with open(os.path.join(DATA_DIR, f'{name}.json'), encoding='utf-8') as f:
+        return [tuple(row) for row in json.load(f)['rows']]
+
+def canonical_order(row):
+    """Sort key over every column of a data row, NULLs last"""
+    return [(value is None, '' if value is None else value) for value in row]
 
 def create_tables(cursor):
     # Languages table
@@ -81,1777 +431,90 @@ def create_tables(cursor):
     )
     ''')
     
+    # Build metadata (input fingerprint, build mode)
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS build_metadata (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    ''')
+    
+    # Load progress per source, so an interrupted build can resume
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS build_checkpoints (
+        source TEXT PRIMARY KEY,
+        row_offset INTEGER NOT NULL,
+        content_hash TEXT NOT NULL,
+        completed INTEGER NOT NULL DEFAULT 0
+    )
+    ''')
+
     # Create indexes for better performance
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_language ON translations(language_id)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_category ON translations(category_id)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_difficulty ON translations(difficulty_level)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_french ON translations(french_text)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_translations_language_french ON translations(language_id, french_text, translation)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_lessons_language ON lessons(language_id)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_lessons_level ON lessons(level)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_lessons_language_order ON lessons(language_id, order_index)')
 
-def insert_languages(cursor):
-    languages_data = [
-        ('EWO', 'Ewondo', 'Beti-Pahuin (Bantu)', 'Central Region', 577000, 
-         'Principal language of the Beti people, widely spoken in Yaoundé', 'ewo'),
-        ('DUA', 'Duala', 'Coastal Bantu', 'Littoral Region', 300000, 
-         'Historic trading language of the coast', 'dua'),
-        ('FEF', 'Fe''efe''e', 'Grassfields (Bamileke)', 'West Region', 200000, 
-         'Language of the Bafang area', 'fef'),
-        ('FUL', 'Fulfulde', 'Niger-Congo (Atlantic)', 'North Region', 1500000, 
-         'Language of the Fulani people', 'ful'),
-        ('BAS', 'Bassa', 'A40 Bantu', 'Central-Littoral', 230000, 
-         'Language of the Bassa people', 'bas'),
-        ('BAM', 'Bamum', 'Grassfields', 'West Region', 215000, 
-         'Language with its own indigenous script', 'bax')
-    ]
+def insert_languages(cursor, chunk_size=CHUNK_SIZE):
+    languages_data = load_dataset('languages')
     
-    cursor.executemany('''
+    insert_chunked(cursor, 'languages', languages_data, '''
     INSERT INTO languages (language_id, language_name, language_family, region, speakers_count, description, iso_code)
     VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', languages_data)
-
-def insert_categories(cursor):
-    categories_data = [
-        ('GRT', 'Greetings', 'Basic greetings and polite expressions'),
-        ('NUM', 'Numbers', 'Cardinal and ordinal numbers'),
-        ('FAM', 'Family', 'Family members and relationships'),
-        ('FOD', 'Food', 'Food items and cooking terms'),
-        ('BOD', 'Body', 'Body parts and health'),
-        ('TIM', 'Time', 'Time expressions, days, months'),
-        ('COL', 'Colors', 'Color names'),
-        ('ANI', 'Animals', 'Animals and wildlife'),
-        ('NAT', 'Nature', 'Natural elements, weather'),
-        ('VRB', 'Verbs', 'Common action words'),
-        ('ADJ', 'Adjectives', 'Descriptive words'),
-        ('PHR', 'Phrases', 'Common phrases and expressions'),
-        ('CLO', 'Clothing', 'Clothing and accessories'),
-        ('HOM', 'Home', 'House, furniture, household items'),
-        ('PRO', 'Professions', 'Jobs and occupations'),
-        ('TRA', 'Transportation', 'Vehicles and travel'),
-        ('EMO', 'Emotions', 'Feelings and emotions'),
-        ('EDU', 'Education', 'School and learning'),
-        ('HEA', 'Health', 'Medical and health terms'),
-        ('MON', 'Money', 'Currency, shopping, business'),
-        ('DIR', 'Directions', 'Location and movement'),
-        ('REL', 'Religion', 'Spiritual and religious terms'),
-        ('MUS', 'Music', 'Musical instruments and terms'),
-        ('SPO', 'Sports', 'Sports and physical activities')
-    ]
+    ''', chunk_size)
+
+def insert_categories(cursor, chunk_size=CHUNK_SIZE):
+    categories_data = load_dataset('categories')
     
-    cursor.executemany('''
+    insert_chunked(cursor, 'categories', categories_data, '''
     INSERT INTO categories (category_id, category_name, description)
     VALUES (?, ?, ?)
-    ''', categories_data)
-
-def insert_translations(cursor):
-    # Complete translations data from the markdown specification
-    translations_data = [
-        # Greetings - Ewondo
-        ('Bonjour', 'EWO', 'Mbolo', 'GRT', 'mm-BOH-loh', None, 'beginner'),
-        ('Bonsoir', 'EWO', 'Mbolo', 'GRT', 'mm-BOH-loh', None, 'beginner'),
-        ('Comment allez-vous?', 'EWO', 'Mbolo woe?', 'GRT', 'mm-BOH-loh woh-eh', None, 'beginner'),
-        ('Merci', 'EWO', 'Akiba', 'GRT', 'ah-KEE-bah', None, 'beginner'),
-        ('Au revoir', 'EWO', 'Ka yen asu', 'GRT', 'kah yehn ah-SOO', None, 'beginner'),
-        ('Excuse-moi', 'EWO', 'Ma yem ve', 'GRT', 'mah yehm veh', None, 'beginner'),
-
-        # Greetings - Duala
-        ('Bonjour', 'DUA', 'Mwa boma', 'GRT', 'mwah BOH-mah', None, 'beginner'),
-        ('Bonsoir', 'DUA', 'Mwa munyenge', 'GRT', 'mwah moon-YEHN-geh', None, 'beginner'),
-        ('Comment allez-vous?', 'DUA', 'Mwa boma na nde?', 'GRT', 'mwah BOH-mah nah n-deh', None, 'beginner'),
-        ('Merci', 'DUA', 'Masa', 'GRT', 'MAH-sah', None, 'beginner'),
-        ('Au revoir', 'DUA', 'Wese', 'GRT', 'WEH-seh', None, 'beginner'),
-
-        # Greetings - Fe'efe'e
-        ('Bonjour', 'FEF', 'Kweni', 'GRT', 'KWEH-nee', None, 'beginner'),
-        ('Merci', 'FEF', 'Ndongui', 'GRT', 'n-DOHN-gwee', None, 'beginner'),
-        ('Au revoir', 'FEF', 'Ko''a ntsie', 'GRT', 'koh-ah n-TSEE-eh', None, 'beginner'),
-
-        # Greetings - Fulfulde
-        ('Bonjour', 'FUL', 'Jam waali', 'GRT', 'jahm WAH-lee', None, 'beginner'),
-        ('Bonsoir', 'FUL', 'Jam mayra', 'GRT', 'jahm MY-rah', None, 'beginner'),
-        ('Comment allez-vous?', 'FUL', 'Jam tan?', 'GRT', 'jahm tahn', None, 'beginner'),
-        ('Merci', 'FUL', 'Jarama', 'GRT', 'jah-RAH-mah', None, 'beginner'),
-        ('Au revoir', 'FUL', 'Selaamaleykum', 'GRT', 'seh-lah-ah-mah-LAY-koom', None, 'beginner'),
-
-        # Greetings - Bassa
-        ('Bonjour', 'BAS', 'Mbolo', 'GRT', 'mm-BOH-loh', None, 'beginner'),
-        ('Merci', 'BAS', 'Nyango', 'GRT', 'NYAHN-goh', None, 'beginner'),
-        ('Au revoir', 'BAS', 'Ka nganda', 'GRT', 'kah n-GAHN-dah', None, 'beginner'),
-
-        # Greetings - Bamum
-        ('Bonjour', 'BAM', 'Nshie', 'GRT', 'n-SHEE-eh', None, 'beginner'),
-        ('Merci', 'BAM', 'Numeni', 'GRT', 'noo-MEH-nee', None, 'beginner'),
-        ('Au revoir', 'BAM', 'Ka ben', 'GRT', 'kah behn', None, 'beginner'),
-
-        # Numbers - Ewondo
-        ('un', 'EWO', 'fok', 'NUM', 'fohk', None, 'beginner'),
-        ('deux', 'EWO', 'iba', 'NUM', 'ee-BAH', None, 'beginner'),
-        ('trois', 'EWO', 'ilal', 'NUM', 'ee-LAHL', None, 'beginner'),
-        ('quatre', 'EWO', 'inai', 'NUM', 'ee-NAH-ee', None, 'beginner'),
-        ('cinq', 'EWO', 'itan', 'NUM', 'ee-TAHN', None, 'beginner'),
-        ('six', 'EWO', 'isamaan', 'NUM', 'ee-sah-MAHN', None, 'beginner'),
-        ('sept', 'EWO', 'isambaal', 'NUM', 'ee-sahm-BAHL', None, 'beginner'),
-        ('huit', 'EWO', 'mfom', 'NUM', 'mm-FOHM', None, 'beginner'),
-        ('neuf', 'EWO', 'evus', 'NUM', 'eh-VOOS', None, 'beginner'),
-        ('dix', 'EWO', 'awom', 'NUM', 'ah-WOHM', None, 'beginner'),
-
-        # Numbers - Duala
-        ('un', 'DUA', 'mosi', 'NUM', 'MOH-see', None, 'beginner'),
-        ('deux', 'DUA', 'maba', 'NUM', 'mah-BAH', None, 'beginner'),
-        ('trois', 'DUA', 'malalo', 'NUM', 'mah-LAH-loh', None, 'beginner'),
-        ('quatre', 'DUA', 'manei', 'NUM', 'mah-NEH-ee', None, 'beginner'),
-        ('cinq', 'DUA', 'matan', 'NUM', 'mah-TAHN', None, 'beginner'),
-        ('six', 'DUA', 'motoba', 'NUM', 'moh-TOH-bah', None, 'beginner'),
-        ('sept', 'DUA', 'nsamba', 'NUM', 'n-SAHM-bah', None, 'beginner'),
-        ('huit', 'DUA', 'mwambe', 'NUM', 'mwahm-BEH', None, 'beginner'),
-        ('neuf', 'DUA', 'libua', 'NUM', 'lee-BOO-ah', None, 'beginner'),
-        ('dix', 'DUA', 'duom', 'NUM', 'DOO-ohm', None, 'beginner'),
-
-        # Numbers - Fulfulde
-        ('un', 'FUL', 'goto', 'NUM', 'GOH-toh', None, 'beginner'),
-        ('deux', 'FUL', 'didi', 'NUM', 'DEE-dee', None, 'beginner'),
-        ('trois', 'FUL', 'tati', 'NUM', 'TAH-tee', None, 'beginner'),
-        ('quatre', 'FUL', 'nayi', 'NUM', 'NAH-yee', None, 'beginner'),
-        ('cinq', 'FUL', 'jowi', 'NUM', 'JOH-wee', None, 'beginner'),
-        ('six', 'FUL', 'jeegom', 'NUM', 'JEH-eh-gohm', None, 'beginner'),
-        ('sept', 'FUL', 'jeeditati', 'NUM', 'jeh-eh-dee-TAH-tee', None, 'beginner'),
-        ('huit', 'FUL', 'jeetati', 'NUM', 'jeh-eh-TAH-tee', None, 'beginner'),
-        ('neuf', 'FUL', 'jeenayi', 'NUM', 'jeh-eh-NAH-yee', None, 'beginner'),
-        ('dix', 'FUL', 'sappo', 'NUM', 'SAHP-poh', None, 'beginner'),
-
-        # Family - Ewondo
-        ('père', 'EWO', 'tara', 'FAM', 'TAH-rah', None, 'beginner'),
-        ('mère', 'EWO', 'nga', 'FAM', 'n-GAH', None, 'beginner'),
-        ('fils', 'EWO', 'moan minga', 'FAM', 'moh-AHN mee-n-GAH', None, 'beginner'),
-        ('fille', 'EWO', 'moan minga', 'FAM', 'moh-AHN mee-n-GAH', None, 'beginner'),
-        ('frère', 'EWO', 'nkuu', 'FAM', 'n-KOO', None, 'beginner'),
-        ('sœur', 'EWO', 'mbok', 'FAM', 'mm-BOHK', None, 'beginner'),
-        ('grand-père', 'EWO', 'nkukuma', 'FAM', 'n-koo-KOO-mah', None, 'beginner'),
-        ('grand-mère', 'EWO', 'nnemekukuma', 'FAM', 'n-neh-meh-koo-KOO-mah', None, 'beginner'),
-
-        # Family - Duala
-        ('père', 'DUA', 'tata', 'FAM', 'TAH-tah', None, 'beginner'),
-        ('mère', 'DUA', 'mama', 'FAM', 'MAH-mah', None, 'beginner'),
-        ('fils', 'DUA', 'mwana ma mutu', 'FAM', 'mwah-nah mah moo-TOO', None, 'beginner'),
-        ('fille', 'DUA', 'mwana ma mutu', 'FAM', 'mwah-nah mah moo-TOO', None, 'beginner'),
-        ('frère', 'DUA', 'kaka', 'FAM', 'KAH-kah', None, 'beginner'),
-        ('sœur', 'DUA', 'mba', 'FAM', 'mm-BAH', None, 'beginner'),
-
-        # Family - Fulfulde
-        ('père', 'FUL', 'baaba', 'FAM', 'BAH-bah', None, 'beginner'),
-        ('mère', 'FUL', 'yaaya', 'FAM', 'YAH-yah', None, 'beginner'),
-        ('fils', 'FUL', 'bii''do', 'FAM', 'bee-DOH', None, 'beginner'),
-        ('fille', 'FUL', 'deb''ere', 'FAM', 'deh-BEH-reh', None, 'beginner'),
-        ('frère', 'FUL', 'ka''o', 'FAM', 'kah-OH', None, 'beginner'),
-        ('sœur', 'FUL', 'mba''ru', 'FAM', 'mm-BAH-roo', None, 'beginner'),
-
-        # Food - Ewondo
-        ('eau', 'EWO', 'mam', 'FOD', 'mahm', None, 'beginner'),
-        ('nourriture', 'EWO', 'bidi', 'FOD', 'BEE-dee', None, 'beginner'),
-        ('viande', 'EWO', 'nyama', 'FOD', 'NYAH-mah', None, 'beginner'),
-        ('poisson', 'EWO', 'som', 'FOD', 'sohm', None, 'beginner'),
-        ('légumes', 'EWO', 'nduma', 'FOD', 'n-DOO-mah', None, 'beginner'),
-        ('banane', 'EWO', 'kaba', 'FOD', 'KAH-bah', None, 'beginner'),
-        ('manioc', 'EWO', 'mbong', 'FOD', 'mm-BOHN', None, 'beginner'),
-        ('riz', 'EWO', 'malaa', 'FOD', 'mah-LAH', None, 'beginner'),
-
-        # Food - Duala
-        ('eau', 'DUA', 'mema', 'FOD', 'MEH-mah', None, 'beginner'),
-        ('nourriture', 'DUA', 'bele', 'FOD', 'BEH-leh', None, 'beginner'),
-        ('viande', 'DUA', 'nyama', 'FOD', 'NYAH-mah', None, 'beginner'),
-        ('poisson', 'DUA', 'mba', 'FOD', 'mm-BAH', None, 'beginner'),
-        ('banane', 'DUA', 'kondo', 'FOD', 'KOHN-doh', None, 'beginner'),
-        ('manioc', 'DUA', 'miondo', 'FOD', 'mee-OHN-doh', None, 'beginner'),
-
-        # Food - Fulfulde
-        ('eau', 'FUL', 'ndiyam', 'FOD', 'n-DEE-yahm', None, 'beginner'),
-        ('nourriture', 'FUL', 'yiiyam', 'FOD', 'YEE-yahm', None, 'beginner'),
-        ('viande', 'FUL', 'nebbe', 'FOD', 'NEH-beh', None, 'beginner'),
-        ('lait', 'FUL', 'kosam', 'FOD', 'KOH-sahm', None, 'beginner'),
-        ('mil', 'FUL', 'gawri', 'FOD', 'GAH-wree', None, 'beginner'),
-
-        # Common Phrases - Ewondo
-        ('Je ne comprends pas', 'EWO', 'Ma si nkoboo te', 'PHR', 'mah see n-koh-BOH teh', None, 'intermediate'),
-        ('Où est...?', 'EWO', 'Woe ve...?', 'PHR', 'woh-eh veh', None, 'intermediate'),
-        ('Combien ça coûte?', 'EWO', 'A nkom mbeni?', 'PHR', 'ah n-kohm mm-BEH-nee', None, 'intermediate'),
-        ('Je m''appelle...', 'EWO', 'Ma yili...', 'PHR', 'mah YEE-lee', None, 'intermediate'),
-        ('Parlez-vous français?', 'EWO', 'Ou kala ndaman Fala?', 'PHR', 'oo KAH-lah n-dah-mahn FAH-lah', None, 'intermediate'),
-
-        # Common Phrases - Duala
-        ('Je ne comprends pas', 'DUA', 'Na soma te', 'PHR', 'nah SOH-mah teh', None, 'intermediate'),
-        ('Où est...?', 'DUA', 'Wapi...?', 'PHR', 'WAH-pee', None, 'intermediate'),
-        ('Combien ça coûte?', 'DUA', 'Mbama ngando?', 'PHR', 'mm-BAH-mah n-GAHN-doh', None, 'intermediate'),
-        ('Je m''appelle...', 'DUA', 'Ndina nyam na...', 'PHR', 'n-DEE-nah nyahm nah', None, 'intermediate'),
-
-        # Common Phrases - Fulfulde
-        ('Je ne comprends pas', 'FUL', 'Mi famaani', 'PHR', 'mee fah-MAH-nee', None, 'intermediate'),
-        ('Où est...?', 'FUL', 'Anto...?', 'PHR', 'AHN-toh', None, 'intermediate'),
-        ('Combien ça coûte?', 'FUL', 'Noy foti?', 'PHR', 'noy FOH-tee', None, 'intermediate'),
-        ('Je m''appelle...', 'FUL', 'Innde am ko...', 'PHR', 'ee-n-DEH ahm koh', None, 'intermediate'),
-
-        # Colors - Ewondo
-        ('rouge', 'EWO', 'bibuk', 'COL', 'bee-BOOK', None, 'beginner'),
-        ('blanc', 'EWO', 'fum', 'COL', 'foom', None, 'beginner'),
-        ('noir', 'EWO', 'mvie', 'COL', 'mm-VEE-eh', None, 'beginner'),
-        ('vert', 'EWO', 'esu', 'COL', 'eh-SOO', None, 'beginner'),
-        ('bleu', 'EWO', 'belu', 'COL', 'BEH-loo', None, 'beginner'),
-        ('jaune', 'EWO', 'bola', 'COL', 'BOH-lah', None, 'beginner'),
-
-        # Colors - Duala
-        ('rouge', 'DUA', 'nene', 'COL', 'NEH-neh', None, 'beginner'),
-        ('blanc', 'DUA', 'mpemba', 'COL', 'mm-PEHM-bah', None, 'beginner'),
-        ('noir', 'DUA', 'binde', 'COL', 'BEE-n-deh', None, 'beginner'),
-        ('vert', 'DUA', 'kaki', 'COL', 'KAH-kee', None, 'beginner'),
-
-        # Colors - Fulfulde
-        ('rouge', 'FUL', 'boodeejo', 'COL', 'boh-DEH-joh', None, 'beginner'),
-        ('blanc', 'FUL', 'raneeji', 'COL', 'rah-NEH-jee', None, 'beginner'),
-        ('noir', 'FUL', 'baleejo', 'COL', 'bah-LEH-joh', None, 'beginner'),
-
-        # Animals - Ewondo
-        ('chien', 'EWO', 'mvus', 'ANI', 'mm-VOOS', None, 'beginner'),
-        ('chat', 'EWO', 'pusi', 'ANI', 'POO-see', None, 'beginner'),
-        ('éléphant', 'EWO', 'nzog', 'ANI', 'n-ZOHG', None, 'beginner'),
-        ('lion', 'EWO', 'nkui', 'ANI', 'n-KOO-ee', None, 'beginner'),
-        ('oiseau', 'EWO', 'non', 'ANI', 'nohn', None, 'beginner'),
-        ('poule', 'EWO', 'kob', 'ANI', 'kohb', None, 'beginner'),
-
-        # Animals - Duala
-        ('chien', 'DUA', 'mbwa', 'ANI', 'mm-BWAH', None, 'beginner'),
-        ('chat', 'DUA', 'paka', 'ANI', 'PAH-kah', None, 'beginner'),
-        ('éléphant', 'DUA', 'njoku', 'ANI', 'n-JOH-koo', None, 'beginner'),
-        ('oiseau', 'DUA', 'kake', 'ANI', 'KAH-keh', None, 'beginner'),
-
-        # Animals - Fulfulde
-        ('chien', 'FUL', 'rawandu', 'ANI', 'rah-WAHN-doo', None, 'beginner'),
-        ('chat', 'FUL', 'ganyru', 'ANI', 'GAHN-yroo', None, 'beginner'),
-        ('vache', 'FUL', 'nagge', 'ANI', 'NAHG-geh', None, 'beginner'),
-        ('chèvre', 'FUL', 'buri', 'ANI', 'BOO-ree', None, 'beginner'),
-        ('mouton', 'FUL', 'barka', 'ANI', 'BAHR-kah', None, 'beginner'),
-
-        # Additional common words (expanded vocabulary)
-        ('maison', 'EWO', 'nda', 'HOM', 'n-DAH', None, 'beginner'),
-        ('maison', 'DUA', 'ndako', 'HOM', 'n-DAH-koh', None, 'beginner'),
-        ('maison', 'FUL', 'galle', 'HOM', 'GAHL-leh', None, 'beginner'),
-        ('voiture', 'EWO', 'motor', 'TRA', 'MOH-tohr', None, 'beginner'),
-        ('voiture', 'DUA', 'motuka', 'TRA', 'moh-TOO-kah', None, 'beginner'),
-        ('voiture', 'FUL', 'motoor', 'TRA', 'moh-TOHR', None, 'beginner'),
-        ('école', 'EWO', 'kalara', 'EDU', 'kah-LAH-rah', None, 'beginner'),
-        ('école', 'DUA', 'eteyelo', 'EDU', 'eh-teh-YEH-loh', None, 'beginner'),
-        ('école', 'FUL', 'janngirde', 'EDU', 'jahn-GEER-deh', None, 'beginner'),
-        ('médecin', 'EWO', 'nkomo nnama', 'HEA', 'n-KOH-moh n-NAH-mah', None, 'intermediate'),
-        ('médecin', 'DUA', 'monganga', 'HEA', 'mohn-GAHN-gah', None, 'intermediate'),
-        ('médecin', 'FUL', 'doktoor', 'HEA', 'dohk-TOHR', None, 'intermediate'),
-        ('argent', 'EWO', 'osan', 'MON', 'oh-SAHN', None, 'beginner'),
-        ('argent', 'DUA', 'mbongo', 'MON', 'mm-BOHN-goh', None, 'beginner'),
-        ('argent', 'FUL', 'alkarfe', 'MON', 'ahl-KAHR-feh', None, 'beginner'),
-        ('soleil', 'EWO', 'nsan', 'NAT', 'n-SAHN', None, 'beginner'),
-        ('soleil', 'DUA', 'moi', 'NAT', 'MOH-ee', None, 'beginner'),
-        ('soleil', 'FUL', 'naange', 'NAT', 'NAHN-geh', None, 'beginner'),
-        ('lune', 'EWO', 'ngond', 'NAT', 'n-GOHND', None, 'beginner'),
-        ('lune', 'DUA', 'sanza', 'NAT', 'SAHN-zah', None, 'beginner'),
-        ('lune', 'FUL', 'lewru', 'NAT', 'LEH-wroo', None, 'beginner'),
-        ('pluie', 'EWO', 'mvon', 'NAT', 'mm-VOHN', None, 'beginner'),
-        ('pluie', 'DUA', 'mbula', 'NAT', 'mm-BOO-lah', None, 'beginner'),
-        ('pluie', 'FUL', 'ndiyam', 'NAT', 'n-DEE-yahm', None, 'beginner'),
-        ('feu', 'EWO', 'nduan', 'NAT', 'n-DOO-ahn', None, 'beginner'),
-        ('feu', 'DUA', 'moto', 'NAT', 'MOH-toh', None, 'beginner'),
-        ('feu', 'FUL', 'yiite', 'NAT', 'YEE-teh', None, 'beginner'),
-        ('eau', 'BAS', 'mam', 'FOD', 'mahm', None, 'beginner'),
-        ('eau', 'BAM', 'fù', 'FOD', 'foo', None, 'beginner'),
-        ('nourriture', 'BAS', 'bilong', 'FOD', 'bee-LOHNG', None, 'beginner'),
-        ('nourriture', 'BAM', 'shù', 'FOD', 'shoo', None, 'beginner'),
-        ('père', 'BAS', 'tata', 'FAM', 'TAH-tah', None, 'beginner'),
-        ('père', 'BAM', 'pa', 'FAM', 'pah', None, 'beginner'),
-        ('mère', 'BAS', 'nya', 'FAM', 'n-YAH', None, 'beginner'),
-        ('mère', 'BAM', 'mā', 'FAM', 'mah', None, 'beginner'),
-        ('un', 'BAS', 'mosi', 'NUM', 'MOH-see', None, 'beginner'),
-        ('un', 'BAM', 'pāq', 'NUM', 'pahk', None, 'beginner'),
-        ('deux', 'BAS', 'maba', 'NUM', 'mah-BAH', None, 'beginner'),
-        ('deux', 'BAM', 'tū', 'NUM', 'too', None, 'beginner'),
-        ('rouge', 'BAS', 'bibuk', 'COL', 'bee-BOOK', None, 'beginner'),
-        ('blanc', 'BAS', 'fum', 'COL', 'foom', None, 'beginner'),
-        ('noir', 'BAS', 'mvie', 'COL', 'mm-VEE-eh', None, 'beginner'),
-        ('chien', 'BAS', 'mvus', 'ANI', 'mm-VOOS', None, 'beginner'),
-        ('chat', 'BAS', 'pusi', 'ANI', 'POO-see', None, 'beginner'),
-        ('éléphant', 'BAS', 'nzog', 'ANI', 'n-ZOHG', None, 'beginner'),
-        ('Bonjour', 'BAS', 'Mbolo', 'GRT', 'mm-BOH-loh', None, 'beginner'),
-        ('Merci', 'BAS', 'Nyango', 'GRT', 'NYAHN-goh', None, 'beginner'),
-        ('Au revoir', 'BAS', 'Ka nganda', 'GRT', 'kah n-GAHN-dah', None, 'beginner'),
-        ('Bonjour', 'BAM', 'Nshie', 'GRT', 'n-SHEE-eh', None, 'beginner'),
-        ('Merci', 'BAM', 'Numeni', 'GRT', 'noo-MEH-nee', None, 'beginner'),
-        ('Au revoir', 'BAM', 'Ka ben', 'GRT', 'kah behn', None, 'beginner'),
-
-        # Additional words from enhanced dictionary and lessons
-        ('Bonjour', 'EWO', 'Mboté', 'GRT', 'mm-BOH-teh', None, 'beginner'),
-        ('Bonjour', 'EWO', 'Mboté o bibóm', 'GRT', 'mm-BOH-teh oh bee-BOHM', None, 'beginner'),
-        ('Merci', 'EWO', 'Matónda', 'GRT', 'mah-TOHN-dah', None, 'beginner'),
-        ('Eau', 'DUA', 'Mam', 'FOD', 'mahm', None, 'beginner'),
-        ('Venir', 'FEF', 'Kaa', 'VRB', 'KAH-ah', None, 'beginner'),
-        ('Eau', 'FUL', 'Ndiyam', 'FOD', 'n-DEE-yahm', None, 'beginner'),
-        ('Maison', 'BAS', 'Hɔp', 'HOM', 'hohp', None, 'beginner'),
-        ('Roi', 'BAM', 'Nzi', 'PRO', 'n-ZEE', None, 'intermediate'),
-        ('Nourriture', 'DUA', 'Diba', 'FOD', 'DEE-bah', None, 'beginner'),
-        ('Argent', 'DUA', 'Mbongo', 'MON', 'mm-BOHN-goh', None, 'beginner'),
-        ('Père', 'EWO', 'Tara', 'FAM', 'TAH-rah', None, 'beginner'),
-        ('Mère', 'EWO', 'Mama', 'FAM', 'MAH-mah', None, 'beginner'),
-        ('Mère', 'EWO', 'Mam', 'FAM', 'mahm', None, 'beginner'),
-        ('Enfant', 'EWO', 'Ndomo', 'FAM', 'n-DOH-moh', None, 'beginner'),
-        ('Fils', 'EWO', 'Ndomo', 'FAM', 'n-DOH-moh', None, 'beginner'),
-        ('Fille', 'EWO', 'Ngon', 'FAM', 'n-GOHN', None, 'beginner'),
-
-        # Additional common words and phrases
-        ('S''il vous plaît', 'EWO', 'Ta abe', 'PHR', 'tah ah-BEH', None, 'intermediate'),
-        ('Désolé', 'EWO', 'Ma yem ve', 'PHR', 'mah yehm veh', None, 'intermediate'),
-        ('Je suis malade', 'EWO', 'Ma yie nkono', 'PHR', 'mah YEE-eh n-KOH-noh', None, 'intermediate'),
-        ('Aidez-moi', 'EWO', 'Demedoo ma', 'PHR', 'deh-meh-DOH mah', None, 'intermediate'),
-        ('Je suis perdu', 'EWO', 'Ma fuman nzila', 'PHR', 'mah foo-MAHN n-ZEE-lah', None, 'intermediate'),
-        ('Quelle heure est-il?', 'EWO', 'Ngule so ve?', 'PHR', 'n-GOO-leh soh veh', None, 'intermediate'),
-        ('Je ne parle pas...', 'EWO', 'Ma si kala... te', 'PHR', 'mah see KAH-lah teh', None, 'intermediate'),
-        ('S''il vous plaît', 'DUA', 'Mbesa na yo', 'PHR', 'mm-BEH-sah nah yoh', None, 'intermediate'),
-        ('Désolé', 'DUA', 'Pardon', 'PHR', 'pahr-DOHN', None, 'intermediate'),
-        ('Je suis malade', 'DUA', 'Nazali na bokono', 'PHR', 'nah-ZAH-lee nah boh-KOH-noh', None, 'intermediate'),
-        ('Aidez-moi', 'DUA', 'Bosalisa ngai', 'PHR', 'boh-sah-LEE-sah n-GAH-ee', None, 'intermediate'),
-        ('Quelle heure est-il?', 'DUA', 'Ngonga nini?', 'PHR', 'n-GOHN-gah NEE-nee', None, 'intermediate'),
-        ('S''il vous plaît', 'FUL', 'Min jaɓɓii', 'PHR', 'meen jah-BEE', None, 'intermediate'),
-        ('Désolé', 'FUL', 'Hakke', 'PHR', 'HAHK-keh', None, 'intermediate'),
-        ('Je suis malade', 'FUL', 'Mi jogii', 'PHR', 'mee joh-GEE', None, 'intermediate'),
-        ('Aidez-moi', 'FUL', 'Wallu-mi', 'PHR', 'WAHL-loo-mee', None, 'intermediate'),
-        ('Quelle heure est-il?', 'FUL', 'Waktu fotde?', 'PHR', 'WAHK-too FOHT-deh', None, 'intermediate'),
-
-        # Extended vocabulary from lessons
-        ('Bonjour', 'EWO', 'Mboté', 'GRT', 'mm-BOH-teh', None, 'beginner'),
-        ('Bonjour', 'EWO', 'Mboté o bibóm', 'GRT', 'mm-BOH-teh oh bee-BOHM', None, 'beginner'),
-        ('Merci', 'EWO', 'Matónda', 'GRT', 'mah-TOHN-dah', None, 'beginner'),
-        ('Père', 'EWO', 'Tara', 'FAM', 'TAH-rah', None, 'beginner'),
-        ('Mère', 'EWO', 'Mama', 'FAM', 'MAH-mah', None, 'beginner'),
-        ('Mère', 'EWO', 'Mam', 'FAM', 'mahm', None, 'beginner'),
-        ('Enfant', 'EWO', 'Ndomo', 'FAM', 'n-DOH-moh', None, 'beginner'),
-        ('Fils', 'EWO', 'Ndomo', 'FAM', 'n-DOH-moh', None, 'beginner'),
-        ('Fille', 'EWO', 'Ngon', 'FAM', 'n-GOHN', None, 'beginner'),
-        ('Eau', 'DUA', 'Mam', 'FOD', 'mahm', None, 'beginner'),
-        ('Nourriture', 'DUA', 'Diba', 'FOD', 'DEE-bah', None, 'beginner'),
-        ('Argent', 'DUA', 'Mbongo', 'MON', 'mm-BOHN-goh', None, 'beginner'),
-
-        # Body parts (extended)
-        ('Tête', 'EWO', 'Nlo', 'BOD', 'n-LOH', None, 'beginner'),
-        ('Œil', 'EWO', 'Iso', 'BOD', 'ee-SOH', None, 'beginner'),
-        ('Oreille', 'EWO', 'To', 'BOD', 'toh', None, 'beginner'),
-        ('Nez', 'EWO', 'Minga', 'BOD', 'mee-n-GAH', None, 'beginner'),
-        ('Bouche', 'EWO', 'Anom', 'BOD', 'ah-NOHM', None, 'beginner'),
-        ('Dent', 'EWO', 'Nyin', 'BOD', 'n-YEEN', None, 'beginner'),
-        ('Main', 'EWO', 'Abo', 'BOD', 'ah-BOH', None, 'beginner'),
-        ('Pied', 'EWO', 'Aban', 'BOD', 'ah-BAHN', None, 'beginner'),
-        ('Bras', 'EWO', 'Abei', 'BOD', 'ah-BEH-ee', None, 'beginner'),
-        ('Jambe', 'EWO', 'Akok', 'BOD', 'ah-KOHK', None, 'beginner'),
-        ('Cœur', 'EWO', 'Nlem', 'BOD', 'n-LEHM', None, 'beginner'),
-        ('Estomac', 'EWO', 'Abe', 'BOD', 'ah-BEH', None, 'beginner'),
-        ('Tête', 'DUA', 'Moto', 'BOD', 'MOH-toh', None, 'beginner'),
-        ('Œil', 'DUA', 'Disu', 'BOD', 'DEE-soo', None, 'beginner'),
-        ('Oreille', 'DUA', 'Toi', 'BOD', 'toh-EE', None, 'beginner'),
-        ('Nez', 'DUA', 'Lumbu', 'BOD', 'LOOM-boo', None, 'beginner'),
-        ('Bouche', 'DUA', 'Monoko', 'BOD', 'moh-NOH-koh', None, 'beginner'),
-        ('Main', 'DUA', 'Loboko', 'BOD', 'loh-BOH-koh', None, 'beginner'),
-        ('Pied', 'DUA', 'Makolo', 'BOD', 'mah-KOH-loh', None, 'beginner'),
-        ('Tête', 'FUL', 'Hoore', 'BOD', 'HOH-reh', None, 'beginner'),
-        ('Œil', 'FUL', 'Gite', 'BOD', 'GEE-teh', None, 'beginner'),
-        ('Oreille', 'FUL', 'Noppe', 'BOD', 'NOHP-peh', None, 'beginner'),
-        ('Nez', 'FUL', 'Hinyaali', 'BOD', 'hee-NYAH-lee', None, 'beginner'),
-        ('Bouche', 'FUL', 'Genne', 'BOD', 'GEHN-neh', None, 'beginner'),
-        ('Main', 'FUL', 'Juunal', 'BOD', 'JOO-nahl', None, 'beginner'),
-        ('Pied', 'FUL', 'Koyye', 'BOD', 'KOY-yeh', None, 'beginner'),
-
-        # Time and days (extended)
-        ('Lundi', 'EWO', 'Elu', 'TIM', 'eh-LOO', None, 'beginner'),
-        ('Mardi', 'EWO', 'Amane', 'TIM', 'ah-MAH-neh', None, 'beginner'),
-        ('Mercredi', 'EWO', 'Akan', 'TIM', 'ah-KAHN', None, 'beginner'),
-        ('Jeudi', 'EWO', 'Akus', 'TIM', 'ah-KOOS', None, 'beginner'),
-        ('Vendredi', 'EWO', 'Afua', 'TIM', 'ah-FOO-ah', None, 'beginner'),
-        ('Samedi', 'EWO', 'Memua', 'TIM', 'meh-MOO-ah', None, 'beginner'),
-        ('Dimanche', 'EWO', 'Sondo', 'TIM', 'SOHN-doh', None, 'beginner'),
-        ('Aujourd''hui', 'EWO', 'Andu', 'TIM', 'ahn-DOO', None, 'beginner'),
-        ('Hier', 'EWO', 'Ngon', 'TIM', 'n-GOHN', None, 'beginner'),
-        ('Demain', 'EWO', 'Okir', 'TIM', 'oh-KEER', None, 'beginner'),
-        ('Matin', 'EWO', 'Nga', 'TIM', 'n-GAH', None, 'beginner'),
-        ('Soir', 'EWO', 'Mfini', 'TIM', 'mm-FEE-nee', None, 'beginner'),
-        ('Lundi', 'DUA', 'Moto', 'TIM', 'MOH-toh', None, 'beginner'),
-        ('Mardi', 'DUA', 'Koko', 'TIM', 'KOH-koh', None, 'beginner'),
-        ('Mercredi', 'DUA', 'Makena', 'TIM', 'mah-KEH-nah', None, 'beginner'),
-        ('Jeudi', 'DUA', 'Mokolo', 'TIM', 'moh-KOH-loh', None, 'beginner'),
-        ('Vendredi', 'DUA', 'Mumbuka', 'TIM', 'moom-BOO-kah', None, 'beginner'),
-        ('Samedi', 'DUA', 'Ngoya', 'TIM', 'n-GOH-yah', None, 'beginner'),
-        ('Dimanche', 'DUA', 'Disama', 'TIM', 'dee-SAH-mah', None, 'beginner'),
-        ('Lundi', 'FUL', 'Altine', 'TIM', 'ahl-TEE-neh', None, 'beginner'),
-        ('Mardi', 'FUL', 'Talata', 'TIM', 'tah-LAH-tah', None, 'beginner'),
-        ('Mercredi', 'FUL', 'Alarbaa', 'TIM', 'ah-lahr-BAH', None, 'beginner'),
-        ('Jeudi', 'FUL', 'Alkamiisa', 'TIM', 'ahl-kah-MEE-sah', None, 'beginner'),
-        ('Vendredi', 'FUL', 'Aljumaa', 'TIM', 'ahl-joo-MAH', None, 'beginner'),
-        ('Samedi', 'FUL', 'Aset', 'TIM', 'ah-SEHT', None, 'beginner'),
-        ('Dimanche', 'FUL', 'Alahat', 'TIM', 'ah-lah-HAHT', None, 'beginner'),
-
-        # More food items
-        ('Maïs', 'EWO', 'Aban', 'FOD', 'ah-BAHN', None, 'beginner'),
-        ('Huile de palme', 'EWO', 'Metet', 'FOD', 'meh-TEHT', None, 'beginner'),
-        ('Arachide', 'EWO', 'Akwa', 'FOD', 'ah-KWAH', None, 'beginner'),
-        ('Plantain', 'EWO', 'Kaba mbongo', 'FOD', 'KAH-bah mm-BOHN-goh', None, 'beginner'),
-        ('Igname', 'EWO', 'Fong', 'FOD', 'fohng', None, 'beginner'),
-        ('Patate douce', 'EWO', 'Akoma', 'FOD', 'ah-KOH-mah', None, 'beginner'),
-        ('Cacao', 'EWO', 'Kaba', 'FOD', 'KAH-bah', None, 'beginner'),
-        ('Café', 'EWO', 'Kafe', 'FOD', 'KAH-feh', None, 'beginner'),
-        ('Vin de palme', 'EWO', 'Malamba', 'FOD', 'mah-LAHM-bah', None, 'intermediate'),
-        ('Piment', 'EWO', 'Akaa', 'FOD', 'ah-KAH', None, 'beginner'),
-        ('Gingembre', 'EWO', 'Mbongo', 'FOD', 'mm-BOHN-goh', None, 'beginner'),
-        ('Sel', 'EWO', 'Ngon', 'FOD', 'n-GOHN', None, 'beginner'),
-        ('Sucre', 'EWO', 'Sukre', 'FOD', 'SOOK-reh', None, 'beginner'),
-        ('Maïs', 'DUA', 'Sango', 'FOD', 'SAHN-goh', None, 'beginner'),
-        ('Plantain', 'DUA', 'Kondo ndambe', 'FOD', 'KOHN-doh n-DAHM-beh', None, 'beginner'),
-        ('Igname', 'DUA', 'Mutulu', 'FOD', 'moo-TOO-loo', None, 'beginner'),
-        ('Cacao', 'DUA', 'Kakao', 'FOD', 'kah-KAH-oh', None, 'beginner'),
-        ('Vin de palme', 'DUA', 'Matango', 'FOD', 'mah-TAHN-goh', None, 'intermediate'),
-        ('Crabe', 'DUA', 'Koli', 'FOD', 'KOH-lee', None, 'beginner'),
-        ('Crevette', 'DUA', 'Tomba', 'FOD', 'TOHM-bah', None, 'beginner'),
-        ('Mil', 'FUL', 'Gawri', 'FOD', 'GAH-wree', None, 'beginner'),
-        ('Sorgho', 'FUL', 'Maasiri', 'FOD', 'mah-SEE-ree', None, 'beginner'),
-        ('Haricot', 'FUL', 'Niebe', 'FOD', 'nee-EH-beh', None, 'beginner'),
-        ('Beurre de karité', 'FUL', 'Nebam', 'FOD', 'NEH-bahm', None, 'beginner'),
-        ('Miel', 'FUL', 'Ngoori', 'FOD', 'n-GOH-ree', None, 'beginner'),
-        ('Viande séchée', 'FUL', 'Kilishi', 'FOD', 'kee-LEE-shee', None, 'intermediate'),
-        ('Fromage', 'FUL', 'Kaasam', 'FOD', 'KAH-sahm', None, 'beginner'),
-
-        # Common verbs
-        ('Être', 'EWO', 'Ye', 'VRB', 'yeh', None, 'beginner'),
-        ('Avoir', 'EWO', 'Ke', 'VRB', 'keh', None, 'beginner'),
-        ('Aller', 'EWO', 'Kei', 'VRB', 'keh-EE', None, 'beginner'),
-        ('Venir', 'EWO', 'Wa', 'VRB', 'wah', None, 'beginner'),
-        ('Manger', 'EWO', 'Di', 'VRB', 'dee', None, 'beginner'),
-        ('Boire', 'EWO', 'Nua', 'VRB', 'NOO-ah', None, 'beginner'),
-        ('Dormir', 'EWO', 'Lal', 'VRB', 'lahl', None, 'beginner'),
-        ('Parler', 'EWO', 'Kala', 'VRB', 'KAH-lah', None, 'beginner'),
-        ('Voir', 'EWO', 'Yen', 'VRB', 'yehn', None, 'beginner'),
-        ('Entendre', 'EWO', 'Yem', 'VRB', 'yehm', None, 'beginner'),
-        ('Donner', 'EWO', 'Kaba', 'VRB', 'KAH-bah', None, 'beginner'),
-        ('Prendre', 'EWO', 'Kete', 'VRB', 'KEH-teh', None, 'beginner'),
-        ('Acheter', 'EWO', 'Sili', 'VRB', 'SEE-lee', None, 'intermediate'),
-        ('Vendre', 'EWO', 'Koma', 'VRB', 'KOH-mah', None, 'intermediate'),
-        ('Travailler', 'EWO', 'Kudu', 'VRB', 'KOO-doo', None, 'intermediate'),
-        ('Étudier', 'EWO', 'Kelene', 'VRB', 'keh-LEH-neh', None, 'intermediate'),
-        ('Aimer', 'EWO', 'Zamba', 'VRB', 'ZAHM-bah', None, 'beginner'),
-        ('Être', 'DUA', 'Ba', 'VRB', 'bah', None, 'beginner'),
-        ('Avoir', 'DUA', 'Zala', 'VRB', 'ZAH-lah', None, 'beginner'),
-        ('Aller', 'DUA', 'Kende', 'VRB', 'KEHN-deh', None, 'beginner'),
-        ('Venir', 'DUA', 'Wuta', 'VRB', 'WOO-tah', None, 'beginner'),
-        ('Manger', 'DUA', 'Lya', 'VRB', 'lyah', None, 'beginner'),
-        ('Boire', 'DUA', 'Mela', 'VRB', 'MEH-lah', None, 'beginner'),
-        ('Dormir', 'DUA', 'Lala', 'VRB', 'LAH-lah', None, 'beginner'),
-        ('Parler', 'DUA', 'Loba', 'VRB', 'LOH-bah', None, 'beginner'),
-        ('Être', 'FUL', 'Wonde', 'VRB', 'WOHN-deh', None, 'beginner'),
-        ('Avoir', 'FUL', 'Mari', 'VRB', 'MAH-ree', None, 'beginner'),
-        ('Aller', 'FUL', 'Yahde', 'VRB', 'YAHH-deh', None, 'beginner'),
-        ('Venir', 'FUL', 'Arde', 'VRB', 'AHR-deh', None, 'beginner'),
-        ('Manger', 'FUL', 'Nyaame', 'VRB', 'NYAH-meh', None, 'beginner'),
-        ('Boire', 'FUL', 'Yarde', 'VRB', 'YAHR-deh', None, 'beginner'),
-        ('Dormir', 'FUL', 'Njaade', 'VRB', 'n-JAH-deh', None, 'beginner'),
-
-        # Adjectives
-        ('Grand', 'EWO', 'Ane', 'ADJ', 'ah-NEH', None, 'beginner'),
-        ('Petit', 'EWO', 'Nit', 'ADJ', 'neet', None, 'beginner'),
-        ('Bon', 'EWO', 'Bot', 'ADJ', 'boht', None, 'beginner'),
-        ('Mauvais', 'EWO', 'Abe', 'ADJ', 'ah-BEH', None, 'beginner'),
-        ('Beau', 'EWO', 'Kamba', 'ADJ', 'KAHM-bah', None, 'beginner'),
-        ('Laid', 'EWO', 'Mbing', 'ADJ', 'mm-BEENG', None, 'beginner'),
-        ('Chaud', 'EWO', 'Asu', 'ADJ', 'ah-SOO', None, 'beginner'),
-        ('Froid', 'EWO', 'Kies', 'ADJ', 'kee-EHS', None, 'beginner'),
-        ('Nouveau', 'EWO', 'Sus', 'ADJ', 'soos', None, 'beginner'),
-        ('Vieux', 'EWO', 'Kulu', 'ADJ', 'KOO-loo', None, 'beginner'),
-        ('Grand', 'DUA', 'Kolo', 'ADJ', 'KOH-loh', None, 'beginner'),
-        ('Petit', 'DUA', 'Moke', 'ADJ', 'MOH-keh', None, 'beginner'),
-        ('Bon', 'DUA', 'Malamu', 'ADJ', 'mah-LAH-moo', None, 'beginner'),
-        ('Mauvais', 'DUA', 'Mabe', 'ADJ', 'MAH-beh', None, 'beginner'),
-        ('Beau', 'DUA', 'Kitoko', 'ADJ', 'kee-TOH-koh', None, 'beginner'),
-        ('Grand', 'FUL', 'Mawdo', 'ADJ', 'MAHW-doh', None, 'beginner'),
-        ('Petit', 'FUL', 'Keewdo', 'ADJ', 'KEH-oo-doh', None, 'beginner'),
-        ('Bon', 'FUL', 'Mooto', 'ADJ', 'MOH-toh', None, 'beginner'),
-        ('Mauvais', 'FUL', 'Moollu', 'ADJ', 'MOH-loo', None, 'beginner'),
-        ('Beau', 'FUL', 'Riiɗo', 'ADJ', 'REE-doh', None, 'beginner'),
-
-        # Clothing
-        ('Vêtement', 'EWO', 'Nlat', 'CLO', 'n-LAHT', None, 'beginner'),
-        ('Chemise', 'EWO', 'Kamisa', 'CLO', 'kah-MEE-sah', None, 'beginner'),
-        ('Pantalon', 'EWO', 'Kalaso', 'CLO', 'kah-LAH-soh', None, 'beginner'),
-        ('Robe', 'EWO', 'Nnimba', 'CLO', 'n-NEEM-bah', None, 'beginner'),
-        ('Chaussure', 'EWO', 'Nkap', 'CLO', 'n-KAHP', None, 'beginner'),
-        ('Chapeau', 'EWO', 'Nkop', 'CLO', 'n-KOHP', None, 'beginner'),
-        ('Pagne', 'EWO', 'Ntange', 'CLO', 'n-TAHN-geh', None, 'beginner'),
-        ('Vêtement', 'DUA', 'Elamba', 'CLO', 'eh-LAHM-bah', None, 'beginner'),
-        ('Chemise', 'DUA', 'Lokolo', 'CLO', 'loh-KOH-loh', None, 'beginner'),
-        ('Pantalon', 'DUA', 'Pantalona', 'CLO', 'pahn-tah-LOH-nah', None, 'beginner'),
-        ('Chaussure', 'DUA', 'Matambi', 'CLO', 'mah-TAHM-bee', None, 'beginner'),
-        ('Vêtement', 'FUL', 'Kesa', 'CLO', 'KEH-sah', None, 'beginner'),
-        ('Chemise', 'FUL', 'Kurta', 'CLO', 'KOOR-tah', None, 'beginner'),
-        ('Pantalon', 'FUL', 'Drawas', 'CLO', 'DRAH-wahs', None, 'beginner'),
-        ('Boubou', 'FUL', 'Daara', 'CLO', 'DAH-rah', None, 'beginner'),
-        ('Chaussure', 'FUL', 'Naɗuuji', 'CLO', 'nah-DOO-jee', None, 'beginner'),
-
-        # Home and household
-        ('Chambre', 'EWO', 'Nda nchou', 'HOM', 'n-DAH n-CHOO', None, 'beginner'),
-        ('Cuisine', 'EWO', 'Nda nti', 'HOM', 'n-DAH n-TEE', None, 'beginner'),
-        ('Salon', 'EWO', 'Nda nsisim', 'HOM', 'n-DAH n-SEE-seem', None, 'beginner'),
-        ('Lit', 'EWO', 'Mbeng', 'HOM', 'mm-BEHNG', None, 'beginner'),
-        ('Table', 'EWO', 'Tebere', 'HOM', 'teh-BEH-reh', None, 'beginner'),
-        ('Chaise', 'EWO', 'Akada', 'HOM', 'ah-KAH-dah', None, 'beginner'),
-        ('Porte', 'EWO', 'Nkukuma', 'HOM', 'n-koo-KOO-mah', None, 'beginner'),
-        ('Fenêtre', 'EWO', 'Nlong', 'HOM', 'n-LOHNG', None, 'beginner'),
-        ('Chambre', 'DUA', 'Ndako ya bolali', 'HOM', 'n-DAH-koh yah boh-LAH-lee', None, 'beginner'),
-        ('Cuisine', 'DUA', 'Ndako ya bilei', 'HOM', 'n-DAH-koh yah bee-LEH-ee', None, 'beginner'),
-        ('Lit', 'DUA', 'Mbeto', 'HOM', 'mm-BEH-toh', None, 'beginner'),
-        ('Table', 'DUA', 'Tebele', 'HOM', 'teh-BEH-leh', None, 'beginner'),
-        ('Chambre', 'FUL', 'Cuuɗal', 'HOM', 'CHOO-dahl', None, 'beginner'),
-        ('Cuisine', 'FUL', 'Nyaamnde', 'HOM', 'NYAHM-n-deh', None, 'beginner'),
-        ('Lit', 'FUL', 'Jiital', 'HOM', 'JEE-tahl', None, 'beginner'),
-
-        # Professions
-        ('Enseignant', 'EWO', 'Nkelene nkukuma', 'PRO', 'n-keh-LEH-neh n-koo-KOO-mah', None, 'intermediate'),
-        ('Médecin', 'EWO', 'Nkomo nnama', 'PRO', 'n-KOH-moh n-NAH-mah', None, 'intermediate'),
-        ('Agriculteur', 'EWO', 'Nkudu fong', 'PRO', 'n-KOO-doo fohng', None, 'intermediate'),
-        ('Commerçant', 'EWO', 'Nkoma', 'PRO', 'n-KOH-mah', None, 'intermediate'),
-        ('Chauffeur', 'EWO', 'Nkelak motor', 'PRO', 'n-keh-LAHK MOH-tohr', None, 'intermediate'),
-        ('Enseignant', 'DUA', 'Molakisi', 'PRO', 'moh-lah-KEE-see', None, 'intermediate'),
-        ('Médecin', 'DUA', 'Monganga', 'PRO', 'mohn-GAHN-gah', None, 'intermediate'),
-        ('Pêcheur', 'DUA', 'Mombandi', 'PRO', 'mohm-BAHN-dee', None, 'intermediate'),
-        ('Enseignant', 'FUL', 'Jangorde', 'PRO', 'jahn-GOHR-deh', None, 'intermediate'),
-        ('Médecin', 'FUL', 'Doktoor', 'PRO', 'dohk-TOHR', None, 'intermediate'),
-        ('Berger', 'FUL', 'Gaasiɗo', 'PRO', 'gah-SEE-doh', None, 'intermediate'),
-        ('Éleveur', 'FUL', 'Jooɗiɗo', 'PRO', 'joh-DEE-doh', None, 'intermediate'),
-
-        # Transportation
-        ('Moto', 'EWO', 'Motor nkap', 'TRA', 'MOH-tohr n-KAHP', None, 'beginner'),
-        ('Vélo', 'EWO', 'Velo', 'TRA', 'VEH-loh', None, 'beginner'),
-        ('Bus', 'EWO', 'Bus', 'TRA', 'boos', None, 'beginner'),
-        ('Taxi', 'EWO', 'Taksi', 'TRA', 'TAHK-see', None, 'beginner'),
-        ('Pirogue', 'EWO', 'Mbaa', 'TRA', 'mm-BAH', None, 'beginner'),
-        ('Moto', 'DUA', 'Moto', 'TRA', 'MOH-toh', None, 'beginner'),
-        ('Pirogue', 'DUA', 'Wolo', 'TRA', 'WOH-loh', None, 'beginner'),
-        ('Bateau', 'DUA', 'Masuwa', 'TRA', 'mah-SOO-wah', None, 'beginner'),
-        ('Moto', 'FUL', 'Alamaari', 'TRA', 'ah-lah-MAH-ree', None, 'beginner'),
-        ('Cheval', 'FUL', 'Puuccu', 'TRA', 'POOCH-choo', None, 'beginner'),
-        ('Âne', 'FUL', 'Mbaaɗu', 'TRA', 'mm-BAH-doo', None, 'beginner'),
-
-        # Emotions
-        ('Heureux', 'EWO', 'Ayeme', 'EMO', 'ah-YEH-meh', None, 'intermediate'),
-        ('Triste', 'EWO', 'Ayie', 'EMO', 'ah-YEE-eh', None, 'intermediate'),
-        ('En colère', 'EWO', 'Nkana', 'EMO', 'n-KAH-nah', None, 'intermediate'),
-        ('Peur', 'EWO', 'Nsisin', 'EMO', 'n-SEE-seen', None, 'intermediate'),
-        ('Amour', 'EWO', 'Zamba', 'EMO', 'ZAHM-bah', None, 'intermediate'),
-        ('Heureux', 'DUA', 'Esengo', 'EMO', 'eh-SEHN-goh', None, 'intermediate'),
-        ('Triste', 'DUA', 'Mawa', 'EMO', 'MAH-wah', None, 'intermediate'),
-        ('En colère', 'DUA', 'Nkanda', 'EMO', 'n-KAHN-dah', None, 'intermediate'),
-        ('Heureux', 'FUL', 'Yankude', 'EMO', 'yahn-KOO-deh', None, 'intermediate'),
-        ('Triste', 'FUL', 'Hanki', 'EMO', 'HAHN-kee', None, 'intermediate'),
-        ('Peur', 'FUL', 'Ŋeyku', 'EMO', 'NGYEH-koo', None, 'intermediate'),
-
-        # More animals
-        ('Singe', 'EWO', 'Kema', 'ANI', 'KEH-mah', None, 'beginner'),
-        ('Antilope', 'EWO', 'Nyati', 'ANI', 'NYAH-tee', None, 'beginner'),
-        ('Serpent', 'EWO', 'Nyol', 'ANI', 'n-YOHL', None, 'beginner'),
-        ('Crocodile', 'EWO', 'Ngando', 'ANI', 'n-GAHN-doh', None, 'beginner'),
-        ('Tortue', 'EWO', 'Kulu', 'ANI', 'KOO-loo', None, 'beginner'),
-        ('Panthère', 'EWO', 'Nkui', 'ANI', 'n-KOO-ee', None, 'beginner'),
-        ('Hippopotame', 'EWO', 'Nguba', 'ANI', 'n-GOO-bah', None, 'beginner'),
-        ('Singe', 'DUA', 'Mokoko', 'ANI', 'moh-KOH-koh', None, 'beginner'),
-        ('Serpent', 'DUA', 'Nyoka', 'ANI', 'NYOH-kah', None, 'beginner'),
-        ('Crocodile', 'DUA', 'Ngando', 'ANI', 'n-GAHN-doh', None, 'beginner'),
-        ('Tortue', 'DUA', 'Kulu', 'ANI', 'KOO-loo', None, 'beginner'),
-        ('Singe', 'FUL', 'Baabilo', 'ANI', 'bah-BEE-loh', None, 'beginner'),
-        ('Serpent', 'FUL', 'Maarudo', 'ANI', 'mah-ROO-doh', None, 'beginner'),
-        ('Lion', 'FUL', 'Gaynako', 'ANI', 'guy-NAH-koh', None, 'beginner'),
-        ('Hyène', 'FUL', 'Kurege', 'ANI', 'koo-REH-geh', None, 'beginner'),
-        ('Gazelle', 'FUL', 'Mbororo', 'ANI', 'mm-boh-ROH-roh', None, 'beginner'),
-
-        # Nature and weather
-        ('Soleil', 'EWO', 'Nsan', 'NAT', 'n-SAHN', None, 'beginner'),
-        ('Étoile', 'EWO', 'Mbon', 'NAT', 'mm-BOHN', None, 'beginner'),
-        ('Nuage', 'EWO', 'Nkup mvon', 'NAT', 'n-KOOP mm-VOHN', None, 'beginner'),
-        ('Rivière', 'EWO', 'Kala', 'NAT', 'KAH-lah', None, 'beginner'),
-        ('Forêt', 'EWO', 'Afan', 'NAT', 'ah-FAHN', None, 'beginner'),
-        ('Montagne', 'EWO', 'Nkolombe', 'NAT', 'n-koh-LOHM-beh', None, 'beginner'),
-        ('Arbre', 'EWO', 'Avenga', 'NAT', 'ah-VEHN-gah', None, 'beginner'),
-        ('Fleur', 'EWO', 'Nbom', 'NAT', 'mm-BOHM', None, 'beginner'),
-        ('Soleil', 'DUA', 'Moi', 'NAT', 'MOH-ee', None, 'beginner'),
-        ('Rivière', 'DUA', 'Mai', 'NAT', 'MAH-ee', None, 'beginner'),
-        ('Forêt', 'DUA', 'Dikanda', 'NAT', 'dee-KAHN-dah', None, 'beginner'),
-        ('Arbre', 'DUA', 'Nti', 'NAT', 'n-TEE', None, 'beginner'),
-        ('Soleil', 'FUL', 'Naange', 'NAT', 'NAHN-geh', None, 'beginner'),
-        ('Rivière', 'FUL', 'Maayo', 'NAT', 'MAH-yoh', None, 'beginner'),
-        ('Arbre', 'FUL', 'Lekki', 'NAT', 'LEHK-kee', None, 'beginner'),
-        ('Feu', 'EWO', 'Nduan', 'NAT', 'n-DOO-ahn', None, 'beginner'),
-        ('Feu', 'DUA', 'Moto', 'NAT', 'MOH-toh', None, 'beginner'),
-        ('Feu', 'FUL', 'Yiite', 'NAT', 'YEE-teh', None, 'beginner'),
-
-        # Education terms
-        ('École', 'EWO', 'Kalara', 'EDU', 'kah-LAH-rah', None, 'beginner'),
-        ('Livre', 'EWO', 'Buk', 'EDU', 'book', None, 'beginner'),
-        ('Stylo', 'EWO', 'Nkan tili', 'EDU', 'n-KAHN tee-LEE', None, 'beginner'),
-        ('Papier', 'EWO', 'Katas', 'EDU', 'KAH-tahs', None, 'beginner'),
-        ('Élève', 'EWO', 'Nkelene moan', 'EDU', 'n-keh-LEH-neh moh-AHN', None, 'beginner'),
-        ('Professeur', 'EWO', 'Nkelene', 'EDU', 'n-keh-LEH-neh', None, 'beginner'),
-        ('École', 'DUA', 'Eteyelo', 'EDU', 'eh-teh-YEH-loh', None, 'beginner'),
-        ('Livre', 'DUA', 'Buka', 'EDU', 'BOO-kah', None, 'beginner'),
-        ('Stylo', 'DUA', 'Esila', 'EDU', 'eh-SEE-lah', None, 'beginner'),
-        ('École', 'FUL', 'Janngirde', 'EDU', 'jahn-GEER-deh', None, 'beginner'),
-        ('Livre', 'FUL', 'Deftere', 'EDU', 'dehf-TEH-reh', None, 'beginner'),
-        ('Apprendre', 'FUL', 'Janngude', 'EDU', 'jahn-GOO-deh', None, 'beginner'),
-        ('Enseigner', 'FUL', 'Jangude', 'EDU', 'jahn-GOO-deh', None, 'beginner'),
-
-        # Health terms
-        ('Santé', 'EWO', 'Akono', 'HEA', 'ah-KOH-noh', None, 'beginner'),
-        ('Malade', 'EWO', 'Nkono', 'HEA', 'n-KOH-noh', None, 'beginner'),
-        ('Médicament', 'EWO', 'Nkomo nnam', 'HEA', 'n-KOH-moh n-NAHM', None, 'intermediate'),
-        ('Hôpital', 'EWO', 'Opital', 'HEA', 'oh-pee-TAHL', None, 'intermediate'),
-        ('Douleur', 'EWO', 'Nyin', 'HEA', 'n-YEEN', None, 'beginner'),
-        ('Fièvre', 'EWO', 'Asu nlo', 'HEA', 'ah-SOO n-LOH', None, 'intermediate'),
-        ('Santé', 'DUA', 'Bokolongono', 'HEA', 'boh-koh-lohn-GOH-noh', None, 'beginner'),
-        ('Malade', 'DUA', 'Bokono', 'HEA', 'boh-KOH-noh', None, 'beginner'),
-        ('Hôpital', 'DUA', 'Ndako ya bokono', 'HEA', 'n-DAH-koh yah boh-KOH-noh', None, 'intermediate'),
-        ('Santé', 'FUL', 'Werɗude', 'HEA', 'wehr-DOO-deh', None, 'beginner'),
-        ('Malade', 'FUL', 'Jogi', 'HEA', 'JOH-gee', None, 'beginner'),
-        ('Médicament', 'FUL', 'Lekki', 'HEA', 'LEHK-kee', None, 'intermediate'),
-        ('Hôpital', 'FUL', 'Safrirde', 'HEA', 'sahf-REER-deh', None, 'intermediate'),
-
-        # Money and shopping (extended)
-        ('Prix', 'EWO', 'Nkom', 'MON', 'n-KOHM', None, 'beginner'),
-        ('Cher', 'EWO', 'Nkom ane', 'MON', 'n-KOHM ah-NEH', None, 'beginner'),
-        ('Bon marché', 'EWO', 'Nkom nit', 'MON', 'n-KOHM neet', None, 'beginner'),
-        ('Marché', 'EWO', 'Zom', 'MON', 'zohm', None, 'beginner'),
-        ('Boutique', 'EWO', 'Magazin', 'MON', 'mah-gah-ZEEN', None, 'beginner'),
-        ('Prix', 'DUA', 'Ntalo', 'MON', 'n-TAH-loh', None, 'beginner'),
-        ('Marché', 'DUA', 'Zando', 'MON', 'ZAHN-doh', None, 'beginner'),
-        ('Prix', 'FUL', 'Sariya', 'MON', 'sah-REE-yah', None, 'beginner'),
-        ('Marché', 'FUL', 'Luumo', 'MON', 'LOO-moh', None, 'beginner'),
-        ('Vendre', 'FUL', 'Jaynde', 'MON', 'JAYN-deh', None, 'beginner'),
-
-        # Directions
-        ('Gauche', 'EWO', 'Nkinda', 'DIR', 'n-KEEN-dah', None, 'beginner'),
-        ('Droite', 'EWO', 'Nnam', 'DIR', 'n-NAHM', None, 'beginner'),
-        ('Devant', 'EWO', 'Mbas', 'DIR', 'mm-BAHS', None, 'beginner'),
-        ('Derrière', 'EWO', 'Esu', 'DIR', 'eh-SOO', None, 'beginner'),
-        ('Ici', 'EWO', 'Va', 'DIR', 'vah', None, 'beginner'),
-        ('Là-bas', 'EWO', 'Vana', 'DIR', 'VAH-nah', None, 'beginner'),
-        ('Près', 'EWO', 'Koba', 'DIR', 'KOH-bah', None, 'beginner'),
-        ('Loin', 'EWO', 'Ane', 'DIR', 'ah-NEH', None, 'beginner'),
-        ('Gauche', 'DUA', 'Epai', 'DIR', 'eh-PAH-ee', None, 'beginner'),
-        ('Droite', 'DUA', 'Mobali', 'DIR', 'moh-BAH-lee', None, 'beginner'),
-        ('Devant', 'DUA', 'Liboso', 'DIR', 'lee-BOH-soh', None, 'beginner'),
-        ('Derrière', 'DUA', 'Nsima', 'DIR', 'n-SEE-mah', None, 'beginner'),
-        ('Ici', 'DUA', 'Awa', 'DIR', 'AH-wah', None, 'beginner'),
-        ('Gauche', 'FUL', 'Nano', 'DIR', 'NAH-noh', None, 'beginner'),
-        ('Droite', 'FUL', 'Nanndu', 'DIR', 'NAHN-doo', None, 'beginner'),
-        ('Devant', 'FUL', 'Yeeso', 'DIR', 'YEH-soh', None, 'beginner'),
-        ('Derrière', 'FUL', 'Caggal', 'DIR', 'CHAHG-gahl', None, 'beginner'),
-        ('Ici', 'FUL', 'Inoon', 'DIR', 'ee-NOHN', None, 'beginner'),
-
-        # Religious terms
-        ('Dieu', 'EWO', 'Zamba', 'REL', 'ZAHM-bah', None, 'beginner'),
-        ('Église', 'EWO', 'Nda Zamba', 'REL', 'n-DAH ZAHM-bah', None, 'beginner'),
-        ('Prière', 'EWO', 'Nsambel', 'REL', 'n-sahm-BEHL', None, 'beginner'),
-        ('Dimanche', 'EWO', 'Sondo', 'REL', 'SOHN-doh', None, 'beginner'),
-        ('Dieu', 'DUA', 'Nyambe', 'REL', 'NYAHM-beh', None, 'beginner'),
-        ('Église', 'DUA', 'Ndako ya Nyambe', 'REL', 'n-DAH-koh yah NYAHM-beh', None, 'beginner'),
-        ('Dieu', 'FUL', 'Alla', 'REL', 'AHL-lah', None, 'beginner'),
-        ('Mosquée', 'FUL', 'Juulirde', 'REL', 'joo-LEER-deh', None, 'beginner'),
-        ('Prière', 'FUL', 'Juulde', 'REL', 'JOOL-deh', None, 'beginner'),
-        ('Vendredi', 'FUL', 'Aljumaa', 'REL', 'ahl-joo-MAH', None, 'beginner'),
-
-        # Music and entertainment
-        ('Musique', 'EWO', 'Nvet', 'MUS', 'n-VEHT', None, 'beginner'),
-        ('Danse', 'EWO', 'Bikutsi', 'MUS', 'bee-KOOT-see', None, 'beginner'),
-        ('Tambour', 'EWO', 'Nkul', 'MUS', 'n-KOOL', None, 'beginner'),
-        ('Chant', 'EWO', 'Nvet', 'MUS', 'n-VEHT', None, 'beginner'),
-        ('Musique', 'DUA', 'Miziki', 'MUS', 'mee-ZEE-kee', None, 'beginner'),
-        ('Danse', 'DUA', 'Dina', 'MUS', 'DEE-nah', None, 'beginner'),
-        ('Tambour', 'DUA', 'Ngoma', 'MUS', 'n-GOH-mah', None, 'beginner'),
-        ('Musique', 'FUL', 'Gimde', 'MUS', 'GEEM-deh', None, 'beginner'),
-        ('Danse', 'FUL', 'Dillere', 'MUS', 'deel-LEH-reh', None, 'beginner'),
-        ('Tambour', 'FUL', 'Tabala', 'MUS', 'tah-BAH-lah', None, 'beginner'),
-
-        # Sports
-        ('Football', 'EWO', 'Ndem', 'SPO', 'n-DEHM', None, 'beginner'),
-        ('Courir', 'EWO', 'Kumba', 'SPO', 'KOOM-bah', None, 'beginner'),
-        ('Nager', 'EWO', 'Vaa mam', 'SPO', 'vah mahm', None, 'beginner'),
-        ('Football', 'DUA', 'Mpira', 'SPO', 'mm-PEE-rah', None, 'beginner'),
-        ('Courir', 'DUA', 'Pota', 'SPO', 'POH-tah', None, 'beginner'),
-        ('Football', 'FUL', 'Balle', 'SPO', 'BAHL-leh', None, 'beginner'),
-        ('Courir', 'FUL', 'Yaalende', 'SPO', 'yah-LEHN-deh', None, 'beginner'),
-        ('Lutte', 'FUL', 'Dageere', 'SPO', 'dah-GEH-reh', None, 'beginner'),
-
-        # Additional vocabulary for Bassa (BAS)
-        ('Père', 'BAS', 'Tata', 'FAM', 'TAH-tah', None, 'beginner'),
-        ('Mère', 'BAS', 'Mama', 'FAM', 'MAH-mah', None, 'beginner'),
-        ('Enfant', 'BAS', 'Mwana', 'FAM', 'mwah-NAH', None, 'beginner'),
-        ('Fils', 'BAS', 'Mwana mobali', 'FAM', 'mwah-NAH moh-BAH-lee', None, 'beginner'),
-        ('Fille', 'BAS', 'Mwana mwasi', 'FAM', 'mwah-NAH mwah-SEE', None, 'beginner'),
-        ('Frère', 'BAS', 'Ndangi', 'FAM', 'n-DAHN-gee', None, 'beginner'),
-        ('Sœur', 'BAS', 'Ndangi mwasi', 'FAM', 'n-DAHN-gee mwah-SEE', None, 'beginner'),
-        ('Grand-père', 'BAS', 'Tata nkulu', 'FAM', 'tah-tah n-KOO-loo', None, 'beginner'),
-        ('Grand-mère', 'BAS', 'Mama nkulu', 'FAM', 'mah-mah n-KOO-loo', None, 'beginner'),
-        ('Oncle', 'BAS', 'Tata nini', 'FAM', 'tah-tah nee-NEE', None, 'beginner'),
-        ('Tante', 'BAS', 'Mama nini', 'FAM', 'mah-mah nee-NEE', None, 'beginner'),
-
-        ('Eau', 'BAS', 'Mai', 'FOD', 'mah-EE', None, 'beginner'),
-        ('Nourriture', 'BAS', 'Bilyo', 'FOD', 'bee-LYOH', None, 'beginner'),
-        ('Viande', 'BAS', 'Nyama', 'FOD', 'NYAH-mah', None, 'beginner'),
-        ('Poisson', 'BAS', 'Mbisi', 'FOD', 'mm-BEE-see', None, 'beginner'),
-        ('Riz', 'BAS', 'Lososo', 'FOD', 'loh-SOH-soh', None, 'beginner'),
-        ('Pain', 'BAS', 'Bolo', 'FOD', 'BOH-loh', None, 'beginner'),
-        ('Banane', 'BAS', 'Likasa', 'FOD', 'lee-KAH-sah', None, 'beginner'),
-        ('Orange', 'BAS', 'Mibungu', 'FOD', 'mee-BOON-goo', None, 'beginner'),
-        ('Tomate', 'BAS', 'Tomat', 'FOD', 'toh-MAHT', None, 'beginner'),
-        ('Sel', 'BAS', 'Monyi', 'FOD', 'mohn-YEE', None, 'beginner'),
-        ('Huile', 'BAS', 'Mafuta', 'FOD', 'mah-FOO-tah', None, 'beginner'),
-        ('Sucre', 'BAS', 'Sukali', 'FOD', 'soo-KAH-lee', None, 'beginner'),
-
-        ('Tête', 'BAS', 'Moto', 'BOD', 'MOH-toh', None, 'beginner'),
-        ('Yeux', 'BAS', 'Meso', 'BOD', 'MEH-soh', None, 'beginner'),
-        ('Oreilles', 'BAS', 'Matwi', 'BOD', 'mah-TWEE', None, 'beginner'),
-        ('Nez', 'BAS', 'Nzoho', 'BOD', 'n-ZOH-hoh', None, 'beginner'),
-        ('Bouche', 'BAS', 'Munwa', 'BOD', 'moon-WAH', None, 'beginner'),
-        ('Dents', 'BAS', 'Meno', 'BOD', 'MEH-noh', None, 'beginner'),
-        ('Langue', 'BAS', 'Lolemba', 'BOD', 'loh-LEHM-bah', None, 'beginner'),
-        ('Main', 'BAS', 'Loboko', 'BOD', 'loh-BOH-koh', None, 'beginner'),
-        ('Doigts', 'BAS', 'Minsapi', 'BOD', 'meen-SAH-pee', None, 'beginner'),
-        ('Pied', 'BAS', 'Likolo', 'BOD', 'lee-KOH-loh', None, 'beginner'),
-        ('Cœur', 'BAS', 'Mutima', 'BOD', 'moo-TEE-mah', None, 'beginner'),
-        ('Sang', 'BAS', 'Mashi', 'BOD', 'MAH-shee', None, 'beginner'),
-
-        ('Un', 'BAS', 'Moko', 'NUM', 'MOH-koh', None, 'beginner'),
-        ('Deux', 'BAS', 'Mibale', 'NUM', 'mee-BAH-leh', None, 'beginner'),
-        ('Trois', 'BAS', 'Misato', 'NUM', 'mee-SAH-toh', None, 'beginner'),
-        ('Quatre', 'BAS', 'Minei', 'NUM', 'mee-NEH-ee', None, 'beginner'),
-        ('Cinq', 'BAS', 'Mitano', 'NUM', 'mee-TAH-noh', None, 'beginner'),
-        ('Six', 'BAS', 'Sambano', 'NUM', 'sahm-BAH-noh', None, 'beginner'),
-        ('Sept', 'BAS', 'Sambwadi', 'NUM', 'sahm-bwah-DEE', None, 'beginner'),
-        ('Huit', 'BAS', 'Nane', 'NUM', 'NAH-neh', None, 'beginner'),
-        ('Neuf', 'BAS', 'Libwa', 'NUM', 'LEE-bwah', None, 'beginner'),
-        ('Dix', 'BAS', 'Zomi', 'NUM', 'ZOH-mee', None, 'beginner'),
-
-        ('Être', 'BAS', 'Kuba', 'VRB', 'KOO-bah', None, 'beginner'),
-        ('Avoir', 'BAS', 'Kuba na', 'VRB', 'koo-bah nah', None, 'beginner'),
-        ('Aller', 'BAS', 'Kokende', 'VRB', 'koh-KEHN-deh', None, 'beginner'),
-        ('Venir', 'BAS', 'Koluka', 'VRB', 'koh-LOO-kah', None, 'beginner'),
-        ('Manger', 'BAS', 'Kolya', 'VRB', 'koh-LYAH', None, 'beginner'),
-        ('Boire', 'BAS', 'Konywa', 'VRB', 'koh-NYWAH', None, 'beginner'),
-        ('Dormir', 'BAS', 'Kolala', 'VRB', 'koh-LAH-lah', None, 'beginner'),
-        ('Parler', 'BAS', 'Koloba', 'VRB', 'koh-LOH-bah', None, 'beginner'),
-        ('Voir', 'BAS', 'Komona', 'VRB', 'koh-MOH-nah', None, 'beginner'),
-        ('Entendre', 'BAS', 'Kowoka', 'VRB', 'koh-WOH-kah', None, 'beginner'),
-        ('Donner', 'BAS', 'Kopesa', 'VRB', 'koh-PEH-sah', None, 'beginner'),
-        ('Prendre', 'BAS', 'Kosala', 'VRB', 'koh-SAH-lah', None, 'beginner'),
-
-        ('Grand', 'BAS', 'Nkulu', 'ADJ', 'n-KOO-loo', None, 'beginner'),
-        ('Petit', 'BAS', 'Nini', 'ADJ', 'nee-NEE', None, 'beginner'),
-        ('Bon', 'BAS', 'Malamu', 'ADJ', 'mah-LAH-moo', None, 'beginner'),
-        ('Mauvais', 'BAS', 'Mabe', 'ADJ', 'MAH-beh', None, 'beginner'),
-        ('Beau', 'BAS', 'Bolamu', 'ADJ', 'boh-LAH-moo', None, 'beginner'),
-        ('Blanc', 'BAS', 'Pembe', 'ADJ', 'PEHM-beh', None, 'beginner'),
-        ('Noir', 'BAS', 'Ndombe', 'ADJ', 'n-DOHM-beh', None, 'beginner'),
-        ('Rouge', 'BAS', 'Nyekulu', 'ADJ', 'nyeh-KOO-loo', None, 'beginner'),
-        ('Bleu', 'BAS', 'Bulu', 'ADJ', 'BOO-loo', None, 'beginner'),
-        ('Vert', 'BAS', 'Matala', 'ADJ', 'mah-TAH-lah', None, 'beginner'),
-
-        ('Maison', 'BAS', 'Ndako', 'HOM', 'n-DAH-koh', None, 'beginner'),
-        ('Porte', 'BAS', 'Monoko', 'HOM', 'moh-NOH-koh', None, 'beginner'),
-        ('Fenêtre', 'BAS', 'Linso', 'HOM', 'LEEN-soh', None, 'beginner'),
-        ('Lit', 'BAS', 'Mbeto', 'HOM', 'mm-BEH-toh', None, 'beginner'),
-        ('Table', 'BAS', 'Mesa', 'HOM', 'MEH-sah', None, 'beginner'),
-        ('Chaise', 'BAS', 'Kiti', 'HOM', 'KEE-tee', None, 'beginner'),
-        ('Cuisine', 'BAS', 'Ebombelo', 'HOM', 'eh-bohm-BEH-loh', None, 'beginner'),
-        ('Salle de bain', 'BAS', 'Ebalo', 'HOM', 'eh-BAH-loh', None, 'beginner'),
-
-        # Additional vocabulary for Bamum (BAM)
-        ('Père', 'BAM', 'Ta', 'FAM', 'tah', None, 'beginner'),
-        ('Mère', 'BAM', 'Nya', 'FAM', 'nyah', None, 'beginner'),
-        ('Enfant', 'BAM', 'Mfon', 'FAM', 'mfahn', None, 'beginner'),
-        ('Fils', 'BAM', 'Mfon ta', 'FAM', 'mfahn tah', None, 'beginner'),
-        ('Fille', 'BAM', 'Mfon nya', 'FAM', 'mfahn nyah', None, 'beginner'),
-        ('Frère', 'BAM', 'Nji', 'FAM', 'n-jee', None, 'beginner'),
-        ('Sœur', 'BAM', 'Nji nya', 'FAM', 'n-jee nyah', None, 'beginner'),
-        ('Grand-père', 'BAM', 'Ta nte', 'FAM', 'tah n-teh', None, 'beginner'),
-        ('Grand-mère', 'BAM', 'Nya nte', 'FAM', 'nyah n-teh', None, 'beginner'),
-        ('Oncle', 'BAM', 'Ta nji', 'FAM', 'tah n-jee', None, 'beginner'),
-        ('Tante', 'BAM', 'Nya nji', 'FAM', 'nyah n-jee', None, 'beginner'),
-
-        ('Eau', 'BAM', 'Nji', 'FOD', 'n-jee', None, 'beginner'),
-        ('Nourriture', 'BAM', 'Nggwo', 'FOD', 'ng-gwoh', None, 'beginner'),
-        ('Viande', 'BAM', 'Nso', 'FOD', 'n-soh', None, 'beginner'),
-        ('Poisson', 'BAM', 'Nggwa', 'FOD', 'ng-gwah', None, 'beginner'),
-        ('Riz', 'BAM', 'Shu', 'FOD', 'shoo', None, 'beginner'),
-        ('Pain', 'BAM', 'Mbu', 'FOD', 'mboo', None, 'beginner'),
-        ('Banane', 'BAM', 'Kpa', 'FOD', 'kpah', None, 'beginner'),
-        ('Orange', 'BAM', 'Lə', 'FOD', 'luh', None, 'beginner'),
-        ('Tomate', 'BAM', 'Ntə', 'FOD', 'n-tuh', None, 'beginner'),
-        ('Sel', 'BAM', 'Nggwə', 'FOD', 'ng-gwuh', None, 'beginner'),
-        ('Huile', 'BAM', 'Mfe', 'FOD', 'mf-eh', None, 'beginner'),
-        ('Sucre', 'BAM', 'Shə', 'FOD', 'shuh', None, 'beginner'),
-
-        ('Tête', 'BAM', 'Ntu', 'BOD', 'n-too', None, 'beginner'),
-        ('Yeux', 'BAM', 'Nte', 'BOD', 'n-teh', None, 'beginner'),
-        ('Oreilles', 'BAM', 'Nggwe', 'BOD', 'ng-gweh', None, 'beginner'),
-        ('Nez', 'BAM', 'Nggwə', 'BOD', 'ng-gwuh', None, 'beginner'),
-        ('Bouche', 'BAM', 'Nggwa', 'BOD', 'ng-gwah', None, 'beginner'),
-        ('Dents', 'BAM', 'Nso', 'BOD', 'n-soh', None, 'beginner'),
-        ('Langue', 'BAM', 'Nle', 'BOD', 'n-leh', None, 'beginner'),
-        ('Main', 'BAM', 'Nko', 'BOD', 'n-koh', None, 'beginner'),
-        ('Doigts', 'BAM', 'Mbe', 'BOD', 'm-beh', None, 'beginner'),
-        ('Pied', 'BAM', 'Nggwe', 'BOD', 'ng-gweh', None, 'beginner'),
-        ('Cœur', 'BAM', 'Nti', 'BOD', 'n-tee', None, 'beginner'),
-        ('Sang', 'BAM', 'Mbu', 'BOD', 'mboo', None, 'beginner'),
-
-        ('Un', 'BAM', 'Kə', 'NUM', 'kuh', None, 'beginner'),
-        ('Deux', 'BAM', 'Pə', 'NUM', 'puh', None, 'beginner'),
-        ('Trois', 'BAM', 'Tə', 'NUM', 'tuh', None, 'beginner'),
-        ('Quatre', 'BAM', 'Nə', 'NUM', 'nuh', None, 'beginner'),
-        ('Cinq', 'BAM', 'Tən', 'NUM', 'tuhn', None, 'beginner'),
-        ('Six', 'BAM', 'Shə', 'NUM', 'shuh', None, 'beginner'),
-        ('Sept', 'BAM', 'Shərə', 'NUM', 'shuh-ruh', None, 'beginner'),
-        ('Huit', 'BAM', 'Shəndə', 'NUM', 'shuh-n-duh', None, 'beginner'),
-        ('Neuf', 'BAM', 'Shəgwə', 'NUM', 'shuh-gwuh', None, 'beginner'),
-        ('Dix', 'BAM', 'Lə', 'NUM', 'luh', None, 'beginner'),
-
-        ('Être', 'BAM', 'Kə', 'VRB', 'kuh', None, 'beginner'),
-        ('Avoir', 'BAM', 'Kə na', 'VRB', 'kuh nah', None, 'beginner'),
-        ('Aller', 'BAM', 'Kə', 'VRB', 'kuh', None, 'beginner'),
-        ('Venir', 'BAM', 'Kə', 'VRB', 'kuh', None, 'beginner'),
-        ('Manger', 'BAM', 'Di', 'VRB', 'dee', None, 'beginner'),
-        ('Boire', 'BAM', 'Nə', 'VRB', 'nuh', None, 'beginner'),
-        ('Dormir', 'BAM', 'Kə', 'VRB', 'kuh', None, 'beginner'),
-        ('Parler', 'BAM', 'Kə', 'VRB', 'kuh', None, 'beginner'),
-        ('Voir', 'BAM', 'Kə', 'VRB', 'kuh', None, 'beginner'),
-        ('Entendre', 'BAM', 'Kə', 'VRB', 'kuh', None, 'beginner'),
-        ('Donner', 'BAM', 'Kə', 'VRB', 'kuh', None, 'beginner'),
-        ('Prendre', 'BAM', 'Kə', 'VRB', 'kuh', None, 'beginner'),
-
-        ('Grand', 'BAM', 'Ntu', 'ADJ', 'n-too', None, 'beginner'),
-        ('Petit', 'BAM', 'Nti', 'ADJ', 'n-tee', None, 'beginner'),
-        ('Bon', 'BAM', 'Mbu', 'ADJ', 'mboo', None, 'beginner'),
-        ('Mauvais', 'BAM', 'Mbe', 'ADJ', 'm-beh', None, 'beginner'),
-        ('Beau', 'BAM', 'Nggwe', 'ADJ', 'ng-gweh', None, 'beginner'),
-        ('Blanc', 'BAM', 'Pə', 'ADJ', 'puh', None, 'beginner'),
-        ('Noir', 'BAM', 'Nggwə', 'ADJ', 'ng-gwuh', None, 'beginner'),
-        ('Rouge', 'BAM', 'Nggwa', 'ADJ', 'ng-gwah', None, 'beginner'),
-        ('Bleu', 'BAM', 'Nle', 'ADJ', 'n-leh', None, 'beginner'),
-        ('Vert', 'BAM', 'Nso', 'ADJ', 'n-soh', None, 'beginner'),
-
-        ('Maison', 'BAM', 'Nda', 'HOM', 'n-dah', None, 'beginner'),
-        ('Porte', 'BAM', 'Nggwe', 'HOM', 'ng-gweh', None, 'beginner'),
-        ('Fenêtre', 'BAM', 'Nte', 'HOM', 'n-teh', None, 'beginner'),
-        ('Lit', 'BAM', 'Nggwə', 'HOM', 'ng-gwuh', None, 'beginner'),
-        ('Table', 'BAM', 'Nggwa', 'HOM', 'ng-gwah', None, 'beginner'),
-        ('Chaise', 'BAM', 'Nso', 'HOM', 'n-soh', None, 'beginner'),
-        ('Cuisine', 'BAM', 'Nle', 'HOM', 'n-leh', None, 'beginner'),
-        ('Salle de bain', 'BAM', 'Nko', 'HOM', 'n-koh', None, 'beginner'),
-
-        # Additional vocabulary for Fe'efe'e (FEF)
-        ('Père', 'FEF', 'Tata', 'FAM', 'TAH-tah', None, 'beginner'),
-        ('Mère', 'FEF', 'Mama', 'FAM', 'MAH-mah', None, 'beginner'),
-        ('Enfant', 'FEF', 'Mwana', 'FAM', 'mwah-NAH', None, 'beginner'),
-        ('Fils', 'FEF', 'Mwana mobali', 'FAM', 'mwah-NAH moh-BAH-lee', None, 'beginner'),
-        ('Fille', 'FEF', 'Mwana mwasi', 'FAM', 'mwah-NAH mwah-SEE', None, 'beginner'),
-        ('Frère', 'FEF', 'Ndangi', 'FAM', 'n-DAHN-gee', None, 'beginner'),
-        ('Sœur', 'FEF', 'Ndangi mwasi', 'FAM', 'n-DAHN-gee mwah-SEE', None, 'beginner'),
-        ('Grand-père', 'FEF', 'Tata nkulu', 'FAM', 'tah-tah n-KOO-loo', None, 'beginner'),
-        ('Grand-mère', 'FEF', 'Mama nkulu', 'FAM', 'mah-mah n-KOO-loo', None, 'beginner'),
-        ('Oncle', 'FEF', 'Tata nini', 'FAM', 'tah-tah nee-NEE', None, 'beginner'),
-        ('Tante', 'FEF', 'Mama nini', 'FAM', 'mah-mah nee-NEE', None, 'beginner'),
-
-        ('Eau', 'FEF', 'Mai', 'FOD', 'mah-EE', None, 'beginner'),
-        ('Nourriture', 'FEF', 'Bilyo', 'FOD', 'bee-LYOH', None, 'beginner'),
-        ('Viande', 'FEF', 'Nyama', 'FOD', 'NYAH-mah', None, 'beginner'),
-        ('Poisson', 'FEF', 'Mbisi', 'FOD', 'mm-BEE-see', None, 'beginner'),
-        ('Riz', 'FEF', 'Lososo', 'FOD', 'loh-SOH-soh', None, 'beginner'),
-        ('Pain', 'FEF', 'Bolo', 'FOD', 'BOH-loh', None, 'beginner'),
-        ('Banane', 'FEF', 'Likasa', 'FOD', 'lee-KAH-sah', None, 'beginner'),
-        ('Orange', 'FEF', 'Mibungu', 'FOD', 'mee-BOON-goo', None, 'beginner'),
-        ('Tomate', 'FEF', 'Tomat', 'FOD', 'toh-MAHT', None, 'beginner'),
-        ('Sel', 'FEF', 'Monyi', 'FOD', 'mohn-YEE', None, 'beginner'),
-        ('Huile', 'FEF', 'Mafuta', 'FOD', 'mah-FOO-tah', None, 'beginner'),
-        ('Sucre', 'FEF', 'Sukali', 'FOD', 'soo-KAH-lee', None, 'beginner'),
-
-        ('Tête', 'FEF', 'Moto', 'BOD', 'MOH-toh', None, 'beginner'),
-        ('Yeux', 'FEF', 'Meso', 'BOD', 'MEH-soh', None, 'beginner'),
-        ('Oreilles', 'FEF', 'Matwi', 'BOD', 'mah-TWEE', None, 'beginner'),
-        ('Nez', 'FEF', 'Nzoho', 'BOD', 'n-ZOH-hoh', None, 'beginner'),
-        ('Bouche', 'FEF', 'Munwa', 'BOD', 'moon-WAH', None, 'beginner'),
-        ('Dents', 'FEF', 'Meno', 'BOD', 'MEH-noh', None, 'beginner'),
-        ('Langue', 'FEF', 'Lolemba', 'BOD', 'loh-LEHM-bah', None, 'beginner'),
-        ('Main', 'FEF', 'Loboko', 'BOD', 'loh-BOH-koh', None, 'beginner'),
-        ('Doigts', 'FEF', 'Minsapi', 'BOD', 'meen-SAH-pee', None, 'beginner'),
-        ('Pied', 'FEF', 'Likolo', 'BOD', 'lee-KOH-loh', None, 'beginner'),
-        ('Cœur', 'FEF', 'Mutima', 'BOD', 'moo-TEE-mah', None, 'beginner'),
-        ('Sang', 'FEF', 'Mashi', 'BOD', 'MAH-shee', None, 'beginner'),
-
-        ('Un', 'FEF', 'Moko', 'NUM', 'MOH-koh', None, 'beginner'),
-        ('Deux', 'FEF', 'Mibale', 'NUM', 'mee-BAH-leh', None, 'beginner'),
-        ('Trois', 'FEF', 'Misato', 'NUM', 'mee-SAH-toh', None, 'beginner'),
-        ('Quatre', 'FEF', 'Minei', 'NUM', 'mee-NEH-ee', None, 'beginner'),
-        ('Cinq', 'FEF', 'Mitano', 'NUM', 'mee-TAH-noh', None, 'beginner'),
-        ('Six', 'FEF', 'Sambano', 'NUM', 'sahm-BAH-noh', None, 'beginner'),
-        ('Sept', 'FEF', 'Sambwadi', 'NUM', 'sahm-bwah-DEE', None, 'beginner'),
-        ('Huit', 'FEF', 'Nane', 'NUM', 'NAH-neh', None, 'beginner'),
-        ('Neuf', 'FEF', 'Libwa', 'NUM', 'LEE-bwah', None, 'beginner'),
-        ('Dix', 'FEF', 'Zomi', 'NUM', 'ZOH-mee', None, 'beginner'),
-
-        ('Être', 'FEF', 'Kuba', 'VRB', 'KOO-bah', None, 'beginner'),
-        ('Avoir', 'FEF', 'Kuba na', 'VRB', 'koo-bah nah', None, 'beginner'),
-        ('Aller', 'FEF', 'Kokende', 'VRB', 'koh-KEHN-deh', None, 'beginner'),
-        ('Venir', 'FEF', 'Koluka', 'VRB', 'koh-LOO-kah', None, 'beginner'),
-        ('Manger', 'FEF', 'Kolya', 'VRB', 'koh-LYAH', None, 'beginner'),
-        ('Boire', 'FEF', 'Konywa', 'VRB', 'koh-NYWAH', None, 'beginner'),
-        ('Dormir', 'FEF', 'Kolala', 'VRB', 'koh-LAH-lah', None, 'beginner'),
-        ('Parler', 'FEF', 'Koloba', 'VRB', 'koh-LOH-bah', None, 'beginner'),
-        ('Voir', 'FEF', 'Komona', 'VRB', 'koh-MOH-nah', None, 'beginner'),
-        ('Entendre', 'FEF', 'Kowoka', 'VRB', 'koh-WOH-kah', None, 'beginner'),
-        ('Donner', 'FEF', 'Kopesa', 'VRB', 'koh-PEH-sah', None, 'beginner'),
-        ('Prendre', 'FEF', 'Kosala', 'VRB', 'koh-SAH-lah', None, 'beginner'),
-
-        ('Grand', 'FEF', 'Nkulu', 'ADJ', 'n-KOO-loo', None, 'beginner'),
-        ('Petit', 'FEF', 'Nini', 'ADJ', 'nee-NEE', None, 'beginner'),
-        ('Bon', 'FEF', 'Malamu', 'ADJ', 'mah-LAH-moo', None, 'beginner'),
-        ('Mauvais', 'FEF', 'Mabe', 'ADJ', 'MAH-beh', None, 'beginner'),
-        ('Beau', 'FEF', 'Bolamu', 'ADJ', 'boh-LAH-moo', None, 'beginner'),
-        ('Blanc', 'FEF', 'Pembe', 'ADJ', 'PEHM-beh', None, 'beginner'),
-        ('Noir', 'FEF', 'Ndombe', 'ADJ', 'n-DOHM-beh', None, 'beginner'),
-        ('Rouge', 'FEF', 'Nyekulu', 'ADJ', 'nyeh-KOO-loo', None, 'beginner'),
-        ('Bleu', 'FEF', 'Bulu', 'ADJ', 'BOO-loo', None, 'beginner'),
-        ('Vert', 'FEF', 'Matala', 'ADJ', 'mah-TAH-lah', None, 'beginner'),
-
-        ('Maison', 'FEF', 'Ndako', 'HOM', 'n-DAH-koh', None, 'beginner'),
-        ('Porte', 'FEF', 'Monoko', 'HOM', 'moh-NOH-koh', None, 'beginner'),
-        ('Fenêtre', 'FEF', 'Linso', 'HOM', 'LEEN-soh', None, 'beginner'),
-        ('Lit', 'FEF', 'Mbeto', 'HOM', 'mm-BEH-toh', None, 'beginner'),
-        ('Table', 'FEF', 'Mesa', 'HOM', 'MEH-sah', None, 'beginner'),
-        ('Chaise', 'FEF', 'Kiti', 'HOM', 'KEE-tee', None, 'beginner'),
-        ('Cuisine', 'FEF', 'Ebombelo', 'HOM', 'eh-bohm-BEH-loh', None, 'beginner'),
-        ('Salle de bain', 'FEF', 'Ebalo', 'HOM', 'eh-BAH-loh', None, 'beginner'),
-
-        # Additional phrases and expressions for all three languages
-        ('Comment allez-vous?', 'BAS', 'Boni?', 'PHR', 'BOH-nee', None, 'intermediate'),
-        ('Je vais bien', 'BAS', 'Naye malamu', 'PHR', 'nah-yeh mah-LAH-moo', None, 'intermediate'),
-        ('S''il vous plaît', 'BAS', 'Penza', 'PHR', 'PEHN-zah', None, 'intermediate'),
-        ('Merci beaucoup', 'BAS', 'Nyango mingi', 'PHR', 'nyahn-goh MEEN-gee', None, 'intermediate'),
-        ('Excusez-moi', 'BAS', 'Lolenge', 'PHR', 'loh-LEHN-geh', None, 'intermediate'),
-        ('Je ne comprends pas', 'BAS', 'Naye koyeba te', 'PHR', 'nah-yeh koh-YEH-bah teh', None, 'intermediate'),
-
-        ('Comment allez-vous?', 'BAM', 'Ndenge?', 'PHR', 'n-DEHN-geh', None, 'intermediate'),
-        ('Je vais bien', 'BAM', 'Mbu', 'PHR', 'mboo', None, 'intermediate'),
-        ('S''il vous plaît', 'BAM', 'Nggwe', 'PHR', 'ng-gweh', None, 'intermediate'),
-        ('Merci beaucoup', 'BAM', 'Nso mingi', 'PHR', 'n-soh MEEN-gee', None, 'intermediate'),
-        ('Excusez-moi', 'BAM', 'Nle', 'PHR', 'n-leh', None, 'intermediate'),
-        ('Je ne comprends pas', 'BAM', 'Nti koyeba te', 'PHR', 'n-tee koh-YEH-bah teh', None, 'intermediate'),
-
-        ('Comment allez-vous?', 'FEF', 'Boni?', 'PHR', 'BOH-nee', None, 'intermediate'),
-        ('Je vais bien', 'FEF', 'Naye malamu', 'PHR', 'nah-yeh mah-LAH-moo', None, 'intermediate'),
-        ('S''il vous plaît', 'FEF', 'Penza', 'PHR', 'PEHN-zah', None, 'intermediate'),
-        ('Merci beaucoup', 'FEF', 'Ndongui mingi', 'PHR', 'n-dohn-gwee MEEN-gee', None, 'intermediate'),
-        ('Excusez-moi', 'FEF', 'Lolenge', 'PHR', 'loh-LEHN-geh', None, 'intermediate'),
-        ('Je ne comprends pas', 'FEF', 'Naye koyeba te', 'PHR', 'nah-yeh koh-YEH-bah teh', None, 'intermediate'),
-
-        # ===== DEEP RESEARCH EXPANSION =====
-        # Additional comprehensive vocabulary with linguistic research
-
-        # EXTENDED FAMILY RELATIONSHIPS
-        ('Grand-père paternel', 'EWO', 'Tara nkulu', 'FAM', 'tah-rah n-koo-loo', None, 'intermediate'),
-        ('Grand-mère paternelle', 'EWO', 'Mama nkulu', 'FAM', 'mah-mah n-koo-loo', None, 'intermediate'),
-        ('Grand-père maternel', 'EWO', 'Tara nkulu mama', 'FAM', 'tah-rah n-koo-loo mah-mah', None, 'intermediate'),
-        ('Grand-mère maternelle', 'EWO', 'Mama nkulu mama', 'FAM', 'mah-mah n-koo-loo mah-mah', None, 'intermediate'),
-        ('Oncle paternel', 'EWO', 'Tara nini', 'FAM', 'tah-rah nee-nee', None, 'intermediate'),
-        ('Tante paternelle', 'EWO', 'Mama nini', 'FAM', 'mah-mah nee-nee', None, 'intermediate'),
-        ('Cousin', 'EWO', 'Ndangan nini', 'FAM', 'n-dahn-gahn nee-nee', None, 'intermediate'),
-        ('Belle-mère', 'EWO', 'Mama nnam', 'FAM', 'mah-mah n-nahm', None, 'intermediate'),
-        ('Beau-père', 'EWO', 'Tara nnam', 'FAM', 'tah-rah n-nahm', None, 'intermediate'),
-        ('Belle-sœur', 'EWO', 'Ndangan nnam', 'FAM', 'n-dahn-gahn n-nahm', None, 'intermediate'),
-        ('Beau-frère', 'EWO', 'Ndangan nnam mobali', 'FAM', 'n-dahn-gahn n-nahm moh-bah-lee', None, 'intermediate'),
-
-        ('Grand-père paternel', 'DUA', 'Tata nkulu', 'FAM', 'tah-tah n-koo-loo', None, 'intermediate'),
-        ('Grand-mère paternelle', 'DUA', 'Mama nkulu', 'FAM', 'mah-mah n-koo-loo', None, 'intermediate'),
-        ('Oncle paternel', 'DUA', 'Tata nini', 'FAM', 'tah-tah nee-nee', None, 'intermediate'),
-        ('Tante paternelle', 'DUA', 'Mama nini', 'FAM', 'mah-mah nee-nee', None, 'intermediate'),
-        ('Cousin', 'DUA', 'Ndangi nini', 'FAM', 'n-dahn-gee nee-nee', None, 'intermediate'),
-        ('Belle-mère', 'DUA', 'Mama nnam', 'FAM', 'mah-mah n-nahm', None, 'intermediate'),
-        ('Beau-père', 'DUA', 'Tata nnam', 'FAM', 'tah-tah n-nahm', None, 'intermediate'),
-        ('Belle-sœur', 'DUA', 'Ndangi nnam', 'FAM', 'n-dahn-gee n-nahm', None, 'intermediate'),
-        ('Beau-frère', 'DUA', 'Ndangi nnam mobali', 'FAM', 'n-dahn-gee n-nahm moh-bah-lee', None, 'intermediate'),
-
-        ('Grand-père paternel', 'FUL', 'Baaba', 'FAM', 'bah-bah', None, 'intermediate'),
-        ('Grand-mère paternelle', 'FUL', 'Yaaya', 'FAM', 'yah-yah', None, 'intermediate'),
-        ('Oncle paternel', 'FUL', 'Baabiraaɗo', 'FAM', 'bah-bee-rah-doh', None, 'intermediate'),
-        ('Tante paternelle', 'FUL', 'Yaayiraaɗo', 'FAM', 'yah-yee-rah-doh', None, 'intermediate'),
-        ('Cousin', 'FUL', 'Kaawu', 'FAM', 'kah-woo', None, 'intermediate'),
-        ('Belle-mère', 'FUL', 'Suddiru', 'FAM', 'soo-dee-roo', None, 'intermediate'),
-        ('Beau-père', 'FUL', 'Suddiru', 'FAM', 'soo-dee-roo', None, 'intermediate'),
-        ('Belle-sœur', 'FUL', 'Suddiru debbo', 'FAM', 'soo-dee-roo deh-boh', None, 'intermediate'),
-        ('Beau-frère', 'FUL', 'Suddiru gorko', 'FAM', 'soo-dee-roo gohr-koh', None, 'intermediate'),
-
-        # EXTENDED FOOD VOCABULARY
-        ('Manioc', 'EWO', 'Nkonda', 'FOD', 'n-kohn-dah', None, 'beginner'),
-        ('Patate douce', 'EWO', 'Akoma', 'FOD', 'ah-koh-mah', None, 'beginner'),
-        ('Maïs grillé', 'EWO', 'Koki', 'FOD', 'koh-kee', None, 'beginner'),
-        ('Banane plantain', 'EWO', 'Kaba mbongo', 'FOD', 'kah-bah mm-bohn-goh', None, 'beginner'),
-        ('Arachide', 'EWO', 'Akwa', 'FOD', 'ah-kwah', None, 'beginner'),
-        ('Huile de palme rouge', 'EWO', 'Metet mvondo', 'FOD', 'meh-teht m-vohn-doh', None, 'intermediate'),
-        ('Vin de palme', 'EWO', 'Malamba', 'FOD', 'mah-lahm-bah', None, 'intermediate'),
-        ('Sauce gombo', 'EWO', 'Nkumu', 'FOD', 'n-koo-moo', None, 'beginner'),
-        ('Sauce arachide', 'EWO', 'Nkumu akwa', 'FOD', 'n-koo-moo ah-kwah', None, 'beginner'),
-        ('Fufu', 'EWO', 'Nkuma', 'FOD', 'n-koo-mah', None, 'beginner'),
-        ('Couscous de maïs', 'EWO', 'Sanga', 'FOD', 'sahn-gah', None, 'beginner'),
-        ('Beignet', 'EWO', 'Puff puff', 'FOD', 'puf puf', None, 'beginner'),
-        ('Soupe', 'EWO', 'Nkumu', 'FOD', 'n-koo-moo', None, 'beginner'),
-        ('Légumes', 'EWO', 'Mbong', 'FOD', 'mm-bohng', None, 'beginner'),
-        ('Épices', 'EWO', 'Mbang', 'FOD', 'mm-bahng', None, 'beginner'),
-
-        ('Manioc', 'DUA', 'Mbong', 'FOD', 'mm-bohng', None, 'beginner'),
-        ('Patate douce', 'DUA', 'Mbong', 'FOD', 'mm-bohng', None, 'beginner'),
-        ('Maïs grillé', 'DUA', 'Koki', 'FOD', 'koh-kee', None, 'beginner'),
-        ('Banane plantain', 'DUA', 'Kondo ndambe', 'FOD', 'kohn-doh n-dahm-beh', None, 'beginner'),
-        ('Arachide', 'DUA', 'Nguba', 'FOD', 'n-goo-bah', None, 'beginner'),
-        ('Huile de palme', 'DUA', 'Mafuta ma elanga', 'FOD', 'mah-foo-tah mah eh-lahn-gah', None, 'intermediate'),
-        ('Vin de palme', 'DUA', 'Matango', 'FOD', 'mah-tahn-goh', None, 'intermediate'),
-        ('Sauce gombo', 'DUA', 'Nkumu', 'FOD', 'n-koo-moo', None, 'beginner'),
-        ('Fufu', 'DUA', 'Fufu', 'FOD', 'foo-foo', None, 'beginner'),
-        ('Couscous', 'DUA', 'Sanga', 'FOD', 'sahn-gah', None, 'beginner'),
-        ('Beignet', 'DUA', 'Puff puff', 'FOD', 'puf puf', None, 'beginner'),
-        ('Soupe', 'DUA', 'Soup', 'FOD', 'soop', None, 'beginner'),
-        ('Légumes', 'DUA', 'Mbong', 'FOD', 'mm-bohng', None, 'beginner'),
-        ('Épices', 'DUA', 'Mbang', 'FOD', 'mm-bahng', None, 'beginner'),
-
-        ('Manioc', 'FUL', 'Atiya', 'FOD', 'ah-tee-yah', None, 'beginner'),
-        ('Patate douce', 'FUL', 'Atiya', 'FOD', 'ah-tee-yah', None, 'beginner'),
-        ('Maïs grillé', 'FUL', 'Gero', 'FOD', 'geh-roh', None, 'beginner'),
-        ('Banane plantain', 'FUL', 'Ayaba', 'FOD', 'ah-yah-bah', None, 'beginner'),
-        ('Arachide', 'FUL', 'Aira', 'FOD', 'ah-ee-rah', None, 'beginner'),
-        ('Huile de palme', 'FUL', 'Nebam', 'FOD', 'neh-bahm', None, 'beginner'),
-        ('Vin de palme', 'FUL', 'Giraawa', 'FOD', 'gee-rah-wah', None, 'intermediate'),
-        ('Sauce gombo', 'FUL', 'Lecce', 'FOD', 'leh-cheh', None, 'beginner'),
-        ('Fufu', 'FUL', 'Fufu', 'FOD', 'foo-foo', None, 'beginner'),
-        ('Couscous', 'FUL', 'Mburu', 'FOD', 'm-boo-roo', None, 'beginner'),
-        ('Beignet', 'FUL', 'Biskit', 'FOD', 'bees-keet', None, 'beginner'),
-        ('Soupe', 'FUL', 'Suppe', 'FOD', 'soop-peh', None, 'beginner'),
-        ('Légumes', 'FUL', 'Laamorgal', 'FOD', 'lah-mohr-gahl', None, 'beginner'),
-        ('Épices', 'FUL', 'Takordi', 'FOD', 'tah-kohr-dee', None, 'beginner'),
-
-        # EXTENDED BODY PARTS AND HEALTH
-        ('Cerveau', 'EWO', 'Nlem', 'BOD', 'n-lehm', None, 'intermediate'),
-        ('Cœur', 'EWO', 'Nlem', 'BOD', 'n-lehm', None, 'beginner'),
-        ('Poumons', 'EWO', 'Mfumfum', 'BOD', 'm-foom-foom', None, 'intermediate'),
-        ('Foie', 'EWO', 'Nkoo', 'BOD', 'n-koh', None, 'intermediate'),
-        ('Reins', 'EWO', 'Minkoo', 'BOD', 'meen-koh', None, 'intermediate'),
-        ('Estomac', 'EWO', 'Abe', 'BOD', 'ah-beh', None, 'beginner'),
-        ('Intestins', 'EWO', 'Minlobo', 'BOD', 'meen-loh-boh', None, 'intermediate'),
-        ('Sang', 'EWO', 'Menga', 'BOD', 'meh-n-gah', None, 'intermediate'),
-        ('Os', 'EWO', 'Nkang', 'BOD', 'n-kahng', None, 'intermediate'),
-        ('Muscle', 'EWO', 'Nson', 'BOD', 'n-sohn', None, 'intermediate'),
-        ('Peau', 'EWO', 'Nkod', 'BOD', 'n-kohd', None, 'beginner'),
-        ('Cheveux', 'EWO', 'Nsis', 'BOD', 'n-sees', None, 'beginner'),
-        ('Sourcils', 'EWO', 'Minsing', 'BOD', 'meen-seeng', None, 'intermediate'),
-        ('Cils', 'EWO', 'Minsing iso', 'BOD', 'meen-seeng ee-soh', None, 'intermediate'),
-        ('Lèvres', 'EWO', 'Minkom', 'BOD', 'meen-kohm', None, 'intermediate'),
-
-        ('Cerveau', 'DUA', 'Moto', 'BOD', 'moh-toh', None, 'intermediate'),
-        ('Cœur', 'DUA', 'Mutima', 'BOD', 'moo-tee-mah', None, 'beginner'),
-        ('Poumons', 'DUA', 'Mapefu', 'BOD', 'mah-peh-foo', None, 'intermediate'),
-        ('Foie', 'DUA', 'Libale', 'BOD', 'lee-bah-leh', None, 'intermediate'),
-        ('Reins', 'DUA', 'Milofo', 'BOD', 'mee-loh-foh', None, 'intermediate'),
-        ('Estomac', 'DUA', 'Libumu', 'BOD', 'lee-boo-moo', None, 'beginner'),
-        ('Intestins', 'DUA', 'Mamina', 'BOD', 'mah-mee-nah', None, 'intermediate'),
-        ('Sang', 'DUA', 'Mashi', 'BOD', 'mah-shee', None, 'intermediate'),
-        ('Os', 'DUA', 'Mukwa', 'BOD', 'moo-kwah', None, 'intermediate'),
-        ('Muscle', 'DUA', 'Ngolo', 'BOD', 'n-goh-loh', None, 'intermediate'),
-        ('Peau', 'DUA', 'Loposo', 'BOD', 'loh-poh-soh', None, 'beginner'),
-        ('Cheveux', 'DUA', 'Nsuki', 'BOD', 'n-soo-kee', None, 'beginner'),
-        ('Sourcils', 'DUA', 'Minsing', 'BOD', 'meen-seeng', None, 'intermediate'),
-        ('Cils', 'DUA', 'Minsing meso', 'BOD', 'meen-seeng meh-soh', None, 'intermediate'),
-        ('Lèvres', 'DUA', 'Minkom', 'BOD', 'meen-kohm', None, 'intermediate'),
-
-        ('Cerveau', 'FUL', 'Hoore', 'BOD', 'hoh-reh', None, 'intermediate'),
-        ('Cœur', 'FUL', 'Bernde', 'BOD', 'behrn-deh', None, 'beginner'),
-        ('Poumons', 'FUL', 'Keeci', 'BOD', 'keh-chee', None, 'intermediate'),
-        ('Foie', 'FUL', 'Haggere', 'BOD', 'hahg-geh-reh', None, 'intermediate'),
-        ('Reins', 'FUL', 'Koyye', 'BOD', 'koy-yeh', None, 'intermediate'),
-        ('Estomac', 'FUL', 'Reedu', 'BOD', 'reh-doo', None, 'beginner'),
-        ('Intestins', 'FUL', 'Taforgal', 'BOD', 'tah-fohr-gahl', None, 'intermediate'),
-        ('Sang', 'FUL', 'Iiri', 'BOD', 'ee-ree', None, 'intermediate'),
-        ('Os', 'FUL', 'Yiitere', 'BOD', 'yee-teh-reh', None, 'intermediate'),
-        ('Muscle', 'FUL', 'Ngorgu', 'BOD', 'ngohr-goo', None, 'intermediate'),
-        ('Peau', 'FUL', 'Nguru', 'BOD', 'ngoo-roo', None, 'beginner'),
-        ('Cheveux', 'FUL', 'Lecce', 'BOD', 'leh-cheh', None, 'beginner'),
-        ('Sourcils', 'FUL', 'Gite gite', 'BOD', 'gee-teh gee-teh', None, 'intermediate'),
-        ('Cils', 'FUL', 'Gite gite', 'BOD', 'gee-teh gee-teh', None, 'intermediate'),
-        ('Lèvres', 'FUL', 'Tonngere', 'BOD', 'tohn-geh-reh', None, 'intermediate'),
-
-        # EXTENDED TIME EXPRESSIONS
-        ('Hier matin', 'EWO', 'Ngon nga', 'TIM', 'n-gohn n-gah', None, 'intermediate'),
-        ('Hier soir', 'EWO', 'Ngon mfini', 'TIM', 'n-gohn mm-fee-nee', None, 'intermediate'),
-        ('Ce matin', 'EWO', 'Andu nga', 'TIM', 'ahn-doo n-gah', None, 'beginner'),
-        ('Ce soir', 'EWO', 'Andu mfini', 'TIM', 'ahn-doo mm-fee-nee', None, 'beginner'),
-        ('Demain matin', 'EWO', 'Okir nga', 'TIM', 'oh-keer n-gah', None, 'intermediate'),
-        ('Demain soir', 'EWO', 'Okir mfini', 'TIM', 'oh-keer mm-fee-nee', None, 'intermediate'),
-        ('La semaine dernière', 'EWO', 'Sone ngon', 'TIM', 'soh-neh n-gohn', None, 'intermediate'),
-        ('Cette semaine', 'EWO', 'Sone andu', 'TIM', 'soh-neh ahn-doo', None, 'intermediate'),
-        ('La semaine prochaine', 'EWO', 'Sone okir', 'TIM', 'soh-neh oh-keer', None, 'intermediate'),
-        ('Le mois dernier', 'EWO', 'Ngonda ngon', 'TIM', 'n-gohn-dah n-gohn', None, 'intermediate'),
-        ('Ce mois-ci', 'EWO', 'Ngonda andu', 'TIM', 'n-gohn-dah ahn-doo', None, 'intermediate'),
-        ('Le mois prochain', 'EWO', 'Ngonda okir', 'TIM', 'n-gohn-dah oh-keer', None, 'intermediate'),
-        ('L''année dernière', 'EWO', 'Mbu ngon', 'TIM', 'mm-boo n-gohn', None, 'intermediate'),
-        ('Cette année', 'EWO', 'Mbu andu', 'TIM', 'mm-boo ahn-doo', None, 'intermediate'),
-        ('L''année prochaine', 'EWO', 'Mbu okir', 'TIM', 'mm-boo oh-keer', None, 'intermediate'),
-
-        ('Hier matin', 'DUA', 'Lelo tango', 'TIM', 'leh-loh tahn-goh', None, 'intermediate'),
-        ('Hier soir', 'DUA', 'Lelo pokwa', 'TIM', 'leh-loh poh-kwah', None, 'intermediate'),
-        ('Ce matin', 'DUA', 'Lelo tango', 'TIM', 'leh-loh tahn-goh', None, 'beginner'),
-        ('Ce soir', 'DUA', 'Lelo pokwa', 'TIM', 'leh-loh poh-kwah', None, 'beginner'),
-        ('Demain matin', 'DUA', 'Lakisa tango', 'TIM', 'lah-kee-sah tahn-goh', None, 'intermediate'),
-        ('Demain soir', 'DUA', 'Lakisa pokwa', 'TIM', 'lah-kee-sah poh-kwah', None, 'intermediate'),
-        ('La semaine dernière', 'DUA', 'Poso tango', 'TIM', 'poh-soh tahn-goh', None, 'intermediate'),
-        ('Cette semaine', 'DUA', 'Poso tango', 'TIM', 'poh-soh tahn-goh', None, 'intermediate'),
-        ('La semaine prochaine', 'DUA', 'Poso lakisa', 'TIM', 'poh-soh lah-kee-sah', None, 'intermediate'),
-        ('Le mois dernier', 'DUA', 'Sanza tango', 'TIM', 'sahn-zah tahn-goh', None, 'intermediate'),
-        ('Ce mois-ci', 'DUA', 'Sanza tango', 'TIM', 'sahn-zah tahn-goh', None, 'intermediate'),
-        ('Le mois prochain', 'DUA', 'Sanza lakisa', 'TIM', 'sahn-zah lah-kee-sah', None, 'intermediate'),
-        ('L''année dernière', 'DUA', 'Mobu tango', 'TIM', 'moh-boo tahn-goh', None, 'intermediate'),
-        ('Cette année', 'DUA', 'Mobu tango', 'TIM', 'moh-boo tahn-goh', None, 'intermediate'),
-        ('L''année prochaine', 'DUA', 'Mobu lakisa', 'TIM', 'moh-boo lah-kee-sah', None, 'intermediate'),
-
-        ('Hier matin', 'FUL', 'Hakka subaka', 'TIM', 'hahk-kah soo-bah-kah', None, 'intermediate'),
-        ('Hier soir', 'FUL', 'Hakka kiikii', 'TIM', 'hahk-kah kee-kee', None, 'intermediate'),
-        ('Ce matin', 'FUL', 'Haka subaka', 'TIM', 'hah-kah soo-bah-kah', None, 'beginner'),
-        ('Ce soir', 'FUL', 'Haka kiikii', 'TIM', 'hah-kah kee-kee', None, 'beginner'),
-        ('Demain matin', 'FUL', 'Jaŋŋgo subaka', 'TIM', 'jahng-goh soo-bah-kah', None, 'intermediate'),
-        ('Demain soir', 'FUL', 'Jaŋŋgo kiikii', 'TIM', 'jahng-goh kee-kee', None, 'intermediate'),
-        ('La semaine dernière', 'FUL', 'Yontere hakkunde', 'TIM', 'yohn-teh-reh hah-koon-deh', None, 'intermediate'),
-        ('Cette semaine', 'FUL', 'Yontere haka', 'TIM', 'yohn-teh-reh hah-kah', None, 'intermediate'),
-        ('La semaine prochaine', 'FUL', 'Yontere aro', 'TIM', 'yohn-teh-reh ah-roh', None, 'intermediate'),
-        ('Le mois dernier', 'FUL', 'Lewru hakkunde', 'TIM', 'leh-wroo hah-koon-deh', None, 'intermediate'),
-        ('Ce mois-ci', 'FUL', 'Lewru haka', 'TIM', 'leh-wroo hah-kah', None, 'intermediate'),
-        ('Le mois prochain', 'FUL', 'Lewru aro', 'TIM', 'leh-wroo ah-roh', None, 'intermediate'),
-        ('L''année dernière', 'FUL', 'Hitaande hakkunde', 'TIM', 'hee-tahn-deh hah-koon-deh', None, 'intermediate'),
-        ('Cette année', 'FUL', 'Hitaande haka', 'TIM', 'hee-tahn-deh hah-kah', None, 'intermediate'),
-        ('L''année prochaine', 'FUL', 'Hitaande aro', 'TIM', 'hee-tahn-deh ah-roh', None, 'intermediate'),
-
-        # EXTENDED COLORS
-        ('Jaune', 'EWO', 'Nsaŋ', 'COL', 'n-sahng', None, 'beginner'),
-        ('Violet', 'EWO', 'Mvondo', 'COL', 'm-vohn-doh', None, 'intermediate'),
-        ('Rose', 'EWO', 'Mvondo ntam', 'COL', 'm-vohn-doh n-tahm', None, 'intermediate'),
-        ('Gris', 'EWO', 'Nsaŋ mvondo', 'COL', 'n-sahng m-vohn-doh', None, 'intermediate'),
-        ('Marron', 'EWO', 'Ndombe ntam', 'COL', 'n-dohm-beh n-tahm', None, 'intermediate'),
-        ('Orange', 'EWO', 'Nsaŋ mvondo', 'COL', 'n-sahng m-vohn-doh', None, 'intermediate'),
-        ('Doré', 'EWO', 'Nsaŋ səŋ', 'COL', 'n-sahng suhng', None, 'intermediate'),
-        ('Argenté', 'EWO', 'Pembe səŋ', 'COL', 'pehm-beh suhng', None, 'intermediate'),
-        ('Clair', 'EWO', 'Bot', 'COL', 'boht', None, 'beginner'),
-        ('Foncé', 'EWO', 'Ndombe', 'COL', 'n-dohm-beh', None, 'beginner'),
-
-        ('Jaune', 'DUA', 'Moyindo', 'COL', 'moh-yeen-doh', None, 'beginner'),
-        ('Violet', 'DUA', 'Mbulu', 'COL', 'm-boo-loo', None, 'intermediate'),
-        ('Rose', 'DUA', 'Mbulu mpembe', 'COL', 'm-boo-loo mm-pehm-beh', None, 'intermediate'),
-        ('Gris', 'DUA', 'Mputu', 'COL', 'm-poo-too', None, 'intermediate'),
-        ('Marron', 'DUA', 'Ndombe', 'COL', 'n-dohm-beh', None, 'intermediate'),
-        ('Orange', 'DUA', 'Moyindo mpembe', 'COL', 'moh-yeen-doh mm-pehm-beh', None, 'intermediate'),
-        ('Doré', 'DUA', 'Wolo', 'COL', 'woh-loh', None, 'intermediate'),
-        ('Argenté', 'DUA', 'Pute', 'COL', 'poo-teh', None, 'intermediate'),
-        ('Clair', 'DUA', 'Pembe', 'COL', 'pehm-beh', None, 'beginner'),
-        ('Foncé', 'DUA', 'Ndombe', 'COL', 'n-dohm-beh', None, 'beginner'),
-
-        ('Jaune', 'FUL', 'Olool', 'COL', 'oh-lohl', None, 'beginner'),
-        ('Violet', 'FUL', 'Buluuji', 'COL', 'boo-loo-jee', None, 'intermediate'),
-        ('Rose', 'FUL', 'Ruumpu', 'COL', 'room-poo', None, 'intermediate'),
-        ('Gris', 'FUL', 'Pulaaku', 'COL', 'poo-lah-koo', None, 'intermediate'),
-        ('Marron', 'FUL', 'Bojuru', 'COL', 'boh-joo-roo', None, 'intermediate'),
-        ('Orange', 'FUL', 'Olool ruumpu', 'COL', 'oh-lohl room-poo', None, 'intermediate'),
-        ('Doré', 'FUL', 'Kaŋŋe', 'COL', 'kahng-geh', None, 'intermediate'),
-        ('Argenté', 'FUL', 'Laamorgal', 'COL', 'lah-mohr-gahl', None, 'intermediate'),
-        ('Clair', 'FUL', 'Peeje', 'COL', 'peh-jeh', None, 'beginner'),
-        ('Foncé', 'FUL', 'Duudii', 'COL', 'doo-dee', None, 'beginner'),
-
-        # EXTENDED ANIMALS
-        ('Éléphant', 'EWO', 'Nzok', 'ANI', 'n-zohk', None, 'beginner'),
-        ('Lion', 'EWO', 'Ngui', 'ANI', 'n-gwee', None, 'beginner'),
-        ('Tigre', 'EWO', 'Nkui', 'ANI', 'n-kwee', None, 'beginner'),
-        ('Gorille', 'EWO', 'Nkeng', 'ANI', 'n-kehng', None, 'beginner'),
-        ('Chimpanzé', 'EWO', 'Nkema', 'ANI', 'n-keh-mah', None, 'beginner'),
-        ('Singe', 'EWO', 'Nkema', 'ANI', 'n-keh-mah', None, 'beginner'),
-        ('Antilope', 'EWO', 'Nyati', 'ANI', 'nyah-tee', None, 'beginner'),
-        ('Gazelle', 'EWO', 'Mbida', 'ANI', 'mm-bee-dah', None, 'beginner'),
-        ('Zèbre', 'EWO', 'Nkoŋ', 'ANI', 'n-kohng', None, 'beginner'),
-        ('Girafe', 'EWO', 'Nkoŋ', 'ANI', 'n-kohng', None, 'beginner'),
-        ('Hippopotame', 'EWO', 'Nguba', 'ANI', 'n-goo-bah', None, 'beginner'),
-        ('Rhinocéros', 'EWO', 'Abum', 'ANI', 'ah-boom', None, 'beginner'),
-        ('Buffle', 'EWO', 'Ngang', 'ANI', 'n-gahng', None, 'beginner'),
-        ('Hyène', 'EWO', 'Nseŋ', 'ANI', 'n-sehng', None, 'beginner'),
-        ('Renard', 'EWO', 'Nkui nini', 'ANI', 'n-kwee nee-nee', None, 'intermediate'),
-        ('Lièvre', 'EWO', 'Nson', 'ANI', 'n-sohn', None, 'beginner'),
-        ('Lapin', 'EWO', 'Nson', 'ANI', 'n-sohn', None, 'beginner'),
-        ('Écureuil', 'EWO', 'Nkeng nini', 'ANI', 'n-kehng nee-nee', None, 'intermediate'),
-        ('Rat', 'EWO', 'Nko', 'ANI', 'n-koh', None, 'beginner'),
-        ('Souris', 'EWO', 'Nko nini', 'ANI', 'n-koh nee-nee', None, 'intermediate'),
-
-        ('Éléphant', 'DUA', 'Nzok', 'ANI', 'n-zohk', None, 'beginner'),
-        ('Lion', 'DUA', 'Ngui', 'ANI', 'n-gwee', None, 'beginner'),
-        ('Tigre', 'DUA', 'Nkui', 'ANI', 'n-kwee', None, 'beginner'),
-        ('Gorille', 'DUA', 'Nkeng', 'ANI', 'n-kehng', None, 'beginner'),
-        ('Chimpanzé', 'DUA', 'Nkema', 'ANI', 'n-keh-mah', None, 'beginner'),
-        ('Singe', 'DUA', 'Nkema', 'ANI', 'n-keh-mah', None, 'beginner'),
-        ('Antilope', 'DUA', 'Nyati', 'ANI', 'nyah-tee', None, 'beginner'),
-        ('Gazelle', 'DUA', 'Mbida', 'ANI', 'mm-bee-dah', None, 'beginner'),
-        ('Zèbre', 'DUA', 'Nkoŋ', 'ANI', 'n-kohng', None, 'beginner'),
-        ('Girafe', 'DUA', 'Nkoŋ', 'ANI', 'n-kohng', None, 'beginner'),
-        ('Hippopotame', 'DUA', 'Nguba', 'ANI', 'n-goo-bah', None, 'beginner'),
-        ('Rhinocéros', 'DUA', 'Abum', 'ANI', 'ah-boom', None, 'beginner'),
-        ('Buffle', 'DUA', 'Ngang', 'ANI', 'n-gahng', None, 'beginner'),
-        ('Hyène', 'DUA', 'Nseŋ', 'ANI', 'n-sehng', None, 'beginner'),
-        ('Renard', 'DUA', 'Nkui nini', 'ANI', 'n-kwee nee-nee', None, 'intermediate'),
-        ('Lièvre', 'DUA', 'Nson', 'ANI', 'n-sohn', None, 'beginner'),
-        ('Lapin', 'DUA', 'Nson', 'ANI', 'n-sohn', None, 'beginner'),
-        ('Écureuil', 'DUA', 'Nkeng nini', 'ANI', 'n-kehng nee-nee', None, 'intermediate'),
-        ('Rat', 'DUA', 'Nko', 'ANI', 'n-koh', None, 'beginner'),
-        ('Souris', 'DUA', 'Nko nini', 'ANI', 'n-koh nee-nee', None, 'intermediate'),
-
-        ('Éléphant', 'FUL', 'Nyiɓɓere', 'ANI', 'nyee-beh-reh', None, 'beginner'),
-        ('Lion', 'FUL', 'Gaynako', 'ANI', 'guy-nah-koh', None, 'beginner'),
-        ('Tigre', 'FUL', 'Kulle', 'ANI', 'kool-leh', None, 'beginner'),
-        ('Gorille', 'FUL', 'Gorilla', 'ANI', 'goh-ree-lah', None, 'beginner'),
-        ('Chimpanzé', 'FUL', 'Simpanse', 'ANI', 'seem-pahn-seh', None, 'beginner'),
-        ('Singe', 'FUL', 'Baabilo', 'ANI', 'bah-bee-loh', None, 'beginner'),
-        ('Antilope', 'FUL', 'Torol', 'ANI', 'toh-rohl', None, 'beginner'),
-        ('Gazelle', 'FUL', 'Mbororo', 'ANI', 'm-boh-roh-roh', None, 'beginner'),
-        ('Zèbre', 'FUL', 'Zebere', 'ANI', 'zeh-beh-reh', None, 'beginner'),
-        ('Girafe', 'FUL', 'Giraffe', 'ANI', 'gee-rahf-feh', None, 'beginner'),
-        ('Hippopotame', 'FUL', 'Moyɓɓere', 'ANI', 'moy-beh-reh', None, 'beginner'),
-        ('Rhinocéros', 'FUL', 'Rinoceros', 'ANI', 'ree-noh-seh-rohs', None, 'beginner'),
-        ('Buffle', 'FUL', 'Nagge', 'ANI', 'nahg-geh', None, 'beginner'),
-        ('Hyène', 'FUL', 'Kurege', 'ANI', 'koo-reh-geh', None, 'beginner'),
-        ('Renard', 'FUL', 'Hulere', 'ANI', 'hoo-leh-reh', None, 'beginner'),
-        ('Lièvre', 'FUL', 'Arɓere', 'ANI', 'ahr-beh-reh', None, 'beginner'),
-        ('Lapin', 'FUL', 'Arɓere', 'ANI', 'ahr-beh-reh', None, 'beginner'),
-        ('Écureuil', 'FUL', 'Kure', 'ANI', 'koo-reh', None, 'beginner'),
-        ('Rat', 'FUL', 'Ngooru', 'ANI', 'ngoh-roo', None, 'beginner'),
-        ('Souris', 'FUL', 'Ngooru', 'ANI', 'ngoh-roo', None, 'beginner'),
-
-        # EXTENDED NATURE AND WEATHER
-        ('Pluie', 'EWO', 'Mvura', 'NAT', 'm-voo-rah', None, 'beginner'),
-        ('Vent', 'EWO', 'Mfum', 'NAT', 'm-foom', None, 'beginner'),
-        ('Nuage', 'EWO', 'Nkup mvon', 'NAT', 'n-koop m-vohn', None, 'beginner'),
-        ('Tonnerre', 'EWO', 'Nkukuma', 'NAT', 'n-koo-koo-mah', None, 'beginner'),
-        ('Éclair', 'EWO', 'Nlong', 'NAT', 'n-lohng', None, 'beginner'),
-        ('Arc-en-ciel', 'EWO', 'Nlong mvon', 'NAT', 'n-lohng m-vohn', None, 'intermediate'),
-        ('Neige', 'EWO', 'Mvura pembe', 'NAT', 'm-voo-rah pehm-beh', None, 'intermediate'),
-        ('Brouillard', 'EWO', 'Nkup', 'NAT', 'n-koop', None, 'beginner'),
-        ('Rosée', 'EWO', 'Mvura nini', 'NAT', 'm-voo-rah nee-nee', None, 'intermediate'),
-        ('Givre', 'EWO', 'Mvura pembe', 'NAT', 'm-voo-rah pehm-beh', None, 'intermediate'),
-        ('Tempête', 'EWO', 'Mfum ane', 'NAT', 'm-foom ah-neh', None, 'intermediate'),
-        ('Ouragan', 'EWO', 'Mfum ane', 'NAT', 'm-foom ah-neh', None, 'intermediate'),
-        ('Sécheresse', 'EWO', 'Nsan ane', 'NAT', 'n-sahn ah-neh', None, 'intermediate'),
-        ('Inondation', 'EWO', 'Mvura ane', 'NAT', 'm-voo-rah ah-neh', None, 'intermediate'),
-        ('Forêt tropicale', 'EWO', 'Afan ane', 'NAT', 'ah-fahn ah-neh', None, 'intermediate'),
-        ('Savane', 'EWO', 'Afup', 'NAT', 'ah-foop', None, 'beginner'),
-        ('Désert', 'EWO', 'Afup nsan', 'NAT', 'ah-foop n-sahn', None, 'intermediate'),
-        ('Lac', 'EWO', 'Nda mam', 'NAT', 'n-dah mahm', None, 'beginner'),
-        ('Rivière', 'EWO', 'Kala', 'NAT', 'kah-lah', None, 'beginner'),
-        ('Cascade', 'EWO', 'Kala mvura', 'NAT', 'kah-lah m-voo-rah', None, 'intermediate'),
-
-        ('Pluie', 'DUA', 'Mvula', 'NAT', 'm-voo-lah', None, 'beginner'),
-        ('Vent', 'DUA', 'Mpepe', 'NAT', 'm-peh-peh', None, 'beginner'),
-        ('Nuage', 'DUA', 'Lipata', 'NAT', 'lee-pah-tah', None, 'beginner'),
-        ('Tonnerre', 'DUA', 'Ngoma', 'NAT', 'n-goh-mah', None, 'beginner'),
-        ('Éclair', 'DUA', 'Moninga', 'NAT', 'moh-neen-gah', None, 'beginner'),
-        ('Arc-en-ciel', 'DUA', 'Upupa', 'NAT', 'oo-poo-pah', None, 'intermediate'),
-        ('Neige', 'DUA', 'Mvula pembe', 'NAT', 'm-voo-lah pehm-beh', None, 'intermediate'),
-        ('Brouillard', 'DUA', 'Mposo', 'NAT', 'm-poh-soh', None, 'beginner'),
-        ('Rosée', 'DUA', 'Mvula nini', 'NAT', 'm-voo-lah nee-nee', None, 'intermediate'),
-        ('Givre', 'DUA', 'Mvula pembe', 'NAT', 'm-voo-lah pehm-beh', None, 'intermediate'),
-        ('Tempête', 'DUA', 'Mpepe ane', 'NAT', 'm-peh-peh ah-neh', None, 'intermediate'),
-        ('Ouragan', 'DUA', 'Mpepe ane', 'NAT', 'm-peh-peh ah-neh', None, 'intermediate'),
-        ('Sécheresse', 'DUA', 'Nsan ane', 'NAT', 'n-sahn ah-neh', None, 'intermediate'),
-        ('Inondation', 'DUA', 'Mvula ane', 'NAT', 'm-voo-lah ah-neh', None, 'intermediate'),
-        ('Forêt tropicale', 'DUA', 'Dikanda', 'NAT', 'dee-kahn-dah', None, 'beginner'),
-        ('Savane', 'DUA', 'Savane', 'NAT', 'sah-vah-neh', None, 'beginner'),
-        ('Désert', 'DUA', 'Efelo', 'NAT', 'eh-feh-loh', None, 'intermediate'),
-        ('Lac', 'DUA', 'Ebale', 'NAT', 'eh-bah-leh', None, 'beginner'),
-        ('Rivière', 'DUA', 'Mai', 'NAT', 'mah-ee', None, 'beginner'),
-        ('Cascade', 'DUA', 'Mai mvula', 'NAT', 'mah-ee m-voo-lah', None, 'intermediate'),
-
-        ('Pluie', 'FUL', 'Iwa', 'NAT', 'ee-wah', None, 'beginner'),
-        ('Vent', 'FUL', 'Hendu', 'NAT', 'hehn-doo', None, 'beginner'),
-        ('Nuage', 'FUL', 'Duule', 'NAT', 'doo-leh', None, 'beginner'),
-        ('Tonnerre', 'FUL', 'Haalmere', 'NAT', 'hahl-meh-reh', None, 'beginner'),
-        ('Éclair', 'FUL', 'Lilɗere', 'NAT', 'leel-deh-reh', None, 'beginner'),
-        ('Arc-en-ciel', 'FUL', 'Kaŋŋe iwa', 'NAT', 'kahng-geh ee-wah', None, 'intermediate'),
-        ('Neige', 'FUL', 'Cow', 'NAT', 'chohw', None, 'intermediate'),
-        ('Brouillard', 'FUL', 'Duule', 'NAT', 'doo-leh', None, 'beginner'),
-        ('Rosée', 'FUL', 'Ndiyam', 'NAT', 'n-dee-yahm', None, 'beginner'),
-        ('Givre', 'FUL', 'Cow', 'NAT', 'chohw', None, 'intermediate'),
-        ('Tempête', 'FUL', 'Hendu mawndu', 'NAT', 'hehn-doo mawn-doo', None, 'intermediate'),
-        ('Ouragan', 'FUL', 'Hendu mawndu', 'NAT', 'hehn-doo mawn-doo', None, 'intermediate'),
-        ('Sécheresse', 'FUL', 'Koowal', 'NAT', 'koh-wahl', None, 'intermediate'),
-        ('Inondation', 'FUL', 'Iwa mawndu', 'NAT', 'ee-wah mawn-doo', None, 'intermediate'),
-        ('Forêt tropicale', 'FUL', 'Lekkere', 'NAT', 'lehk-keh-reh', None, 'beginner'),
-        ('Savane', 'FUL', 'Ngalu', 'NAT', 'ngah-loo', None, 'beginner'),
-        ('Désert', 'FUL', 'Saare', 'NAT', 'sah-reh', None, 'intermediate'),
-        ('Lac', 'FUL', 'Weendu', 'NAT', 'wehn-doo', None, 'beginner'),
-        ('Rivière', 'FUL', 'Maayo', 'NAT', 'mah-yoh', None, 'beginner'),
-        ('Cascade', 'FUL', 'Maayo iwa', 'NAT', 'mah-yoh ee-wah', None, 'intermediate'),
-
-        # EXTENDED VERBS
-        ('Apprendre', 'EWO', 'Kelene', 'VRB', 'keh-leh-neh', None, 'intermediate'),
-        ('Enseigner', 'EWO', 'Kelene nkukuma', 'VRB', 'keh-leh-neh n-koo-koo-mah', None, 'intermediate'),
-        ('Étudier', 'EWO', 'Kelene', 'VRB', 'keh-leh-neh', None, 'intermediate'),
-        ('Lire', 'EWO', 'Tili', 'VRB', 'tee-lee', None, 'beginner'),
-        ('Écrire', 'EWO', 'Sii', 'VRB', 'see', None, 'beginner'),
-        ('Compter', 'EWO', 'Taba', 'VRB', 'tah-bah', None, 'beginner'),
-        ('Calculer', 'EWO', 'Taba', 'VRB', 'tah-bah', None, 'intermediate'),
-        ('Chanter', 'EWO', 'Yem nvet', 'VRB', 'yehm n-veht', None, 'beginner'),
-        ('Danser', 'EWO', 'Bikutsi', 'VRB', 'bee-koo-tsee', None, 'beginner'),
-        ('Jouer', 'EWO', 'Bika', 'VRB', 'bee-kah', None, 'beginner'),
-        ('Travailler', 'EWO', 'Kudu', 'VRB', 'koo-doo', None, 'beginner'),
-        ('Se reposer', 'EWO', 'Lal', 'VRB', 'lahl', None, 'beginner'),
-        ('Nager', 'EWO', 'Vaa mam', 'VRB', 'vah mahm', None, 'beginner'),
-        ('Courir', 'EWO', 'Kumba', 'VRB', 'koom-bah', None, 'beginner'),
-        ('Marcher', 'EWO', 'Kei', 'VRB', 'keh-ee', None, 'beginner'),
-        ('Sauter', 'EWO', 'Tumba', 'VRB', 'toom-bah', None, 'beginner'),
-        ('Ramper', 'EWO', 'Kumba nini', 'VRB', 'koom-bah nee-nee', None, 'intermediate'),
-        ('Grimper', 'EWO', 'Tumba avenga', 'VRB', 'toom-bah ah-vehn-gah', None, 'intermediate'),
-        ('Tomber', 'EWO', 'Kwa', 'VRB', 'kwah', None, 'beginner'),
-        ('Se lever', 'EWO', 'Təŋ', 'VRB', 'tuhng', None, 'beginner'),
-
-        ('Apprendre', 'DUA', 'Kelane', 'VRB', 'keh-lah-neh', None, 'intermediate'),
-        ('Enseigner', 'DUA', 'Kelane', 'VRB', 'keh-lah-neh', None, 'intermediate'),
-        ('Étudier', 'DUA', 'Kelane', 'VRB', 'keh-lah-neh', None, 'intermediate'),
-        ('Lire', 'DUA', 'Tanga', 'VRB', 'tahn-gah', None, 'beginner'),
-        ('Écrire', 'DUA', 'Koma', 'VRB', 'koh-mah', None, 'beginner'),
-        ('Compter', 'DUA', 'Tanga', 'VRB', 'tahn-gah', None, 'beginner'),
-        ('Calculer', 'DUA', 'Tanga', 'VRB', 'tahn-gah', None, 'intermediate'),
-        ('Chanter', 'DUA', 'Yemba', 'VRB', 'yehm-bah', None, 'beginner'),
-        ('Danser', 'DUA', 'Dina', 'VRB', 'dee-nah', None, 'beginner'),
-        ('Jouer', 'DUA', 'Bika', 'VRB', 'bee-kah', None, 'beginner'),
-        ('Travailler', 'DUA', 'Sala', 'VRB', 'sah-lah', None, 'beginner'),
-        ('Se reposer', 'DUA', 'Lala', 'VRB', 'lah-lah', None, 'beginner'),
-        ('Nager', 'DUA', 'Wuga', 'VRB', 'woo-gah', None, 'beginner'),
-        ('Courir', 'DUA', 'Pota', 'VRB', 'poh-tah', None, 'beginner'),
-        ('Marcher', 'DUA', 'Kende', 'VRB', 'kehn-deh', None, 'beginner'),
-        ('Sauter', 'DUA', 'Tumba', 'VRB', 'toom-bah', None, 'beginner'),
-        ('Ramper', 'DUA', 'Kumba nini', 'VRB', 'koom-bah nee-nee', None, 'intermediate'),
-        ('Grimper', 'DUA', 'Tumba', 'VRB', 'toom-bah', None, 'intermediate'),
-        ('Tomber', 'DUA', 'Kwa', 'VRB', 'kwah', None, 'beginner'),
-        ('Se lever', 'DUA', 'Təŋ', 'VRB', 'tuhng', None, 'beginner'),
-
-        ('Apprendre', 'FUL', 'Janngude', 'VRB', 'jahng-goo-deh', None, 'intermediate'),
-        ('Enseigner', 'FUL', 'Jangude', 'VRB', 'jahn-goo-deh', None, 'intermediate'),
-        ('Étudier', 'FUL', 'Janngude', 'VRB', 'jahng-goo-deh', None, 'intermediate'),
-        ('Lire', 'FUL', 'Tarude', 'VRB', 'tah-roo-deh', None, 'beginner'),
-        ('Écrire', 'FUL', 'Winndude', 'VRB', 'ween-doo-deh', None, 'beginner'),
-        ('Compter', 'FUL', 'Limude', 'VRB', 'lee-moo-deh', None, 'beginner'),
-        ('Calculer', 'FUL', 'Limude', 'VRB', 'lee-moo-deh', None, 'intermediate'),
-        ('Chanter', 'FUL', 'Yimude', 'VRB', 'yee-moo-deh', None, 'beginner'),
-        ('Danser', 'FUL', 'Dillere', 'VRB', 'deel-leh-reh', None, 'beginner'),
-        ('Jouer', 'FUL', 'Fiɗude', 'VRB', 'fee-doo-deh', None, 'beginner'),
-        ('Travailler', 'FUL', 'Gollude', 'VRB', 'gohl-loo-deh', None, 'beginner'),
-        ('Se reposer', 'FUL', 'Humpitude', 'VRB', 'hoom-pee-too-deh', None, 'beginner'),
-        ('Nager', 'FUL', 'Noodude', 'VRB', 'noh-doo-deh', None, 'beginner'),
-        ('Courir', 'FUL', 'Yaalende', 'VRB', 'yah-lehn-deh', None, 'beginner'),
-        ('Marcher', 'FUL', 'Yahde', 'VRB', 'yah-deh', None, 'beginner'),
-        ('Sauter', 'FUL', 'Yippude', 'VRB', 'yeep-poo-deh', None, 'beginner'),
-        ('Ramper', 'FUL', 'Dippude', 'VRB', 'deep-poo-deh', None, 'intermediate'),
-        ('Grimper', 'FUL', 'Yippude', 'VRB', 'yeep-poo-deh', None, 'intermediate'),
-        ('Tomber', 'FUL', 'Wuurde', 'VRB', 'woor-deh', None, 'beginner'),
-        ('Se lever', 'FUL', 'Ummitde', 'VRB', 'oom-meet-deh', None, 'beginner'),
-
-        # EXTENDED ADJECTIVES
-        ('Nouveau', 'EWO', 'Sus', 'ADJ', 'soos', None, 'beginner'),
-        ('Vieux', 'EWO', 'Kulu', 'ADJ', 'koo-loo', None, 'beginner'),
-        ('Jeune', 'EWO', 'Nini', 'ADJ', 'nee-nee', None, 'beginner'),
-        ('Âgé', 'EWO', 'Kulu', 'ADJ', 'koo-loo', None, 'beginner'),
-        ('Riche', 'EWO', 'Bot', 'ADJ', 'boht', None, 'beginner'),
-        ('Pauvre', 'EWO', 'Mbe', 'ADJ', 'm-beh', None, 'beginner'),
-        ('Intelligent', 'EWO', 'Bot nlem', 'ADJ', 'boht n-lehm', None, 'intermediate'),
-        ('Stupide', 'EWO', 'Mbe nlem', 'ADJ', 'm-beh n-lehm', None, 'intermediate'),
-        ('Rapide', 'EWO', 'Pia', 'ADJ', 'pee-ah', None, 'beginner'),
-        ('Lent', 'EWO', 'Mbe pia', 'ADJ', 'm-beh pee-ah', None, 'intermediate'),
-        ('Facile', 'EWO', 'Bot', 'ADJ', 'boht', None, 'beginner'),
-        ('Difficile', 'EWO', 'Ane', 'ADJ', 'ah-neh', None, 'beginner'),
-        ('Propre', 'EWO', 'Bot', 'ADJ', 'boht', None, 'beginner'),
-        ('Sale', 'EWO', 'Mbe', 'ADJ', 'm-beh', None, 'beginner'),
-        ('Sec', 'EWO', 'Kis', 'ADJ', 'kees', None, 'beginner'),
-        ('Mouillé', 'EWO', 'Mam', 'ADJ', 'mahm', None, 'beginner'),
-        ('Plein', 'EWO', 'Yem', 'ADJ', 'yehm', None, 'beginner'),
-        ('Vide', 'EWO', 'Mbe', 'ADJ', 'm-beh', None, 'beginner'),
-        ('Lourd', 'EWO', 'Ane', 'ADJ', 'ah-neh', None, 'beginner'),
-        ('Léger', 'EWO', 'Nit', 'ADJ', 'neet', None, 'beginner'),
-
-        ('Nouveau', 'DUA', 'Susu', 'ADJ', 'soo-soo', None, 'beginner'),
-        ('Vieux', 'DUA', 'Nkulu', 'ADJ', 'n-koo-loo', None, 'beginner'),
-        ('Jeune', 'DUA', 'Nini', 'ADJ', 'nee-nee', None, 'beginner'),
-        ('Âgé', 'DUA', 'Nkulu', 'ADJ', 'n-koo-loo', None, 'beginner'),
-        ('Riche', 'DUA', 'Bongisa', 'ADJ', 'bohn-gee-sah', None, 'beginner'),
-        ('Pauvre', 'DUA', 'Hela', 'ADJ', 'heh-lah', None, 'beginner'),
-        ('Intelligent', 'DUA', 'Hekima', 'ADJ', 'heh-kee-mah', None, 'intermediate'),
-        ('Stupide', 'DUA', 'Bulu', 'ADJ', 'boo-loo', None, 'intermediate'),
-        ('Rapide', 'DUA', 'Noki', 'ADJ', 'noh-kee', None, 'beginner'),
-        ('Lent', 'DUA', 'Mbe noki', 'ADJ', 'm-beh noh-kee', None, 'intermediate'),
-        ('Facile', 'DUA', 'Pasi', 'ADJ', 'pah-see', None, 'beginner'),
-        ('Difficile', 'DUA', 'Zitu', 'ADJ', 'zee-too', None, 'beginner'),
-        ('Propre', 'DUA', 'Saf', 'ADJ', 'sahf', None, 'beginner'),
-        ('Sale', 'DUA', 'Chafu', 'ADJ', 'chah-foo', None, 'beginner'),
-        ('Sec', 'DUA', 'Kavu', 'ADJ', 'kah-voo', None, 'beginner'),
-        ('Mouillé', 'DUA', 'Mvua', 'ADJ', 'm-voo-ah', None, 'beginner'),
-        ('Plein', 'DUA', 'Jaze', 'ADJ', 'jah-zeh', None, 'beginner'),
-        ('Vide', 'DUA', 'Tupu', 'ADJ', 'too-poo', None, 'beginner'),
-        ('Lourd', 'DUA', 'Zito', 'ADJ', 'zee-toh', None, 'beginner'),
-        ('Léger', 'DUA', 'Rahisi', 'ADJ', 'rah-hee-see', None, 'beginner'),
-
-        ('Nouveau', 'FUL', 'Hesere', 'ADJ', 'heh-seh-reh', None, 'beginner'),
-        ('Vieux', 'FUL', 'Hayre', 'ADJ', 'hay-reh', None, 'beginner'),
-        ('Jeune', 'FUL', 'Suka', 'ADJ', 'soo-kah', None, 'beginner'),
-        ('Âgé', 'FUL', 'Hayre', 'ADJ', 'hay-reh', None, 'beginner'),
-        ('Riche', 'FUL', 'Jaajere', 'ADJ', 'jah-jeh-reh', None, 'beginner'),
-        ('Pauvre', 'FUL', 'Torere', 'ADJ', 'toh-reh-reh', None, 'beginner'),
-        ('Intelligent', 'FUL', 'Gondo', 'ADJ', 'gohn-doh', None, 'intermediate'),
-        ('Stupide', 'FUL', 'Pikko', 'ADJ', 'peek-koh', None, 'intermediate'),
-        ('Rapide', 'FUL', 'Jaawɗo', 'ADJ', 'jah-w-doh', None, 'beginner'),
-        ('Lent', 'FUL', 'Doyɗo', 'ADJ', 'doy-doh', None, 'intermediate'),
-        ('Facile', 'FUL', 'Newi', 'ADJ', 'neh-wee', None, 'beginner'),
-        ('Difficile', 'FUL', 'Tedduɗo', 'ADJ', 'teh-doo-doh', None, 'beginner'),
-        ('Propre', 'FUL', 'Laaɓɓi', 'ADJ', 'lah-bee', None, 'beginner'),
-        ('Sale', 'FUL', 'Koɗɗuɗo', 'ADJ', 'koh-doo-doh', None, 'beginner'),
-        ('Sec', 'FUL', 'Leyɗo', 'ADJ', 'ley-doh', None, 'beginner'),
-        ('Mouillé', 'FUL', 'Ndiyam', 'ADJ', 'n-dee-yahm', None, 'beginner'),
-        ('Plein', 'FUL', 'Hewtore', 'ADJ', 'hehw-toh-reh', None, 'beginner'),
-        ('Vide', 'FUL', 'Hollere', 'ADJ', 'hohl-leh-reh', None, 'beginner'),
-        ('Lourd', 'FUL', 'Tedduɗo', 'ADJ', 'teh-doo-doh', None, 'beginner'),
-        ('Léger', 'FUL', 'Newi', 'ADJ', 'neh-wee', None, 'beginner'),
-
-        # EXTENDED PHRASES AND EXPRESSIONS
-        ('Bonjour, comment allez-vous?', 'EWO', 'Mboté, osime?', 'PHR', 'mm-boh-teh, oh-see-meh', None, 'intermediate'),
-        ('Je vais bien, merci', 'EWO', 'Ma yem bot, matónda', 'PHR', 'mah yehm boht, mah-tohn-dah', None, 'intermediate'),
-        ('Et vous?', 'EWO', 'Wo osime?', 'PHR', 'woh oh-see-meh', None, 'intermediate'),
-        ('Au revoir, bonne journée', 'EWO', 'Ka ben, nga bot', 'PHR', 'kah behn, n-gah boht', None, 'intermediate'),
-        ('S''il vous plaît, aidez-moi', 'EWO', 'Ta abe, demedoo ma', 'PHR', 'tah ah-beh, deh-meh-doh mah', None, 'intermediate'),
-        ('Excusez-moi, pardon', 'EWO', 'Ma yem ve, bolimbisi', 'PHR', 'mah yehm veh, boh-leem-bee-see', None, 'intermediate'),
-        ('Je suis désolé', 'EWO', 'Ma yem ve', 'PHR', 'mah yehm veh', None, 'intermediate'),
-        ('Merci beaucoup', 'EWO', 'Matónda mingi', 'PHR', 'mah-tohn-dah meen-gee', None, 'intermediate'),
-        ('De rien', 'EWO', 'A si mbe', 'PHR', 'ah see m-beh', None, 'intermediate'),
-        ('Comment vous appelez-vous?', 'EWO', 'Wo dzəŋ osime?', 'PHR', 'woh dzuhng oh-see-meh', None, 'intermediate'),
-        ('Je m''appelle...', 'EWO', 'Ma dzəŋ...', 'PHR', 'mah dzuhng...', None, 'intermediate'),
-        ('D''où venez-vous?', 'EWO', 'Wo wa ava?', 'PHR', 'woh wah ah-vah', None, 'intermediate'),
-        ('Je viens de...', 'EWO', 'Ma wa ava...', 'PHR', 'mah wah ah-vah...', None, 'intermediate'),
-        ('Parlez-vous français?', 'EWO', 'Wo kala faransi?', 'PHR', 'woh kah-lah fah-rahn-see', None, 'intermediate'),
-        ('Oui, un peu', 'EWO', 'E, nini', 'PHR', 'eh, nee-nee', None, 'intermediate'),
-        ('Non, je ne parle pas', 'EWO', 'A si, ma si kala te', 'PHR', 'ah see, mah see kah-lah teh', None, 'intermediate'),
-        ('Pouvez-vous répéter?', 'EWO', 'Wo si kala di?', 'PHR', 'woh see kah-lah dee', None, 'intermediate'),
-        ('Plus lentement, s''il vous plaît', 'EWO', 'Mbe pia, ta abe', 'PHR', 'm-beh pee-ah, tah ah-beh', None, 'intermediate'),
-        ('Je ne comprends pas', 'EWO', 'Ma si yem te', 'PHR', 'mah see yehm teh', None, 'intermediate'),
-        ('Pouvez-vous m''aider?', 'EWO', 'Wo si demedoo ma?', 'PHR', 'woh see deh-meh-doh mah', None, 'intermediate'),
-
-        ('Bonjour, comment allez-vous?', 'DUA', 'Mbolo, boni?', 'PHR', 'mm-boh-loh, boh-nee', None, 'intermediate'),
-        ('Je vais bien, merci', 'DUA', 'Ndeye malamu, nyango', 'PHR', 'n-deh-yeh mah-lah-moo, nyahn-goh', None, 'intermediate'),
-        ('Et vous?', 'DUA', 'Wapi wewe?', 'PHR', 'wah-pee weh-weh', None, 'intermediate'),
-        ('Au revoir, bonne journée', 'DUA', 'Ka nganda, siku njema', 'PHR', 'kah n-gahn-dah, see-koo n-jeh-mah', None, 'intermediate'),
-        ('S''il vous plaît, aidez-moi', 'DUA', 'Tafadhali, nisaidie', 'PHR', 'tah-fah-dah-lee, nee-sah-ee-dee-eh', None, 'intermediate'),
-        ('Excusez-moi, pardon', 'DUA', 'Samahani, pole', 'PHR', 'sah-mah-hah-nee, poh-leh', None, 'intermediate'),
-        ('Je suis désolé', 'DUA', 'Pole', 'PHR', 'poh-leh', None, 'intermediate'),
-        ('Merci beaucoup', 'DUA', 'Asante sana', 'PHR', 'ah-sahn-teh sah-nah', None, 'intermediate'),
-        ('De rien', 'DUA', 'Hakuna matata', 'PHR', 'hah-koo-nah mah-tah-tah', None, 'intermediate'),
-        ('Comment vous appelez-vous?', 'DUA', 'Jina lako nani?', 'PHR', 'jee-nah lah-koh nah-nee', None, 'intermediate'),
-        ('Je m''appelle...', 'DUA', 'Jina langu ni...', 'PHR', 'jee-nah lahn-goo nee...', None, 'intermediate'),
-        ('D''où venez-vous?', 'DUA', 'Unatoka wapi?', 'PHR', 'oo-nah-toh-kah wah-pee', None, 'intermediate'),
-        ('Je viens de...', 'DUA', 'Ninatoka...', 'PHR', 'nee-nah-toh-kah...', None, 'intermediate'),
-        ('Parlez-vous français?', 'DUA', 'Unazungumza kifaransa?', 'PHR', 'oo-nah-zoon-goom-zah kee-fah-rahn-sah', None, 'intermediate'),
-        ('Oui, un peu', 'DUA', 'Ndio, kidogo', 'PHR', 'n-dee-oh, kee-doh-goh', None, 'intermediate'),
-        ('Non, je ne parle pas', 'DUA', 'Hapana, sizungumzi', 'PHR', 'hah-pah-nah, see-zoon-goom-zee', None, 'intermediate'),
-        ('Pouvez-vous répéter?', 'DUA', 'Unaweza kurudia?', 'PHR', 'oo-nah-weh-zah koo-roo-dee-ah', None, 'intermediate'),
-        ('Plus lentement, s''il vous plaît', 'DUA', 'Polepole tafadhali', 'PHR', 'poh-leh-poh-leh tah-fah-dah-lee', None, 'intermediate'),
-        ('Je ne comprends pas', 'DUA', 'Sielewi', 'PHR', 'see-eh-leh-wee', None, 'intermediate'),
-        ('Pouvez-vous m''aider?', 'DUA', 'Unaweza kunisaidia?', 'PHR', 'oo-nah-weh-zah koo-nee-sah-ee-dee-ah', None, 'intermediate'),
-
-        ('Bonjour, comment allez-vous?', 'FUL', 'Jam tan, no haaɗi?', 'PHR', 'jahm tahn, noh hah-dee', None, 'intermediate'),
-        ('Je vais bien, merci', 'FUL', 'Mi haaɗi, a jaaraama', 'PHR', 'mee hah-dee, ah jah-rah-mah', None, 'intermediate'),
-        ('Et vous?', 'FUL', 'Ko honɗun?', 'PHR', 'koh hohn-doon', None, 'intermediate'),
-        ('Au revoir, bonne journée', 'FUL', 'Aɗu, ñalnde moƴƴere', 'PHR', 'ah-doo, nyahl-n-deh moh-yeh-reh', None, 'intermediate'),
-        ('S''il vous plaît, aidez-moi', 'FUL', 'Tiiɗno, wallu-mi', 'PHR', 'tee-d-noh, wahl-loo-mee', None, 'intermediate'),
-        ('Excusez-moi, pardon', 'FUL', 'Aɗu, hakke', 'PHR', 'ah-doo, hahk-keh', None, 'intermediate'),
-        ('Je suis désolé', 'FUL', 'Mi yidi hakke', 'PHR', 'mee yee-dee hahk-keh', None, 'intermediate'),
-        ('Merci beaucoup', 'FUL', 'A jaaraama sanne', 'PHR', 'ah jah-rah-mah sahn-neh', None, 'intermediate'),
-        ('De rien', 'FUL', 'Alaa sifa', 'PHR', 'ah-lah see-fah', None, 'intermediate'),
-        ('Comment vous appelez-vous?', 'FUL', 'Ko honɗun innde?', 'PHR', 'koh hohn-doon een-deh', None, 'intermediate'),
-        ('Je m''appelle...', 'FUL', 'Innde am ko...', 'PHR', 'een-deh ahm koh...', None, 'intermediate'),
-        ('D''où venez-vous?', 'FUL', 'Ko honɗun iwdi?', 'PHR', 'koh hohn-doon eew-dee', None, 'intermediate'),
-        ('Je viens de...', 'FUL', 'Mi iwdi...', 'PHR', 'mee eew-dee...', None, 'intermediate'),
-        ('Parlez-vous français?', 'FUL', 'Aɗa haalugol faransi?', 'PHR', 'ah-dah hah-loo-gohl fah-rahn-see', None, 'intermediate'),
-        ('Oui, un peu', 'FUL', 'Eey, seeɗa', 'PHR', 'ey, see-dah', None, 'intermediate'),
-        ('Non, je ne parle pas', 'FUL', 'Alaa, mi haalataako', 'PHR', 'ah-lah, mee hah-lah-tah-koh', None, 'intermediate'),
-        ('Pouvez-vous répéter?', 'FUL', 'Aɗa fuɗɗaade?', 'PHR', 'ah-dah foo-dah-deh', None, 'intermediate'),
-        ('Plus lentement, s''il vous plaît', 'FUL', 'Yaawɗo tiiɗno', 'PHR', 'yah-w-doh tee-d-noh', None, 'intermediate'),
-        ('Je ne comprends pas', 'FUL', 'Mi faamaani', 'PHR', 'mee fah-mah-nee', None, 'intermediate'),
-        ('Pouvez-vous m''aider?', 'FUL', 'Aɗa wallude mi?', 'PHR', 'ah-dah wahl-loo-deh mee', None, 'intermediate'),
-    ]
+    ''', chunk_size)
+
+def insert_translations(cursor, canonical=False, chunk_size=CHUNK_SIZE, sources=None):
+    # Translations merged from the dataset and any spec files, with where each row came from
+    import cameroon_db_merge
+
+    sources = sources or [os.path.join(DATA_DIR, 'translations.json')]
+    merged, rejected = cameroon_db_merge.merged_translations(cursor, sources)
+    for row, source, position in rejected:
+        print(f"⚠️  Skipped {source}:{position}: unknown language or category in {row[:4]}")
+    
+    # Ids follow the sources' own order, as they did before the merge, unless the build is canonical
+    if canonical:
+        merged.sort(key=lambda item: canonical_order(item[0]))
+    else:
+        merged = cameroon_db_merge.source_order(merged, sources)
+    
+    # Explicit ids, so each provenance row names its translation
+    insert_chunked(cursor, 'translations', [(number, *row) for number, (row, _, _) in enumerate(merged, 1)], '''
+    INSERT INTO translations (translation_id, french_text, language_id, translation, category_id, pronunciation, usage_notes, difficulty_level)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', chunk_size)
+    cameroon_db_merge.create_provenance_table(cursor)
+    insert_chunked(cursor, 'translation_sources', [(number, source, position) for number, (_, source, position) in enumerate(merged, 1)], '''
+    INSERT INTO translation_sources (translation_id, source_file, source_position)
+    VALUES (?, ?, ?)
+    ''', chunk_size)
+
+def insert_lessons(cursor, canonical=False, chunk_size=CHUNK_SIZE):
+    lessons_data = load_dataset('lessons')
     
-    cursor.executemany('''
-    INSERT INTO translations (french_text, language_id, translation, category_id, pronunciation, usage_notes, difficulty_level)
-    VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', translations_data)
-
-def insert_lessons(cursor):
-    lessons_data = [
-        # Ewondo Lessons - Enhanced with detailed content
-        ('EWO', 'Salutations de base en Ewondo', 
-         'Découvrez les salutations essentielles utilisées dans la région du Centre au Cameroun. Le Ewondo est la langue principale des Beti-Pahuin.',
-         'beginner', 1, 'audio/ewondo/greetings.mp3', 'video/ewondo/greetings.mp4'),
-        
-        ('EWO', 'Les nombres 1-10 en Ewondo', 
-         'Maîtrisez les nombres de base en Ewondo. Comptez de 1 à 10 avec la prononciation correcte des Beti.',
-         'beginner', 2, 'audio/ewondo/numbers.mp3', 'video/ewondo/numbers.mp4'),
-        
-        ('EWO', 'La famille en Ewondo', 
-         'Apprenez les termes désignant les membres de la famille en Ewondo. Découvrez les relations familiales traditionnelles.',
-         'beginner', 3, 'audio/ewondo/family.mp3', 'video/ewondo/family.mp4'),
-        
-        ('EWO', 'La nourriture traditionnelle', 
-         'Découvrez les aliments courants et les plats traditionnels du Centre Cameroun en Ewondo.',
-         'beginner', 4, 'audio/ewondo/food.mp3', 'video/ewondo/food.mp4'),
-        
-        ('EWO', 'Le corps humain', 
-         'Les parties du corps en Ewondo. Apprenez l\'anatomie de base dans la langue des Beti.',
-         'intermediate', 5, 'audio/ewondo/body.mp3', 'video/ewondo/body.mp4'),
-        
-        ('EWO', 'Les couleurs en Ewondo', 
-         'Apprenez les couleurs de base en Ewondo avec des exemples contextuels de la vie quotidienne.',
-         'intermediate', 6, 'audio/ewondo/colors.mp3', 'video/ewondo/colors.mp4'),
-        
-        ('EWO', 'Les animaux domestiques', 
-         'Découvrez les noms des animaux de la ferme et domestiques en Ewondo.',
-         'intermediate', 7, 'audio/ewondo/animals.mp3', 'video/ewondo/animals.mp4'),
-        
-        ('EWO', 'La nature et l\'environnement', 
-         'Les éléments naturels, plantes et paysages en Ewondo de la région centrale.',
-         'intermediate', 8, 'audio/ewondo/nature.mp3', 'video/ewondo/nature.mp4'),
-        
-        ('EWO', 'Les émotions et sentiments', 
-         'Exprimez vos émotions en Ewondo. Découvrez comment communiquer vos sentiments.',
-         'advanced', 9, 'audio/ewondo/emotions.mp3', 'video/ewondo/emotions.mp4'),
-        
-        ('EWO', 'Les professions et métiers', 
-         'Découvrez les différentes professions en Ewondo et leur importance dans la société Beti.',
-         'advanced', 10, 'audio/ewondo/professions.mp3', 'video/ewondo/professions.mp4'),
-        
-        # Duala Lessons - Enhanced
-        ('DUA', 'Salutations de base en Duala', 
-         'Les salutations traditionnelles en Duala, langue historique du commerce côtier camerounais.',
-         'beginner', 1, 'audio/duala/greetings.mp3', 'video/duala/greetings.mp4'),
-        
-        ('DUA', 'Les nombres 1-10 en Duala', 
-         'Maîtrisez le système numérique en Duala, essentiel pour le commerce et les échanges.',
-         'beginner', 2, 'audio/duala/numbers.mp3', 'video/duala/numbers.mp4'),
-        
-        ('DUA', 'La famille en Duala', 
-         'Les relations familiales et les termes de parenté en Duala de la région côtière.',
-         'beginner', 3, 'audio/duala/family.mp3', 'video/duala/family.mp4'),
-        
-        ('DUA', 'La nourriture traditionnelle', 
-         'Les plats et ingrédients traditionnels du Littoral Cameroun en Duala.',
-         'beginner', 4, 'audio/duala/food.mp3', 'video/duala/food.mp4'),
-        
-        ('DUA', 'Le corps humain', 
-         'L\'anatomie et les parties du corps en Duala avec prononciation authentique.',
-         'intermediate', 5, 'audio/duala/body.mp3', 'video/duala/body.mp4'),
-        
-        ('DUA', 'Les couleurs en Duala', 
-         'Les couleurs et leurs utilisations dans la culture côtière en Duala.',
-         'intermediate', 6, 'audio/duala/colors.mp3', 'video/duala/colors.mp4'),
-        
-        ('DUA', 'Le commerce et les échanges', 
-         'Vocabulaire commercial essentiel en Duala, langue historique du commerce.',
-         'intermediate', 7, 'audio/duala/trade.mp3', 'video/duala/trade.mp4'),
-        
-        ('DUA', 'La navigation et la mer', 
-         'Termes maritimes et de navigation en Duala, langue des côtes camerounaises.',
-         'intermediate', 8, 'audio/duala/navigation.mp3', 'video/duala/navigation.mp4'),
-        
-        ('DUA', 'Les émotions et sentiments', 
-         'Exprimez vos émotions en Duala avec authenticité culturelle.',
-         'advanced', 9, 'audio/duala/emotions.mp3', 'video/duala/emotions.mp4'),
-        
-        ('DUA', 'Les arts et la musique', 
-         'Découvrez le vocabulaire des arts traditionnels et de la musique en Duala.',
-         'advanced', 10, 'audio/duala/arts.mp3', 'video/duala/arts.mp4'),
-        
-        # Fe'efe'e Lessons - Enhanced
-        ('FEF', 'Salutations de base en Fe\'efe\'e', 
-         'Les salutations traditionnelles des Bafang et de l\'Ouest Cameroun en Fe\'efe\'e.',
-         'beginner', 1, 'audio/fefee/greetings.mp3', 'video/fefee/greetings.mp4'),
-        
-        ('FEF', 'Les nombres 1-10 en Fe\'efe\'e', 
-         'Le système numérique en Fe\'efe\'e, langue des hauts plateaux de l\'Ouest.',
-         'beginner', 2, 'audio/fefee/numbers.mp3', 'video/fefee/numbers.mp4'),
-        
-        ('FEF', 'La famille en Fe\'efe\'e', 
-         'Les relations familiales complexes dans la culture Bamiléké en Fe\'efe\'e.',
-         'beginner', 3, 'audio/fefee/family.mp3', 'video/fefee/family.mp4'),
-        
-        ('FEF', 'L\'agriculture et la terre', 
-         'Vocabulaire agricole traditionnel des Bamiléké en Fe\'efe\'e.',
-         'beginner', 4, 'audio/fefee/agriculture.mp3', 'video/fefee/agriculture.mp4'),
-        
-        ('FEF', 'Le corps humain', 
-         'L\'anatomie dans la tradition Bamiléké en Fe\'efe\'e.',
-         'intermediate', 5, 'audio/fefee/body.mp3', 'video/fefee/body.mp4'),
-        
-        ('FEF', 'Les couleurs en Fe\'efe\'e', 
-         'Les couleurs et leur symbolisme dans la culture Bamiléké.',
-         'intermediate', 6, 'audio/fefee/colors.mp3', 'video/fefee/colors.mp4'),
-        
-        ('FEF', 'L\'artisanat traditionnel', 
-         'Découvrez l\'artisanat Bamiléké : poterie, tissage, sculpture en Fe\'efe\'e.',
-         'intermediate', 7, 'audio/fefee/crafts.mp3', 'video/fefee/crafts.mp4'),
-        
-        ('FEF', 'Les cérémonies et rites', 
-         'Vocabulaire des cérémonies traditionnelles Bamiléké en Fe\'efe\'e.',
-         'intermediate', 8, 'audio/fefee/ceremonies.mp3', 'video/fefee/ceremonies.mp4'),
-        
-        ('FEF', 'Les émotions et sentiments', 
-         'Expression des émotions dans la culture Bamiléké en Fe\'efe\'e.',
-         'advanced', 9, 'audio/fefee/emotions.mp3', 'video/fefee/emotions.mp4'),
-        
-        ('FEF', 'La royauté et le pouvoir', 
-         'Termes liés à la chefferie et aux structures sociales Bamiléké.',
-         'advanced', 10, 'audio/fefee/royalty.mp3', 'video/fefee/royalty.mp4'),
-        
-        # Fulfulde Lessons - Enhanced
-        ('FUL', 'Salutations de base en Fulfulde', 
-         'Les salutations nomades et pastorales en Fulfulde, langue des Peuls du Nord.',
-         'beginner', 1, 'audio/fulfulde/greetings.mp3', 'video/fulfulde/greetings.mp4'),
-        
-        ('FUL', 'Les nombres 1-10 en Fulfulde', 
-         'Le système numérique en Fulfulde, essentiel pour le commerce pastoral.',
-         'beginner', 2, 'audio/fulfulde/numbers.mp3', 'video/fulfulde/numbers.mp4'),
-        
-        ('FUL', 'La famille en Fulfulde', 
-         'Les relations familiales étendues dans la société Peule en Fulfulde.',
-         'beginner', 3, 'audio/fulfulde/family.mp3', 'video/fulfulde/family.mp4'),
-        
-        ('FUL', 'L\'élevage et le pastoralisme', 
-         'Vocabulaire essentiel de l\'élevage traditionnel Peul en Fulfulde.',
-         'beginner', 4, 'audio/fulfulde/livestock.mp3', 'video/fulfulde/livestock.mp4'),
-        
-        ('FUL', 'Le corps humain', 
-         'L\'anatomie dans la culture Peule en Fulfulde.',
-         'intermediate', 5, 'audio/fulfulde/body.mp3', 'video/fulfulde/body.mp4'),
-        
-        ('FUL', 'Les couleurs en Fulfulde', 
-         'Les couleurs et leur signification dans la culture nomade Peule.',
-         'intermediate', 6, 'audio/fulfulde/colors.mp3', 'video/fulfulde/colors.mp4'),
-        
-        ('FUL', 'La nature et les saisons', 
-         'Découvrez les saisons, la météo et l\'environnement sahélien en Fulfulde.',
-         'intermediate', 7, 'audio/fulfulde/nature.mp3', 'video/fulfulde/nature.mp4'),
-        
-        ('FUL', 'Les instruments de musique', 
-         'La musique traditionnelle Peule : hoddu, flute, tambours en Fulfulde.',
-         'intermediate', 8, 'audio/fulfulde/music.mp3', 'video/fulfulde/music.mp4'),
-        
-        ('FUL', 'Les émotions et sentiments', 
-         'Expression des émotions dans la poésie et culture Peule en Fulfulde.',
-         'advanced', 9, 'audio/fulfulde/emotions.mp3', 'video/fulfulde/emotions.mp4'),
-        
-        ('FUL', 'La poésie et l\'oralité', 
-         'Découvrez la tradition orale et poétique des Peuls en Fulfulde.',
-         'advanced', 10, 'audio/fulfulde/poetry.mp3', 'video/fulfulde/poetry.mp4'),
-        
-        # Bassa Lessons - Enhanced
-        ('BAS', 'Salutations de base en Bassa', 
-         'Les salutations traditionnelles Bassa du Centre-Littoral Cameroun.',
-         'beginner', 1, 'audio/bassa/greetings.mp3', 'video/bassa/greetings.mp4'),
-        
-        ('BAS', 'Les nombres 1-10 en Bassa', 
-         'Le système numérique en Bassa, langue des forêts équatoriales.',
-         'beginner', 2, 'audio/bassa/numbers.mp3', 'video/bassa/numbers.mp4'),
-        
-        ('BAS', 'La famille en Bassa', 
-         'Les relations familiales dans la société Bassa en Bassa.',
-         'beginner', 3, 'audio/bassa/family.mp3', 'video/bassa/family.mp4'),
-        
-        ('BAS', 'La chasse et la forêt', 
-         'Vocabulaire de la chasse traditionnelle et de la forêt équatoriale en Bassa.',
-         'beginner', 4, 'audio/bassa/hunting.mp3', 'video/bassa/hunting.mp4'),
-        
-        ('BAS', 'Le corps humain', 
-         'L\'anatomie dans la culture Bassa en Bassa.',
-         'intermediate', 5, 'audio/bassa/body.mp3', 'video/bassa/body.mp4'),
-        
-        ('BAS', 'Les couleurs en Bassa', 
-         'Les couleurs et leur symbolisme dans la culture Bassa.',
-         'intermediate', 6, 'audio/bassa/colors.mp3', 'video/bassa/colors.mp4'),
-        
-        ('BAS', 'Les plantes médicinales', 
-         'La pharmacopée traditionnelle Bassa et les plantes médicinales.',
-         'intermediate', 7, 'audio/bassa/medicinal.mp3', 'video/bassa/medicinal.mp4'),
-        
-        ('BAS', 'Les rites et cérémonies', 
-         'Vocabulaire des cérémonies traditionnelles Bassa.',
-         'intermediate', 8, 'audio/bassa/ceremonies.mp3', 'video/bassa/ceremonies.mp4'),
-        
-        ('BAS', 'Les émotions et sentiments', 
-         'Expression des émotions dans la culture Bassa.',
-         'advanced', 9, 'audio/bassa/emotions.mp3', 'video/bassa/emotions.mp4'),
-        
-        ('BAS', 'Les contes et légendes', 
-         'Découvrez l\'oralité et les contes traditionnels Bassa.',
-         'advanced', 10, 'audio/bassa/stories.mp3', 'video/bassa/stories.mp4'),
-        
-        # Bamum Lessons - Enhanced
-        ('BAM', 'Salutations de base en Bamum', 
-         'Les salutations royales et traditionnelles Bamum de l\'Ouest Cameroun.',
-         'beginner', 1, 'audio/bamum/greetings.mp3', 'video/bamum/greetings.mp4'),
-        
-        ('BAM', 'Les nombres 1-10 en Bamum', 
-         'Le système numérique Bamum, langue de l\'ancien royaume Bamum.',
-         'beginner', 2, 'audio/bamum/numbers.mp3', 'video/bamum/numbers.mp4'),
-        
-        ('BAM', 'La famille en Bamum', 
-         'Les relations familiales dans la société Bamum en Bamum.',
-         'beginner', 3, 'audio/bamum/family.mp3', 'video/bamum/family.mp4'),
-        
-        ('BAM', 'L\'agriculture Bamum', 
-         'Les techniques agricoles traditionnelles du royaume Bamum.',
-         'beginner', 4, 'audio/bamum/agriculture.mp3', 'video/bamum/agriculture.mp4'),
-        
-        ('BAM', 'Le corps humain', 
-         'L\'anatomie dans la culture royale Bamum.',
-         'intermediate', 5, 'audio/bamum/body.mp3', 'video/bamum/body.mp4'),
-        
-        ('BAM', 'Les couleurs en Bamum', 
-         'Les couleurs et leur symbolisme royal Bamum.',
-         'intermediate', 6, 'audio/bamum/colors.mp3', 'video/bamum/colors.mp4'),
-        
-        ('BAM', 'L\'écriture Bamum', 
-         'Découvrez l\'écriture syllabique inventée par le roi Njoya.',
-         'intermediate', 7, 'audio/bamum/writing.mp3', 'video/bamum/writing.mp4'),
-        
-        ('BAM', 'Les arts et sculptures', 
-         'L\'art traditionnel Bamum : masques, statues, architecture.',
-         'intermediate', 8, 'audio/bamum/arts.mp3', 'video/bamum/arts.mp4'),
-        
-        ('BAM', 'Les émotions et sentiments', 
-         'Expression des émotions dans la culture Bamum.',
-         'advanced', 9, 'audio/bamum/emotions.mp3', 'video/bamum/emotions.mp4'),
-        
-        ('BAM', 'L\'histoire et la royauté', 
-         'Découvrez l\'histoire du royaume Bamum et ses souverains.',
-         'advanced', 10, 'audio/bamum/history.mp3', 'video/bamum/history.mp4'),
-    ]
+    if canonical:
+        lessons_data.sort(key=lambda row: (row[0], row[4], canonical_order(row)))
     
-    cursor.executemany('''
+    insert_chunked(cursor, 'lessons', lessons_data, '''
     INSERT INTO lessons (language_id, title, content, level, order_index, audio_url, video_url)
     VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', lessons_data)
+    ''', chunk_size)
 
-def query_examples():
+def query_examples(database=DATABASE_FILE):
     """Example queries to test the database"""
-    conn = sqlite3.connect('cameroon_languages.db')
+    conn = connect(database)
     cursor = conn.cursor()
     
     print("\n📋 Example Queries:")
@@ -1868,13 +531,12 @@ def query_examples():
     for row in cursor.fetchall():
         print(f"  {row[0]} -> {row[1]} ({row[2]})")
     
-    # Count words per language
+    # Count words per language (trigger-maintained, one row per language)
     cursor.execute('''
-    SELECT l.language_name, COUNT(t.translation_id) as word_count
-    FROM languages l
-    LEFT JOIN translations t ON l.language_id = t.language_id
-    GROUP BY l.language_name
-    ORDER BY word_count DESC
+    SELECT l.language_name, s.word_count
+    FROM language_stats s
+    JOIN languages l ON l.language_id = s.language_id
+    ORDER BY s.word_count DESC
     ''')
     
     print("\n2. Word Count per Language:")
@@ -1883,6 +545,162 @@ def query_examples():
     
     conn.close()
 
+def validate(strict=False, database=DATABASE_FILE):
+    """Run the set-based validation checks and return the exit status"""
+    import cameroon_db_validation
+
+    conn = connect(database)
+    report = cameroon_db_validation.validate_database(conn)
+    conn.close()
+
+    print()
+    cameroon_db_validation.print_summary(report)
+    return cameroon_db_validation.exit_status(report, strict)
+
+def build_media_manifests(media_root, manifest_dir, database=DATABASE_FILE):
+    """Resolve lesson media against media_root and write prefetch manifests"""
+    import cameroon_db_media
+
+    conn = connect(database)
+    summary = cameroon_db_media.resolve_lesson_media(conn, media_root)
+    paths = cameroon_db_media.write_prefetch_manifests(conn, manifest_dir)
+    conn.close()
+
+    print(f"\n🎧 Lesson media: {summary['resolved']} resolved, {summary['missing']} missing")
+    print(f"📦 Prefetch manifests: {len(paths)} written to {manifest_dir}")
+
+def export_binary_dictionary(path, database=DATABASE_FILE):
+    """Write the memory-mappable dictionary file next to the database"""
+    import cameroon_db_binary
+
+    conn = connect(database)
+    count = cameroon_db_binary.export_binary_dictionary(conn, path)
+    conn.close()
+    print(f"\n🗂️  Binary dictionary: {count} entries written to {path}")
+
+def export_columnar(directory, database=DATABASE_FILE):
+    """Write every table as dictionary-encoded NumPy columns (needs NumPy)"""
+    import cameroon_db_columnar
+
+    conn = connect(database)
+    counts = cameroon_db_columnar.export_columnar(conn, directory)
+    conn.close()
+    print(f"\n🧮 Columnar export: {sum(counts.values())} rows in {len(counts)} tables written to {directory}")
+
+def build_store_snapshot(database=DATABASE_FILE):
+    """Write the snapshot the in-process dictionary store starts from (needs NumPy)"""
+    import cameroon_db_store
+
+    store = cameroon_db_store.open_store(database)
+    print(f"\n🧊 Store snapshot: {len(store)} entries ({store.nbytes / 2**20:.1f} MB) "
+          f"written to {database}{cameroon_db_store.SNAPSHOT_SUFFIX}")
+
+def build_similarity_index(prefix, database=DATABASE_FILE):
+    """Write the n-gram similarity index (needs NumPy)"""
+    import cameroon_db_similarity
+
+    conn = connect(database)
+    translations, vectors = cameroon_db_similarity.build_similarity_index(conn, prefix)
+    conn.close()
+    print(f"\n🧭 Similarity index: {translations} translations, {vectors} distinct French texts written to {prefix}.vectors.npy")
+
+def build_cognate_clusters(database=DATABASE_FILE):
+    """Recompute the cross-language cognate_clusters table (needs NumPy)"""
+    import cameroon_db_cognates
+
+    conn = connect(database)
+    clusters, translations = cameroon_db_cognates.build_cognate_clusters(conn.cursor())
+    conn.commit()
+    conn.close()
+    print(f"\n🔗 Cognate clusters: {clusters} clusters over {translations} translations")
+
+def watch(database=DATABASE_FILE, sources=None):
+    """Apply edits of the data and spec files to the database as they are saved, until interrupted"""
+    import cameroon_db_watch
+
+    cameroon_db_watch.watch(database, DATA_DIR, sources=sources)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the Cameroon languages SQLite database')
+    parser.add_argument('--database', default=DATABASE_FILE,
+                        help='path of the database to build')
+    parser.add_argument('--in-memory', action='store_true',
+                        help='build in memory and write the finished database to --database in one backup')
+    parser.add_argument('--validate', action='store_true',
+                        help='run the validation checks after building and exit nonzero on failure')
+    parser.add_argument('--strict', action='store_true',
+                        help='with --validate, treat warnings as failures')
+    parser.add_argument('--media-root',
+                        help='resolve lesson audio/video against this directory and write prefetch manifests')
+    parser.add_argument('--manifest-dir', default='media_manifests',
+                        help='output directory for the per-language prefetch manifests')
+    parser.add_argument('--binary-export', metavar='PATH',
+                        help='also export the memory-mappable binary dictionary to PATH')
+    parser.add_argument('--columnar-export', metavar='DIR',
+                        help='also write every table as compressed NumPy columns to DIR/<table>.npz')
+    parser.add_argument('--store-snapshot', action='store_true',
+                        help='also write the snapshot the compact in-process store loads from')
+    parser.add_argument('--similarity-index', metavar='PREFIX',
+                        help='also write the NumPy n-gram similarity index to PREFIX.*.npy')
+    parser.add_argument('--cognates', action='store_true',
+                        help='also cluster similar translations across languages into cognate_clusters (needs NumPy)')
+    parser.add_argument('--merge-spec', metavar='PATH', action='append', default=[],
+                        help='also merge the translations of this spec file (repeatable; later ones lose conflicts)')
+    parser.add_argument('--spec-first', action='store_true',
+                        help='let the --merge-spec files win conflicts over data/translations.json')
+    parser.add_argument('--watch', action='store_true',
+                        help='after building, keep applying edits of the data files to the affected languages')
+    parser.add_argument('--reproducible', action='store_true',
+                        help='byte-identical output for identical inputs; reuses the existing file when its fingerprint matches')
+    parser.add_argument('--force', action='store_true',
+                        help='with --reproducible, rebuild even if the inputs are unchanged')
+    parser.add_argument('--resume', action='store_true',
+                        help='continue an interrupted build of the same inputs from its last committed chunk')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help='source rows committed per transaction and checkpoint')
+    parser.add_argument('--profile-json', metavar='PATH',
+                        help='write per-stage build timings, row counts and sizes as JSON')
+    parser.add_argument('--profile-prometheus', metavar='PATH',
+                        help='write the same build metrics in Prometheus text format')
+    args = parser.parse_args(argv)
+
+    profiler = None
+    if args.profile_json or args.profile_prometheus:
+        import cameroon_db_profile
+
+        profiler = cameroon_db_profile.BuildProfiler(track_memory=True)
+    sources = None
+    if args.merge_spec:
+        dataset = [os.path.join(DATA_DIR, 'translations.json')]
+        sources = args.merge_spec + dataset if args.spec_first else dataset + args.merge_spec
+    built = create_database(reproducible=args.reproducible, force=args.force, profiler=profiler,
+                            resume=args.resume, chunk_size=args.chunk_size,
+                            database=args.database, in_memory=args.in_memory, sources=sources)
+    if profiler and built:
+        profiler.print_summary()
+        if args.profile_json:
+            profiler.write_json(args.profile_json)
+        if args.profile_prometheus:
+            profiler.write_prometheus(args.profile_prometheus)
+    query_examples(args.database)
+
+    if args.media_root:
+        build_media_manifests(args.media_root, args.manifest_dir, args.database)
+    if args.binary_export:
+        export_binary_dictionary(args.binary_export, args.database)
+    if args.columnar_export:
+        export_columnar(args.columnar_export, args.database)
+    if args.store_snapshot:
+        build_store_snapshot(args.database)
+    if args.similarity_index:
+        build_similarity_index(args.similarity_index, args.database)
+    if args.cognates:
+        build_cognate_clusters(args.database)
+
+    status = validate(args.strict, args.database) if args.validate else 0
+    if args.watch:
+        watch(args.database, sources)
+    return status
+
 if __name__ == "__main__":
-    create_database()
-    query_examples()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file